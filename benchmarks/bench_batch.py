@@ -0,0 +1,50 @@
+"""Benchmark of the batch registry APIs against a loop of single calls.
+
+Usage: python -m benchmarks.bench_batch [--size 5000]
+"""
+import argparse
+import time
+import warnings
+
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=5000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    print(f"{'checks':>10} {'register':>10} {'register_many':>14} {'get':>10} {'get_many':>10}")
+    for name, checks, kwargs in [("none", None, {}), ("versioning", [Versioning()], {"version": "1", "date": "-"})]:
+        objects = [object() for _ in range(args.size)]
+
+        Registry = Factory.create_registry(checks=checks)
+        start = time.perf_counter()
+        for i, obj in enumerate(objects):
+            Registry.register(f"key_{i}", **kwargs)(obj)
+        register_time = time.perf_counter() - start
+
+        BatchRegistry = Factory.create_registry(checks=checks)
+        start = time.perf_counter()
+        BatchRegistry.register_many([(f"key_{i}", obj, kwargs) for i, obj in enumerate(objects)])
+        register_many_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(args.size):
+            Registry.get(f"key_{i}", **kwargs)
+        get_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        BatchRegistry.get_many([(f"key_{i}", kwargs) for i in range(args.size)])
+        get_many_time = time.perf_counter() - start
+
+        print(
+            f"{name:>10} {register_time * 1e3:>8.2f}ms {register_many_time * 1e3:>12.2f}ms "
+            f"{get_time * 1e3:>8.2f}ms {get_many_time * 1e3:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
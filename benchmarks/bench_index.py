@@ -0,0 +1,48 @@
+"""Benchmark of HashTable lookups across table sizes.
+
+Usage: python -m benchmarks.bench_index [--max-size 1000000] [--lookups 10000]
+"""
+import argparse
+import random
+import time
+
+from registry_factory.index import HashTable
+
+
+def build_table(size: int) -> HashTable:
+    table = HashTable()
+    for i in range(size):
+        table.set(f"key_{i}", {"version": str(i % 7)}, i)
+    return table
+
+
+def time_lookups(table: HashTable, size: int, lookups: int) -> float:
+    indices = [random.randrange(size) for _ in range(lookups)]
+    requests = [(f"key_{i}", {"version": str(i % 7)}) for i in indices]
+    start = time.perf_counter()
+    for key, key_dict in requests:
+        table.get(key, key_dict)
+    return (time.perf_counter() - start) / lookups
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-size", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    size = 10
+    print(f"{'entries':>10} {'get (us)':>10} {'contains (us)':>14}")
+    while size <= args.max_size:
+        table = build_table(size)
+        get_time = time_lookups(table, size, args.lookups)
+        start = time.perf_counter()
+        for i in range(args.lookups):
+            table.contains(f"key_{i % size}", {"version": str(i % size % 7)})
+        contains_time = (time.perf_counter() - start) / args.lookups
+        print(f"{size:>10} {get_time * 1e6:>10.3f} {contains_time * 1e6:>14.3f}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
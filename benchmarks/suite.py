@@ -0,0 +1,345 @@
+"""Benchmark suite of the registration and lookup hot paths, with machine-readable results and baselines.
+
+Usage:
+    python -m benchmarks.suite [--quick] [--sizes 10 1000 ...] [--filter get/] [--output results.json]
+                               [--baseline [benchmarks/baseline.json]] [--tolerance 0.25]
+
+Each case reports the best and median time per operation over the repeats, and every repeat runs the case for at
+least 10 ms. Every repeat is preceded by a fixed reference workload, and the median ratio of the two is stored as
+the relative time. With --baseline the relative times are compared to a stored results file, benchmarks/baseline.json
+when no path is given, so the comparison holds on a machine that is slower or faster than when the baseline was
+stored. The run exits with status 1 when a case is slower than the baseline by more than the tolerance or fails
+where the baseline has a timing. Refresh the baseline by running the suite with
+--quick --output benchmarks/baseline.json on the reference machine.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import warnings
+from dataclasses import dataclass
+from statistics import median
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from registry_factory.checks.accreditation import Accreditation
+from registry_factory.checks.factory_pattern import FactoryPattern
+from registry_factory.checks.testing import Testing
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+
+SIZES = (10, 1_000, 100_000, 1_000_000)
+QUICK_SIZES = (10, 1_000)
+OBSERVER_SIZE = 1_000
+REGISTRY_COUNTS = (10, 100, 1_000)
+MAX_GETS = 10_000
+# Cases faster than this are run several times per repeat, so timer resolution and noise do not dominate.
+MIN_TIME = 0.01
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# A case returns the number of operations and a callable performing them, built fresh for every repeat.
+Case = Callable[[], Tuple[int, Callable[[], Any]]]
+
+
+class Pattern:
+    """Pattern of the FactoryPattern cases."""
+
+    def forward(self, x):
+        return x
+
+
+class Model(Pattern):
+    pass
+
+
+@dataclass
+class Arguments:
+    hidden_size: int = 8
+
+
+def _test_module(key: str, obj: Any, **kwargs) -> None:
+    assert obj is not None
+
+
+OBSERVERS: Dict[str, Tuple[Callable[[], Any], Dict[str, Any]]] = {
+    "none": (lambda: None, {}),
+    "Versioning": (lambda: Versioning(), {"version": "1.0.0", "date": "2024-01-01"}),
+    "Accreditation": (lambda: Accreditation(), {"author": "benchmark", "credit_type": "reference"}),
+    "Testing": (lambda: Testing(test_module=_test_module), {}),
+    "FactoryPattern": (lambda: FactoryPattern(factory_pattern=Pattern), {}),
+}
+
+
+def _registry(shared: bool = False, check: Optional[Any] = None) -> Any:
+    registry = Factory.create_registry(shared=shared, checks=None if check is None else [check])
+    if shared:
+        registry.mediator.hash_table.clear()
+    return registry
+
+
+def register_case(size: int, shared: bool, observer: str = "none") -> Case:
+    make_check, kwargs = OBSERVERS[observer]
+
+    def case() -> Tuple[int, Callable[[], Any]]:
+        registry = _registry(shared, make_check())
+        keys = [f"key_{i}" for i in range(size)]
+
+        def run() -> None:
+            for key in keys:
+                registry.register(key, **kwargs)(Model)
+
+        return size, run
+
+    return case
+
+
+def get_case(size: int, shared: bool, observer: str = "none") -> Case:
+    make_check, kwargs = OBSERVERS[observer]
+    state: Dict[str, Any] = {}
+
+    def case() -> Tuple[int, Callable[[], Any]]:
+        # The registry is filled once per case, lookups do not change it.
+        if "registry" not in state:
+            registry = state["registry"] = _registry(shared, make_check())
+            registry.register_many([(f"key_{i}", Model, kwargs) for i in range(size)])
+        registry = state["registry"]
+        step = max(1, size // MAX_GETS)
+        keys = [f"key_{i}" for i in range(0, size, step)][:MAX_GETS]
+
+        def run() -> None:
+            for key in keys:
+                registry.get(key, **kwargs)
+
+        return len(keys), run
+
+    return case
+
+
+def register_arguments_case(size: int) -> Case:
+    def case() -> Tuple[int, Callable[[], Any]]:
+        registry = _registry()
+        keys = [f"key_{i}" for i in range(size)]
+
+        def run() -> None:
+            for key in keys:
+                registry.register_arguments(key)(Arguments)
+
+        return size, run
+
+    return case
+
+
+def _many_registries(count: int) -> Any:
+    registries = {}
+    for i in range(count):
+        registry = Factory.create_registry()
+        registry.register_prebuilt(key="model", obj=Model)
+        registry.register_arguments(key="model")(Arguments)
+        registries[f"Registry{i}"] = registry
+    return type(f"Factory{count}", (Factory,), registries)
+
+
+def factory_case(count: int, method: str) -> Case:
+    state: Dict[str, Any] = {}
+
+    def case() -> Tuple[int, Callable[[], Any]]:
+        if "factory" not in state:
+            state["factory"] = _many_registries(count)
+        factory = state["factory"]
+        names = [f"Registry{i}" for i in range(count)]
+        # get_registries returns a cached view, so it is called as often for every count to outweigh the build.
+        calls = 1_000 if method == "get_registries" else max(1, 1_000 // count)
+        if method == "get_registries":
+
+            def run() -> None:
+                for _ in range(calls):
+                    factory.get_registries()
+
+        elif method == "get_registry_arguments":
+
+            def run() -> None:
+                for _ in range(calls):
+                    factory.get_registry_arguments(names)
+
+        else:
+            selections = [{name: "model" for name in names}] * calls
+
+            def run() -> None:
+                factory.resolve_arguments_many(selections)
+
+        return calls, run
+
+    return case
+
+
+def build_cases(sizes: Sequence[int]) -> Iterator[Tuple[str, Case]]:
+    for size in sizes:
+        for shared in (False, True):
+            scope = "shared" if shared else "unshared"
+            yield f"register/{scope}/{size}", register_case(size, shared)
+            yield f"get/{scope}/{size}", get_case(size, shared)
+        yield f"register_arguments/{size}", register_arguments_case(size)
+    for observer in OBSERVERS:
+        if observer != "none":
+            yield f"observer/{observer}/register/{OBSERVER_SIZE}", register_case(OBSERVER_SIZE, False, observer)
+            yield f"observer/{observer}/get/{OBSERVER_SIZE}", get_case(OBSERVER_SIZE, False, observer)
+    for count in REGISTRY_COUNTS:
+        yield f"factory/get_registries/{count}", factory_case(count, "get_registries")
+        yield f"factory/get_registry_arguments/{count}", factory_case(count, "get_registry_arguments")
+        yield f"factory/resolve_arguments_many/{count}", factory_case(count, "resolve_arguments_many")
+
+
+def _repeat(case: Case) -> Tuple[int, float]:
+    """Build and run a case until at least MIN_TIME seconds were spent running it, and return its number of
+    operations and the time per operation in microseconds."""
+    elapsed = 0.0
+    total_ops = ops = 0
+    gc.collect()
+    while elapsed < MIN_TIME:
+        ops, run = case()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            elapsed += time.perf_counter() - start
+        finally:
+            gc.enable()
+        total_ops += ops
+    return ops, elapsed / total_ops * 1e6
+
+
+def measure(case: Case, repeats: int, reference: Optional[Case] = None) -> Dict[str, Any]:
+    """Return the best and median time per operation of a case in microseconds, or the error it raised.
+
+    Every repeat runs the case for at least MIN_TIME seconds. As in timeit, garbage collection is disabled while
+    running, so collections caused by earlier cases do not add to the timing. With a reference case, every repeat
+    also runs the reference right before, and the median ratio of the two is returned as the relative time.
+    """
+    timings = []
+    relative = []
+    reference_timings = []
+    ops = 0
+    for _ in range(repeats):
+        try:
+            if reference is not None:
+                reference_timings.append(_repeat(reference)[1])
+            ops, timing = _repeat(case)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        timings.append(timing)
+        if reference is not None:
+            relative.append(timing / reference_timings[-1])
+    result = {"per_op_us": min(timings), "median_us": median(timings), "ops": ops, "repeats": repeats}
+    if reference is not None:
+        result["reference_us"] = median(reference_timings)
+        result["relative"] = median(relative)
+    return result
+
+
+def reference_case() -> Tuple[int, Callable[[], Any]]:
+    """Fixed pure-Python workload of dict stores, lookups and calls, timed before every repeat of a case."""
+    keys = [f"key{i}" for i in range(1_000)]
+
+    def store(table: Dict[str, int], key: str, value: int) -> None:
+        table[key] = value
+
+    def run() -> None:
+        table: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            store(table, key, i)
+        for key in keys:
+            table.get(key)
+
+    return len(keys), run
+
+
+def ratio(result: Dict[str, Any], reference: Dict[str, Any]) -> float:
+    """Return the time per operation of a result relative to the baseline.
+
+    When both were measured against the reference workload, their relative times are compared, so a machine that
+    is slower or faster than when the baseline was stored, or during part of the run, is no regression. Otherwise
+    medians are compared rather than best times, as a single fast repeat sets the best time on a noisy machine.
+    """
+    if "relative" in result and "relative" in reference:
+        return result["relative"] / reference["relative"]
+    return result.get("median_us", result["per_op_us"]) / reference.get("median_us", reference["per_op_us"])
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """Return the names of the cases that are slower than the baseline by more than the tolerance, or that raise
+    where the baseline has a timing."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None or "per_op_us" not in reference:
+            continue
+        if "per_op_us" not in result or ratio(result, reference) > 1 + tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    parser.add_argument("--quick", action="store_true", help=f"only run the sizes {QUICK_SIZES}")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--filter", default="", help="only run the cases whose name contains this string")
+    parser.add_argument("--output", default=None, help="write the results as JSON to this path")
+    parser.add_argument(
+        "--baseline", nargs="?", const=DEFAULT_BASELINE, default=None, help="compare against the results at this path"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+    warnings.simplefilter("ignore")
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    baseline = {}
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results: Dict[str, Dict] = {}
+    print(f"{'case':<48} {'median (us)':>12} {'baseline':>10} {'ratio':>7}")
+    for name, case in build_cases(sizes):
+        if args.filter not in name:
+            continue
+        result = results[name] = measure(case, args.repeats, reference_case)
+        if "error" in result:
+            print(f"{name:<48} {'error':>12}  {result['error']}")
+            continue
+        reference = baseline.get(name, {})
+        if reference.get("per_op_us"):
+            print(
+                f"{name:<48} {result['median_us']:>12.3f} {reference.get('median_us', reference['per_op_us']):>10.3f} "
+                f"{ratio(result, reference):>7.2f}"
+            )
+        else:
+            print(f"{name:<48} {result['median_us']:>12.3f}")
+
+    if args.output is not None:
+        report = {
+            "meta": {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "sizes": list(sizes),
+                "repeats": args.repeats,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.tolerance:.0%} or failed:")
+        for name in regressions:
+            print(f"  {name}" + (f" ({results[name]['error']})" if "error" in results[name] else ""))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
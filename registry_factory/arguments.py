@@ -0,0 +1,302 @@
+"""Compiled constructors that validate config dicts into registered argument dataclasses."""
+import dataclasses
+import enum
+import types
+import typing
+import warnings
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from registry_factory.utils import ArgumentValidationError, RegistrationWarning
+
+__all__ = ["ArgumentBuilder", "compile_arguments"]
+
+Converter = Callable[[Any, str, List[str]], Any]
+
+_INVALID = object()  # Returned by converters that appended an error
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))  # X | Y annotations from Python 3.10
+_TRUE = {"true", "yes", "on", "1"}
+_FALSE = {"false", "no", "off", "0"}
+
+
+def _fail(errors: List[str], path: str, expected: str, value: Any) -> Any:
+    errors.append(f"{path}: expected {expected}, got {value!r}")
+    return _INVALID
+
+
+def _convert_bool(value: Any, path: str, errors: List[str]) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in _TRUE | _FALSE:
+        return value.lower() in _TRUE
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    return _fail(errors, path, "bool", value)
+
+
+def _convert_int(value: Any, path: str, errors: List[str]) -> Any:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return _fail(errors, path, "int", value)
+
+
+def _convert_float(value: Any, path: str, errors: List[str]) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return _fail(errors, path, "float", value)
+
+
+def _convert_any(value: Any, path: str, errors: List[str]) -> Any:
+    return value
+
+
+_SCALARS: Dict[Any, Converter] = {bool: _convert_bool, int: _convert_int, float: _convert_float, Any: _convert_any}
+
+
+def _instance_converter(cls: type) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        return value if isinstance(value, cls) else _fail(errors, path, cls.__name__, value)
+
+    return convert
+
+
+def _enum_converter(cls: Any) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(value)
+        except ValueError:
+            pass
+        if isinstance(value, str) and value in cls.__members__:
+            return cls.__members__[value]
+        return _fail(errors, path, f"one of {[member.value for member in cls]}", value)
+
+    return convert
+
+
+def _literal_converter(values: Tuple) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        return value if value in values else _fail(errors, path, f"one of {list(values)}", value)
+
+    return convert
+
+
+def _exact_match(annotation: Any) -> Optional[Callable[[Any], bool]]:
+    """Return a check of values that already are of the annotated type, or None when only converting tells."""
+    if annotation is Any:
+        return lambda value: True
+    if annotation in (int, float):
+        return lambda value: isinstance(value, annotation) and not isinstance(value, bool)
+    if isinstance(annotation, type):
+        return lambda value: isinstance(value, annotation)
+    if typing.get_origin(annotation) is typing.Literal:
+        values = typing.get_args(annotation)
+        return lambda value: any(value == option and type(value) is type(option) for option in values)
+    return None
+
+
+def _union_converter(options: Tuple[Converter, ...], exact: Tuple[Callable, ...], optional: bool) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        if value is None and optional:
+            return None
+        # A value that already is one of the options is kept as is, e.g. "007" for Union[int, str].
+        if any(is_exact(value) for is_exact in exact):
+            return value
+        for option in options:
+            option_errors: List[str] = []
+            converted = option(value, path, option_errors)
+            if not option_errors:
+                return converted
+        return _fail(errors, path, expected, value)
+
+    expected = " or ".join([getattr(option, "expected", "value") for option in options] + ["None"] * optional)
+    return convert
+
+
+def _sequence_converter(item: Converter, container: type, expected: str) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        if isinstance(value, (str, bytes, Mapping)) or not isinstance(value, Iterable):
+            return _fail(errors, path, expected, value)
+        count = len(errors)
+        items = [item(element, f"{path}[{i}]", errors) for i, element in enumerate(value)]
+        return container(items) if len(errors) == count else _INVALID
+
+    return convert
+
+
+def _tuple_converter(items: Tuple[Converter, ...]) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        if isinstance(value, (str, bytes, Mapping)) or not isinstance(value, Iterable):
+            return _fail(errors, path, f"tuple of {len(items)}", value)
+        value = list(value)
+        if len(value) != len(items):
+            return _fail(errors, path, f"tuple of {len(items)}", value)
+        count = len(errors)
+        converted = tuple(item(element, f"{path}[{i}]", errors) for i, (item, element) in enumerate(zip(items, value)))
+        return converted if len(errors) == count else _INVALID
+
+    return convert
+
+
+def _dict_converter(key: Converter, item: Converter) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        if not isinstance(value, Mapping):
+            return _fail(errors, path, "mapping", value)
+        count = len(errors)
+        converted = {key(k, f"{path}.{k}", errors): item(v, f"{path}.{k}", errors) for k, v in value.items()}
+        return converted if len(errors) == count else _INVALID
+
+    return convert
+
+
+def _dataclass_converter(cls: type) -> Converter:
+    def convert(value: Any, path: str, errors: List[str]) -> Any:
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, Mapping):
+            return _fail(errors, path, cls.__name__, value)
+        return compile_arguments(cls).convert(value, path, errors)
+
+    return convert
+
+
+def _converter(annotation: Any) -> Converter:
+    """Return the converter of a type annotation, resolved once when a dataclass is compiled."""
+    if annotation in _SCALARS:
+        converter = _SCALARS[annotation]
+    elif dataclasses.is_dataclass(annotation) and isinstance(annotation, type):
+        converter = _dataclass_converter(annotation)
+    elif isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        converter = _enum_converter(annotation)
+    elif isinstance(annotation, type):
+        converter = _instance_converter(annotation)
+    else:
+        origin, arguments = typing.get_origin(annotation), typing.get_args(annotation)
+        if origin in _UNION_TYPES:
+            arguments = tuple(argument for argument in arguments if argument is not type(None))
+            exact = tuple(filter(None, (_exact_match(argument) for argument in arguments)))
+            options = tuple(_converter(argument) for argument in arguments)
+            converter = _union_converter(options, exact, optional=type(None) in typing.get_args(annotation))
+        elif origin is typing.Literal:
+            converter = _literal_converter(arguments)
+        elif origin in (list, set, frozenset):
+            converter = _sequence_converter(_converter(arguments[0] if arguments else Any), origin, origin.__name__)
+        elif origin is tuple:
+            if len(arguments) == 2 and arguments[1] is Ellipsis:
+                converter = _sequence_converter(_converter(arguments[0]), tuple, "tuple")
+            elif arguments:
+                converter = _tuple_converter(tuple(_converter(argument) for argument in arguments))
+            else:
+                converter = _sequence_converter(_convert_any, tuple, "tuple")
+        elif origin is dict:
+            key, item = arguments if arguments else (Any, Any)
+            converter = _dict_converter(_converter(key), _converter(item))
+        else:  # Unresolved forward references and other typing constructs are not checked.
+            converter = _convert_any
+    converter.expected = getattr(annotation, "__name__", str(annotation))  # type: ignore[attr-defined]
+    return converter
+
+
+class ArgumentBuilder:
+    """Constructor of a dataclass from config dicts.
+
+    The field names, required fields and converters are compiled once from the type hints. Values are coerced
+    where unambiguous (e.g. "3" for an int), nested dataclasses are built from nested dicts, and all errors of
+    a config are collected before raising.
+    """
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        self.fields: Dict[str, Converter] = {}
+        self.required: Tuple[str, ...] = ()
+
+    def _field_hint(self, field: dataclasses.Field) -> Any:
+        """Resolve the annotation of one field, so an unresolvable field does not stop the others from validating."""
+        owner = next(base for base in self.cls.__mro__ if field.name in base.__dict__.get("__annotations__", {}))
+        stub = type(owner.__name__, (), {"__annotations__": {field.name: field.type}, "__module__": owner.__module__})
+        try:
+            return typing.get_type_hints(stub, localns={self.cls.__name__: self.cls, owner.__name__: owner})[field.name]
+        except Exception as e:  # e.g. forward references to local classes
+            warnings.warn(
+                RegistrationWarning(
+                    f"{self.cls.__name__}.{field.name}: the annotation {field.type!r} cannot be resolved ({e!r}), "
+                    "its values are not validated."
+                )
+            )
+            return Any
+
+    def compile(self) -> None:
+        required = []
+        for field in dataclasses.fields(self.cls):
+            if not field.init:
+                continue
+            self.fields[field.name] = _converter(self._field_hint(field))
+            if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING:
+                required.append(field.name)
+        self.required = tuple(required)
+
+    def convert(self, config: Mapping[str, Any], path: str, errors: List[str]) -> Any:
+        count = len(errors)
+        kwargs = {}
+        fields = self.fields
+        for name, value in config.items():
+            converter = fields.get(name)
+            if converter is None:
+                errors.append(f"{path}.{name}: unknown field of {self.cls.__name__}")
+                continue
+            kwargs[name] = converter(value, f"{path}.{name}", errors)
+        for name in self.required:
+            if name not in config:
+                errors.append(f"{path}.{name}: missing required field of {self.cls.__name__}")
+        if len(errors) > count:
+            return _INVALID
+        try:
+            return self.cls(**kwargs)
+        except Exception as e:
+            errors.append(f"{path}: {self.cls.__name__} rejected the config: {e}")
+            return _INVALID
+
+    def build(self, config: Mapping[str, Any]) -> Any:
+        """Return the dataclass instance of a config dict, raising all its errors at once."""
+        errors: List[str] = []
+        instance = self.convert(config, self.cls.__name__, errors)
+        if errors:
+            raise ArgumentValidationError(errors)
+        return instance
+
+    def build_many(self, configs: Iterable[Mapping[str, Any]]) -> List[Any]:
+        """Return the dataclass instances of a batch of config dicts, raising the errors of all of them at once."""
+        errors: List[str] = []
+        instances = [self.convert(config, f"[{i}]", errors) for i, config in enumerate(configs)]
+        if errors:
+            raise ArgumentValidationError(errors)
+        return instances
+
+
+_builders: "weakref.WeakKeyDictionary[type, ArgumentBuilder]" = weakref.WeakKeyDictionary()
+
+
+def compile_arguments(cls: type) -> ArgumentBuilder:
+    """Return the builder of an argument dataclass, compiling it on first use."""
+    builder = _builders.get(cls)
+    if builder is None:
+        builder = _builders[cls] = ArgumentBuilder(cls)
+        try:
+            builder.compile()  # Registered before compiling, so recursive dataclasses resolve to it.
+        except Exception:
+            del _builders[cls]
+            raise
+    return builder
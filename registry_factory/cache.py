@@ -0,0 +1,45 @@
+"""Resolution cache for registry lookups."""
+from typing import Any, Dict, Hashable, Optional
+
+from registry_factory.tools import freeze
+
+__all__ = ["ResolutionCache"]
+
+
+class ResolutionCache:
+    """Memoizes resolved lookups, invalidated whenever the hash table generation changes."""
+
+    entries: Dict[Hashable, Any]
+
+    def __init__(self) -> None:
+        self.entries = {}
+        self.generation = -1
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(key: str, kwargs: Dict) -> Hashable:
+        return (key, freeze(kwargs))
+
+    def get(self, cache_key: Hashable, generation: int) -> Optional[Any]:
+        if generation != self.generation:
+            self.entries.clear()
+            self.generation = generation
+        result = self.entries.get(cache_key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def set(self, cache_key: Hashable, generation: int, result: Any) -> None:
+        if generation == self.generation:
+            self.entries[cache_key] = result
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
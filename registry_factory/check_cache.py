@@ -0,0 +1,229 @@
+"""On-disk cache of check results, keyed by a fingerprint of the checked code."""
+import builtins
+import collections
+import hashlib
+import json
+import os
+import sys
+import threading
+import warnings
+from enum import Enum
+from types import (
+    BuiltinFunctionType,
+    CodeType,
+    DynamicClassAttribute,
+    FunctionType,
+    MemberDescriptorType,
+    MethodType,
+    ModuleType,
+)
+from typing import Any, Dict, Optional, Set
+
+from registry_factory.discovery import default_cache_dir
+from registry_factory.utils import RegistrationWarning
+
+__all__ = ["CheckResultCache", "fingerprint"]
+
+_LITERALS = (str, bytes, int, float, complex, bool, type(None))
+# Class attributes that are set up by Python from the rest of the class body rather than written in it.
+_INTERNAL = ("__dict__", "__weakref__", "__module__", "__qualname__", "__doc__", "_abc_impl")
+# Descriptors of __slots__ and named tuple fields, which are fingerprinted through __slots__ and _fields.
+_FIELDS = (MemberDescriptorType, type(collections.namedtuple("_", "field").field))
+
+
+def _update_code(digest: Any, code: CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr((code.co_argcount, code.co_kwonlyargcount, code.co_flags)).encode())
+    digest.update(repr((code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars)).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _code_names(code: CodeType) -> Set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _update_function(digest: Any, function: FunctionType, seen: set) -> bool:
+    digest.update(f"function:{function.__module__}.{function.__qualname__}\0".encode())
+    if function in seen:
+        return True
+    seen.add(function)
+    _update_code(digest, function.__code__)
+    if not _update_value(digest, function.__defaults__ or (), seen):
+        return False
+    if not _update_value(digest, tuple(sorted((function.__kwdefaults__ or {}).items())), seen):
+        return False
+    for cell in function.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:  # Not yet assigned.
+            digest.update(b"empty cell\0")
+            continue
+        if not _update_value(digest, contents, seen):
+            return False
+    # Globals the code refers to, so editing a helper invalidates its callers. Names that are not globals
+    # are attributes or builtins.
+    for name in sorted(_code_names(function.__code__)):
+        if name not in function.__globals__:
+            continue
+        digest.update(f"global:{name}\0".encode())
+        if not _update_value(digest, function.__globals__[name], seen):
+            return False
+    return True
+
+
+def _update_value(digest: Any, value: Any, seen: set) -> bool:
+    if isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+    if isinstance(value, (property, DynamicClassAttribute)):
+        return all(_update_value(digest, part, seen) for part in (value.fget, value.fset, value.fdel))
+    if isinstance(value, MethodType):
+        value = value.__func__
+    if isinstance(value, FunctionType):
+        return _update_function(digest, value, seen)
+    if isinstance(value, type):
+        return _update_class(digest, value, seen)
+    if isinstance(value, (ModuleType, BuiltinFunctionType)):
+        # Installed modules and builtins are not fingerprinted, like builtin classes.
+        digest.update(f"{type(value).__name__}:{getattr(value, '__module__', '')}.{value.__name__}\0".encode())
+        return True
+    if isinstance(value, _LITERALS):
+        digest.update(f"{type(value).__name__}:{value!r}\0".encode())
+        return True
+    if isinstance(value, Enum):
+        digest.update(f"{type(value).__module__}.{type(value).__qualname__}.{value.name}\0".encode())
+        return _update_value(digest, value.value, seen)
+    if isinstance(value, (tuple, list)):
+        digest.update(f"{type(value).__name__}:{len(value)}\0".encode())
+        return all(_update_value(digest, item, seen) for item in value)
+    if isinstance(value, (set, frozenset)):
+        # Sorted by representation, so the order of iteration does not change the fingerprint.
+        digest.update(f"{type(value).__name__}:{len(value)}\0".encode())
+        return all(_update_value(digest, item, seen) for item in sorted(value, key=repr))
+    if isinstance(value, dict):
+        digest.update(f"dict:{len(value)}\0".encode())
+        return all(
+            _update_value(digest, key, seen) and _update_value(digest, item, seen)
+            for key, item in sorted(value.items(), key=lambda pair: repr(pair[0]))
+        )
+    return False
+
+
+def _update_class(digest: Any, cls: type, seen: set) -> bool:
+    digest.update(f"class:{cls.__module__}.{cls.__qualname__}\0".encode())
+    if cls in seen or getattr(builtins, cls.__name__, None) is cls:
+        return True
+    seen.add(cls)
+    for base in cls.__bases__:
+        if not _update_class(digest, base, seen):
+            return False
+    for name, value in sorted(cls.__dict__.items(), key=lambda item: item[0]):
+        if name in _INTERNAL:
+            continue
+        digest.update(f"{name}\0".encode())
+        if name == "__annotations__":
+            # Annotations are compared by pattern checks but need not be classes, so their text is used.
+            digest.update(repr(sorted((key, repr(hint)) for key, hint in value.items())).encode())
+        elif name == "__orig_bases__":
+            digest.update(repr(value).encode())
+        elif isinstance(value, _FIELDS):
+            continue
+        elif not _update_value(digest, value, seen):
+            # Any other attribute, such as an instance of a user class, may change the behaviour of the class.
+            return False
+    return True
+
+
+def fingerprint(obj: Any) -> Optional[str]:
+    """Return a hash of the bytecode of a function or class and its bases, or of a (tuple of) literal value(s).
+
+    Functions include their defaults, closure cells and the globals their code refers to, recursively.
+    Returns None for objects whose behaviour cannot be derived from their code, which are never cached.
+    """
+    digest = hashlib.sha256(sys.implementation.cache_tag.encode())
+    if not _update_value(digest, obj, set()):
+        return None
+    return digest.hexdigest()
+
+
+class CheckResultCache:
+    """On-disk cache of check results.
+
+    Entries are keyed by the identity and version of the check together with the fingerprints of the checked
+    object and of the check's own module or pattern, so editing either invalidates the entry.
+    Results are appended to a log, so registering does not rewrite the file; later lines take precedence and
+    the log is compacted on load once stale lines make up most of it.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self.path = os.path.join(self.cache_dir, "checks.jsonl")
+        self.lock = threading.Lock()
+        self._results: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def make_key(check: str, *parts: Any) -> Optional[str]:
+        """Return the cache key of a check over the given objects, or None when one cannot be fingerprinted."""
+        fingerprints = [fingerprint(part) for part in parts]
+        if any(part is None for part in fingerprints):
+            return None
+        return hashlib.sha256("\0".join([check, *fingerprints]).encode()).hexdigest()  # type: ignore[list-item]
+
+    def _load(self) -> Dict[str, Any]:
+        if self._results is not None:
+            return self._results
+        results: Dict[str, Any] = {}
+        lines = 0
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        cache_key, result = json.loads(line)
+                    except ValueError:  # A line cut short by a concurrent or interrupted write.
+                        continue
+                    results[cache_key] = result
+        except OSError:
+            pass
+        self._results = results
+        if lines > 2 * len(results) + 64:
+            self._compact(results)
+        return results
+
+    def _compact(self, results: Dict[str, Any]) -> None:
+        try:
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.writelines(f"{json.dumps([cache_key, result])}\n" for cache_key, result in results.items())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            warnings.warn(RegistrationWarning(f"Could not compact the check result cache: {e}"))
+
+    def get(self, cache_key: str) -> Optional[Any]:
+        with self.lock:
+            return self._load().get(cache_key)
+
+    def set(self, cache_key: str, result: Any) -> None:
+        with self.lock:
+            self._load()[cache_key] = result
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(self.path, "a") as f:
+                    f.write(f"{json.dumps([cache_key, result])}\n")
+            except OSError as e:
+                warnings.warn(RegistrationWarning(f"Could not write the check result cache: {e}"))
+
+    def clear(self) -> None:
+        with self.lock:
+            self._results = {}
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
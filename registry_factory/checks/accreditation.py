@@ -29,5 +29,13 @@ class CreditFields:
 
 
 class Accreditation(MetaInformationObserver):
-    def __init__(self, credit_fields: Any = CreditFields, key_list: List = [], forced: bool = False):
-        super().__init__(meta_fields=credit_fields, key_parameters=key_list, forced=forced)
+    def __init__(
+        self,
+        credit_fields: Any = CreditFields,
+        key_list: List = [],
+        forced: bool = False,
+        call_validation: str = "always",
+    ):
+        super().__init__(
+            meta_fields=credit_fields, key_parameters=key_list, forced=forced, call_validation=call_validation
+        )
@@ -1,24 +1,232 @@
+import builtins
+import inspect
+import sys
 import warnings
+import weakref
 from types import FunctionType
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+from registry_factory.check_cache import CheckResultCache
 from registry_factory.patterns.observer import RegistryObserver
 
+_MISSING = object()
+_EMPTY = inspect.Parameter.empty
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class Member(NamedTuple):
+    """A member required by a class pattern, with its call signature through an instance if callable."""
+
+    name: str
+    kind: str
+    signature: Optional[inspect.Signature]
+
+
+def _call_signature(value: Any) -> Tuple[str, Optional[inspect.Signature]]:
+    """Return the kind of a raw class attribute and its call signature through an instance."""
+    if isinstance(value, property):
+        return "property", None
+    if isinstance(value, staticmethod):
+        return "staticmethod", _signature(value.__func__, bound=False)
+    if isinstance(value, classmethod):
+        return "classmethod", _signature(value.__func__, bound=True)
+    if isinstance(value, FunctionType):
+        return "method", _signature(value, bound=True)
+    if callable(value) and not isinstance(value, type):
+        return "callable", _signature(value, bound=False)
+    return "attribute", None
+
+
+def _resolve_annotation(annotation: Any, namespace: Dict[str, Any]) -> Any:
+    """Return the value of a string annotation, as written under postponed evaluation, or empty if unresolvable."""
+    if not isinstance(annotation, str):
+        return annotation
+    try:
+        return eval(annotation, namespace)  # As inspect.signature(eval_str=True) does from Python 3.10.
+    except Exception:
+        return _EMPTY
+
+
+def _signature(func: Any, bound: bool) -> Optional[inspect.Signature]:
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+    # Annotations are resolved one by one, so a single unresolvable hint only skips its own comparison.
+    namespace = getattr(inspect.unwrap(func), "__globals__", None)
+    if namespace is None:
+        namespace = vars(sys.modules.get(getattr(func, "__module__", None) or "", builtins))
+    signature = signature.replace(
+        parameters=[
+            parameter.replace(annotation=_resolve_annotation(parameter.annotation, namespace))
+            for parameter in signature.parameters.values()
+        ],
+        return_annotation=_resolve_annotation(signature.return_annotation, namespace),
+    )
+    if bound:
+        parameters = list(signature.parameters.values())
+        if parameters and parameters[0].kind in _POSITIONAL:
+            signature = signature.replace(parameters=parameters[1:])
+    return signature
+
+
+def _same_annotation(expected: Any, actual: Any) -> bool:
+    return expected is _EMPTY or actual is _EMPTY or expected == actual
+
+
+def compatible(expected: inspect.Signature, actual: inspect.Signature) -> bool:
+    """Return whether a callable with the actual signature accepts every call the expected signature accepts.
+
+    Parameters that are annotated on both sides must have equal annotations, as must the return annotations.
+    Signatures built by this module have string annotations resolved, and hints that cannot be resolved left empty.
+    """
+    if not _same_annotation(expected.return_annotation, actual.return_annotation):
+        return False
+    actual_parameters = list(actual.parameters.values())
+    actual_positional = [parameter for parameter in actual_parameters if parameter.kind in _POSITIONAL]
+    actual_named = {
+        parameter.name: parameter
+        for parameter in actual_parameters
+        if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    }
+    var_positional = any(parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in actual_parameters)
+    var_keyword = any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in actual_parameters)
+
+    matched = set()
+    position = 0
+    for parameter in expected.parameters.values():
+        if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            if not var_positional:
+                return False
+            continue
+        if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+            if not var_keyword:
+                return False
+            continue
+        if parameter.kind in _POSITIONAL:
+            if position < len(actual_positional):
+                candidate = actual_positional[position]
+                if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD and (
+                    candidate.kind != parameter.kind or candidate.name != parameter.name
+                ):
+                    return False
+            elif var_positional and (parameter.kind == inspect.Parameter.POSITIONAL_ONLY or var_keyword):
+                candidate = None
+            else:
+                return False
+            position += 1
+        else:
+            candidate = actual_named.get(parameter.name)
+            if candidate is None and not var_keyword:
+                return False
+        if candidate is not None:
+            if parameter.default is not _EMPTY and candidate.default is _EMPTY:
+                return False
+            if not _same_annotation(parameter.annotation, candidate.annotation):
+                return False
+            matched.add(candidate.name)
+
+    # Any required parameter the expected signature never fills would fail every call.
+    return all(
+        parameter.name in matched
+        or parameter.default is not _EMPTY
+        or parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        for parameter in actual_parameters
+    )
+
+
+class CompiledPattern:
+    """The required members of a pattern with their kinds and signatures, and the verdicts per checked object.
+
+    Compiled patterns are shared between all FactoryPattern observers of the same pattern, and hold no reference
+    to the pattern so they can be cached weakly by it.
+    """
+
+    def __init__(self, pattern: Any) -> None:
+        self.class_pattern = not isinstance(pattern, FunctionType)
+        self.members: List[Member] = []
+        self.signature: Optional[inspect.Signature] = None
+        if self.class_pattern:
+            for name in dir(pattern):
+                if name.startswith("__"):
+                    continue
+                kind, signature = _call_signature(inspect.getattr_static(pattern, name))
+                self.members.append(Member(name, kind, signature))
+        else:
+            self.signature = _signature(pattern, bound=False)
+        self.verdicts: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+    def cached(self, obj: Any) -> Optional[bool]:
+        try:
+            return self.verdicts.get(obj)
+        except TypeError:  # Not weakly referenceable or not hashable
+            return None
+
+    def remember(self, obj: Any, verdict: bool) -> None:
+        try:
+            self.verdicts[obj] = verdict
+        except TypeError:
+            pass
+
+    def match_function(self, obj: Any) -> bool:
+        if not isinstance(obj, FunctionType):
+            return False
+        signature = _signature(obj, bound=False)
+        if self.signature is None or signature is None:
+            return True
+        return compatible(self.signature, signature)
+
+    def match_members(self, obj: type) -> bool:
+        for member in self.members:
+            value = inspect.getattr_static(obj, member.name, _MISSING)
+            if value is _MISSING:
+                return False
+            if member.signature is None:
+                continue
+            kind, signature = _call_signature(value)
+            if kind in ("property", "attribute"):
+                return False
+            if signature is not None and not compatible(member.signature, signature):
+                return False
+        return True
+
+
+_compiled_patterns: "weakref.WeakKeyDictionary[Any, CompiledPattern]" = weakref.WeakKeyDictionary()
+
+
+def compile_pattern(pattern: Any) -> CompiledPattern:
+    """Return the compiled form of a pattern, compiling it on first use."""
+    try:
+        compiled = _compiled_patterns.get(pattern)
+    except TypeError:
+        return CompiledPattern(pattern)
+    if compiled is None:
+        compiled = _compiled_patterns[pattern] = CompiledPattern(pattern)
+    return compiled
+
 
 class FactoryPattern(RegistryObserver):
-    """An instance factory pattern observer."""
+    """An instance factory pattern observer.
+
+    The pattern is compiled once into its required members, their kinds and call signatures. Objects conform
+    when they subclass the pattern, or when they provide every member with a compatible signature. Verdicts are
+    cached per (pattern, object) for as long as the object lives.
+    With a result_cache, results are reused across processes until the object or the pattern changes.
+    """
+
+    passive_call = True
+    check_version = 2
 
-    def __init__(self, factory_pattern: Any, forced: bool = False):
+    def __init__(self, factory_pattern: Any, forced: bool = False, result_cache: Optional[CheckResultCache] = None):
         super().__init__()
         self.forced = forced
         self.factory_pattern = factory_pattern
-        if isinstance(self.factory_pattern, FunctionType):
-            self.class_pattern = False
-        else:
-            self.class_pattern = True
+        self.result_cache = result_cache
+        self.compiled = compile_pattern(factory_pattern)
+        self.class_pattern = self.compiled.class_pattern
 
     def register_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
-        if not self._match_pattern(obj):
+        if not self._cached_match(obj):
             if self.forced:
                 raise TypeError("Object must be a subclass of the factory pattern.")
             else:
@@ -31,23 +239,30 @@ class FactoryPattern(RegistryObserver):
     def call_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
         return (key, {}, obj, None)
 
+    def _cached_match(self, obj: Any) -> bool:
+        correct_pattern = self.compiled.cached(obj)
+        if correct_pattern is not None:
+            return correct_pattern
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(self.check_id, self.factory_pattern, obj)
+            correct_pattern = self.result_cache.get(cache_key) if cache_key is not None else None
+        if correct_pattern is None:
+            correct_pattern = self._match_pattern(obj)
+            if cache_key is not None:
+                self.result_cache.set(cache_key, correct_pattern)  # type: ignore[union-attr]
+        self.compiled.remember(obj, correct_pattern)
+        return correct_pattern
+
     def _match_pattern(self, obj: Any) -> bool:
         # function pattern
-        if isinstance(obj, FunctionType) and self.class_pattern is False:
-            return obj.__annotations__ == self.factory_pattern.__annotations__
+        if not self.class_pattern:
+            return self.compiled.match_function(obj)
 
         # class pattern
-        if isinstance(type(obj), self.factory_pattern) or type(obj) == type:
-            if issubclass(self.factory_pattern, obj):
-                return True
-            elif issubclass(obj, self.factory_pattern):
+        if isinstance(obj, type):
+            if issubclass(self.factory_pattern, obj) or issubclass(obj, self.factory_pattern):
                 return True
-            elif all(
-                hasattr(obj, func)
-                for func in [func for func in dir(self.factory_pattern) if not func.startswith("__")]
-            ):
-                return True
-            else:
-                return False
+            return self.compiled.match_members(obj)
 
         return False
@@ -1,28 +1,76 @@
 import warnings
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Any, Callable, Dict, Optional, Tuple
 
-from registry_factory.patterns.observer import RegistryObserver
+from registry_factory.check_cache import CheckResultCache
+from registry_factory.patterns.observer import PendingResult, RegistryObserver
+
+
+def _run_test(test_module: Callable, key: str, obj: Any, kwargs: Dict) -> bool:
+    try:
+        test_module(key, obj, **kwargs)
+    except Exception:
+        return False
+    return True
 
 
 class Testing(RegistryObserver):
-    """A testing observer."""
+    """A testing observer.
+
+    With asynchronous=True the test module runs in an executor (a thread pool unless one is given) and
+    passed_test holds a PendingResult until the registry resolves the entry or waits on its checks.
+    With a result_cache, results are reused across processes until the object or the test module changes.
+    """
+
+    passive_call = True
 
-    def __init__(self, test_module: Callable, forced: bool = False):
+    def __init__(
+        self,
+        test_module: Callable,
+        forced: bool = False,
+        asynchronous: bool = False,
+        executor: Optional[Executor] = None,
+        result_cache: Optional[CheckResultCache] = None,
+    ):
         super().__init__()
         self.forced = forced
         self.test_module = test_module
+        self.asynchronous = asynchronous
+        self.executor = executor
+        self.result_cache = result_cache
 
     def register_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
-        try:
-            self.test_module(key, obj, **kwargs)
-            passed_test = True
-        except Exception:
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(
+                self.check_id, self.test_module, key, obj, tuple(sorted(kwargs.items()))
+            )
+            passed_test = self.result_cache.get(cache_key) if cache_key is not None else None
+            if passed_test is not None:
+                return (key, {}, obj, {"passed_test": self._verdict(passed_test)})
+
+        if self.asynchronous:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(thread_name_prefix="registry-testing")
+            future = self.executor.submit(_run_test, self.test_module, key, obj, kwargs)
+            if cache_key is not None:
+                future.add_done_callback(lambda done: self._store(cache_key, done.result()))
+            return (key, {}, obj, {"passed_test": PendingResult(future, self._verdict)})
+        passed_test = _run_test(self.test_module, key, obj, kwargs)
+        if cache_key is not None:
+            self._store(cache_key, passed_test)
+        return (key, {}, obj, {"passed_test": self._verdict(passed_test)})
+
+    def _store(self, cache_key: str, passed_test: bool) -> None:
+        self.result_cache.set(cache_key, passed_test)  # type: ignore[union-attr]
+
+    def _verdict(self, passed_test: bool) -> bool:
+        if not passed_test:
             if self.forced:
                 raise AssertionError("Object must pass the test module.")
             else:
                 warnings.warn("Object must pass the test module.")
-                passed_test = False
-        return (key, {}, obj, {"passed_test": passed_test})
+        return passed_test
 
     def call_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
         return (key, {}, obj, None)
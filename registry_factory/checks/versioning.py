@@ -1,8 +1,96 @@
+import re
+import sys
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, Callable, List, NamedTuple, Tuple
 
 from registry_factory.patterns.observer import MetaInformationObserver
 
+_VERSION = re.compile(
+    r"""
+    v?(?:(?P<epoch>\d+)!)?(?P<release>\d+(?:\.\d+)*)
+    (?:[-_.]?(?P<pre_label>alpha|a|beta|b|preview|pre|c|rc)[-_.]?(?P<pre>\d+)?)?
+    (?:-(?P<post_implicit>\d+)|[-_.]?(?P<post_label>post|rev|r)[-_.]?(?P<post>\d+)?)?
+    (?:[-_.]?(?P<dev_label>dev)[-_.]?(?P<dev>\d+)?)?
+    (?:\+(?P<local>[a-z0-9]+(?:[-_.][a-z0-9]+)*))?
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+_RELEASE = re.compile(r"[vV]?(\d+(?:\.\d+)*)?(.*)")
+_SUFFIX_TOKEN = re.compile(r"\d+|[a-zA-Z]+")
+_PRE_LABELS = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+
+# Sort positions of the pre-release segment: below every release, dev-only releases, a, b, rc and final.
+_PRE_FLOOR = (-2, 0)
+_PRE_DEV = (-1, 0)
+_PRE_FINAL = (3, 0)
+_NO_DEV = (1, 0)
+
+
+def _tokens(text: str) -> Tuple:
+    return tuple(
+        (1, int(token), "") if token.isdigit() else (0, 0, token.lower()) for token in _SUFFIX_TOKEN.findall(text)
+    )
+
+
+def _strip_zeros(numbers: List[int]) -> Tuple[int, ...]:
+    while numbers and numbers[-1] == 0:
+        numbers.pop()
+    return tuple(numbers)
+
+
+class VersionKey(NamedTuple):
+    """PEP 440 sort key of a version: epoch, release, pre-release, post-release, development release, local."""
+
+    epoch: int
+    release: Tuple[int, ...]
+    pre: Tuple[int, int]
+    post: int
+    dev: Tuple[int, int]
+    local: Tuple
+
+    @property
+    def is_prerelease(self) -> bool:
+        return self.pre != _PRE_FINAL or self.dev != _NO_DEV
+
+    @property
+    def is_postrelease(self) -> bool:
+        return self.post >= 0
+
+    def floor(self) -> "VersionKey":
+        """Return a key below every pre-, post- and development release of this release."""
+        return self._replace(pre=_PRE_FLOOR, post=-1, dev=(0, -1), local=())
+
+    def ceiling(self) -> "VersionKey":
+        """Return a key above every post-release and local version of this version."""
+        return self._replace(post=sys.maxsize, dev=_NO_DEV, local=((2, 0, ""),))
+
+
+def parse_version(version: str) -> VersionKey:
+    """PEP 440 sort key: numeric parts compare as numbers, and dev releases sort before alpha, beta and release
+    candidates, which sort before the release. Versions that are not PEP 440 sort before all that are."""
+    match = _VERSION.fullmatch(str(version).strip())
+    if match is None:
+        release, suffix = _RELEASE.fullmatch(str(version)).groups()  # type: ignore[union-attr]
+        numbers = [int(part) for part in release.split(".")] if release else []
+        return VersionKey(-1, _strip_zeros(numbers), _PRE_FINAL, -1, _NO_DEV, _tokens(suffix))
+    numbers = [int(part) for part in match["release"].split(".")]
+    post = match["post_implicit"] or match["post"]
+    has_post = match["post_implicit"] is not None or match["post_label"] is not None
+    if match["pre_label"] is not None:
+        pre = (_PRE_LABELS[match["pre_label"].lower()], int(match["pre"] or 0))
+    elif match["dev_label"] is not None and not has_post:
+        pre = _PRE_DEV
+    else:
+        pre = _PRE_FINAL
+    return VersionKey(
+        int(match["epoch"] or 0),
+        _strip_zeros(numbers),
+        pre,
+        int(post or 0) if has_post else -1,
+        (0, int(match["dev"] or 0)) if match["dev_label"] is not None else _NO_DEV,
+        _tokens(match["local"] or ""),
+    )
+
 
 @dataclass
 class VersioningFields:
@@ -11,5 +99,17 @@ class VersioningFields:
 
 
 class Versioning(MetaInformationObserver):
-    def __init__(self, version_fields: Any = VersioningFields, key_list: List = ["version"], forced: bool = False):
-        super().__init__(meta_fields=version_fields, key_parameters=key_list, forced=forced)
+    def __init__(
+        self,
+        version_fields: Any = VersioningFields,
+        key_list: List = ["version"],
+        forced: bool = False,
+        version_field: str = "version",
+        version_key: Callable[[str], Any] = parse_version,
+        call_validation: str = "always",
+    ):
+        super().__init__(
+            meta_fields=version_fields, key_parameters=key_list, forced=forced, call_validation=call_validation
+        )
+        self.version_field = version_field if version_field in key_list else None
+        self.version_key = version_key
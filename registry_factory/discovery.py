@@ -0,0 +1,124 @@
+"""Entry-point plugin discovery for registries."""
+import hashlib
+import json
+import os
+import sys
+import warnings
+from importlib import metadata
+from typing import TYPE_CHECKING, List, Optional, Tuple, Type
+
+from registry_factory.utils import RegistrationError, RegistrationWarning
+
+if TYPE_CHECKING:
+    from registry_factory.factory import Factory
+
+__all__ = ["DiscoveryCache", "discover_plugins", "installed_fingerprint", "scan_entry_points"]
+
+
+def default_cache_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_home, "registry_factory")
+
+
+def installed_fingerprint(paths: Optional[List[str]] = None) -> str:
+    """Fingerprint of the installed distributions, based on the import paths and their modification times.
+
+    Installing or removing a distribution touches its site directory, so the fingerprint changes without
+    reading any distribution metadata.
+    """
+    digest = hashlib.sha256()
+    for path in sys.path if paths is None else paths:
+        try:
+            mtime = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            mtime = -1
+        digest.update(f"{path}\0{mtime}\0".encode())
+    return digest.hexdigest()
+
+
+def scan_entry_points(group: str) -> List[Tuple[str, str]]:
+    """Return the (name, value) pairs of all entry points in the group."""
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        selected = entry_points.select(group=group)
+    else:  # Python < 3.10
+        selected = entry_points.get(group, [])  # type: ignore[attr-defined]
+    return sorted({(entry_point.name, entry_point.value) for entry_point in selected})
+
+
+class DiscoveryCache:
+    """On-disk cache of scanned entry points, keyed by the installed distributions fingerprint."""
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+
+    def path(self, group: str) -> str:
+        return os.path.join(self.cache_dir, f"discovery-{hashlib.sha256(group.encode()).hexdigest()[:16]}.json")
+
+    def load(self, group: str, fingerprint: str) -> Optional[List[Tuple[str, str]]]:
+        try:
+            with open(self.path(group)) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get("group") != group or cached.get("fingerprint") != fingerprint:
+            return None
+        return [(name, value) for name, value in cached["entry_points"]]
+
+    def save(self, group: str, fingerprint: str, entry_points: List[Tuple[str, str]]) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(group)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"group": group, "fingerprint": fingerprint, "entry_points": entry_points}, f)
+        os.replace(tmp_path, path)
+
+
+def discover_plugins(
+    factory: Type["Factory"],
+    group: str,
+    cache_dir: Optional[str] = None,
+    use_cache: bool = True,
+    strict: bool = False,
+) -> List[Tuple[str, str]]:
+    """Register the entry points of a group lazily onto the registries of a factory.
+
+    Entry points are named "<RegistryName>.<key>" and point to the object, e.g.
+    ``ModelRegistry.encoder = my_package.models:Encoder``. Returns the (registry, key) pairs that were added.
+    An entry point that fails to register does not stop the others; the failures are warned about at the end,
+    or raised as one RegistrationError when strict.
+    """
+    cache = DiscoveryCache(cache_dir) if use_cache else None
+    fingerprint = installed_fingerprint() if cache is not None else ""
+    entry_points = cache.load(group, fingerprint) if cache is not None else None
+    if entry_points is None:
+        entry_points = scan_entry_points(group)
+        if cache is not None:
+            try:
+                cache.save(group, fingerprint, entry_points)
+            except OSError as e:
+                warnings.warn(RegistrationWarning(f"Could not write the discovery cache: {e}"))
+
+    registries = factory.get_registries()
+    registered = []
+    errors = []
+    for name, path in entry_points:
+        registry_name, _, key = name.partition(".")
+        if registry_name not in registries or not key:
+            warnings.warn(RegistrationWarning(f"Entry point {name} does not match a registry of {factory.__name__}."))
+            continue
+        mediator = registries[registry_name].mediator
+        try:
+            if mediator.hash_table.contains(key, mediator.generate_key_dict(key=key)):
+                continue
+            registries[registry_name].register_lazy(key, path)
+        except Exception as e:
+            errors.append(f"{name} = {path}: {e}")
+            continue
+        registered.append((registry_name, key))
+    if errors:
+        message = f"{len(errors)} entry point(s) of {group} could not be registered:\n  " + "\n  ".join(errors)
+        if strict:
+            raise RegistrationError(message)
+        warnings.warn(RegistrationWarning(message))
+    return registered
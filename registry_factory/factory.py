@@ -1,26 +1,78 @@
 """Registry factory module for a codebase."""
 # from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple, Type
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, Type, Union
 
+from registry_factory.cache import ResolutionCache
+from registry_factory.discovery import discover_plugins
 from registry_factory.index import HashTable, RegistryTable
 from registry_factory.patterns.facade import ObserverFacade
 from registry_factory.patterns.mediator import HashMediator
 from registry_factory.patterns.observer import RegistryObserver
 from registry_factory.registry import AbstractRegistry
+from registry_factory.tools import freeze
 from registry_factory.tracker import Tracker
+from registry_factory.utils import RegistrationError
 
 
-class Factory:
+def _is_registry(value: Any) -> bool:
+    return isinstance(value, type) and issubclass(value, AbstractRegistry) and hasattr(value, "_registry_hash")
+
+
+class FactoryMeta(type):
+    """Metaclass that catalogs the registries assigned to a factory, also after its creation.
+
+    Each factory keeps the registries assigned to it in its own dict, and its catalog chains these dicts along
+    the MRO, so registries added to a base later on are seen by its subclasses. The root Factory has no catalog.
+    """
+
+    def __init__(cls, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        if not any(isinstance(base, FactoryMeta) for base in bases):
+            return
+        own = {attribute: value for attribute, value in namespace.items() if _is_registry(value)}
+        inherited = [base.__dict__["_own_registries"] for base in cls.__mro__[1:] if "_own_registries" in vars(base)]
+        super().__setattr__("_own_registries", own)
+        super().__setattr__("_registries", ChainMap(own, *inherited))
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        own = cls.__dict__.get("_own_registries")
+        if own is None:
+            return
+        if _is_registry(value):
+            value.__set_name__(cls, name)
+            own[name] = value
+        else:
+            own.pop(name, None)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        own = cls.__dict__.get("_own_registries")
+        if own is not None:
+            own.pop(name, None)
+
+
+class Factory(metaclass=FactoryMeta):
     """A factory class for creating registries."""
 
     _hash_map: RegistryTable
     _shared_hash: int
     _shared_hash_table: HashTable
+    _registries: Mapping[str, Type[AbstractRegistry]] = MappingProxyType({})
 
     def __init__(self):
         raise ValueError("Factory is not meant to be instantiated.")
 
+    @classmethod
+    def add_registry(cls, name: str, registry: Type[AbstractRegistry]) -> None:
+        """Assign a registry to the factory after its creation, same as setting the attribute."""
+        if cls is Factory:
+            raise TypeError("Registries are added to subclasses of Factory, not to Factory itself.")
+        setattr(cls, name, registry)
+
     @classmethod
     def hash_map(cls) -> RegistryTable:
         """Return the hash map."""
@@ -54,62 +106,94 @@ class Factory:
         shared: bool = False,
         skip_validation: bool = False,
         checks: Optional[List[RegistryObserver]] = None,
+        cache: bool = False,
+        indexes: Optional[List[str]] = None,
+        metrics: bool = False,
+        partial_keys: bool = False,
     ) -> Type[AbstractRegistry]:
         registry_hash = cls.shared_hash() if shared else cls.hash_map().generate_hash()
+        observer_facade = ObserverFacade(skip_validation, observers=checks)
+        observer_facade.compile()
 
         class Registry(AbstractRegistry):
             _registry_hash = registry_hash
-            mediator = HashMediator(registry_hash, ObserverFacade(skip_validation, observers=checks))
+            mediator = HashMediator(
+                registry_hash,
+                observer_facade,
+                cache=ResolutionCache() if cache else None,
+                partial_keys=partial_keys,
+            )
 
         if not shared:
             cls.hash_map().set(registry_hash)
         else:
             Registry.mediator.hash_table = cls.shared_hash_table()
+        if observer_facade.versioning is not None:
+            Registry.mediator.hash_table.enable_version_index(*observer_facade.versioning)
+        if indexes is not None:
+            Registry.add_index(*indexes)
+        if metrics:
+            Registry.enable_metrics()
         return Registry
 
+    @classmethod
+    def discover_plugins(
+        cls, group: str, cache_dir: Optional[str] = None, use_cache: bool = True, strict: bool = False
+    ) -> List[Tuple[str, str]]:
+        """Lazily register the objects advertised under an entry-point group, see discovery.discover_plugins."""
+        return discover_plugins(cls, group, cache_dir=cache_dir, use_cache=use_cache, strict=strict)
+
+    @classmethod
+    def called_report(cls) -> List[Dict[str, Any]]:
+        """Return the tracked calls to the registries of the factory with their meta information."""
+        registries = {registry: name for name, registry in cls.get_registries().items()}
+        report = []
+        for registry, key, key_dict, count in Tracker().get():
+            if registry not in registries:
+                continue
+            try:
+                meta = registry.mediator.get_meta(key, **key_dict)
+            except Exception:
+                meta = {}
+            report.append(
+                {"registry": registries[registry], "key": key, "key_dict": key_dict, "count": count, "meta": meta}
+            )
+        return report
+
     @classmethod
     def view_called(cls) -> None:
         """View the accreditation information."""
         print("Called objects:")
-        Tracker().show()
+        for row in cls.called_report():
+            print(f"{row['registry']}: {row['key']} {row['key_dict']} ({row['count']} calls)")
+            for field, value in row["meta"].items():
+                print(f"    {field}: {value}")
 
     @classmethod
-    def get_registries(cls) -> Dict[str, AbstractRegistry]:
+    def get_registries(cls) -> Mapping[str, Type[AbstractRegistry]]:
         """Return the choices for the subclass."""
-        possible_registries = [attr for attr in dir(cls) if not attr.startswith("__")]
-        registries = {
-            reg: getattr(cls, reg)
-            for reg in possible_registries
-            if hasattr(getattr(cls, reg), "_registry_hash")
-            and (
-                getattr(cls, reg)._registry_hash in cls.hash_map()
-                or getattr(cls, reg)._registry_hash == cls.shared_hash()
-            )
-        }
-        return registries
+        return MappingProxyType(cls._registries)
 
     @classmethod
     def items(cls) -> List[Tuple[str, Any]]:
         """Return the items for the subclass."""
-        return [(name, reg) for name, reg in cls.get_registries().items()]
+        return list(cls._registries.items())
 
     @classmethod
     def keys(cls) -> List[str]:
         """Return the keys for the subclass."""
-        return [name for name, reg in cls.get_registries().items()]
+        return list(cls._registries)
 
     @classmethod
     def values(cls) -> List[Any]:
         """Return the values for the subclass."""
-        return [reg for name, reg in cls.get_registries().items()]
+        return list(cls._registries.values())
 
     @classmethod
     def get_options(cls, registries_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get the options for the registry."""
         registries = (
-            cls.get_registries()
-            if registries_names is None
-            else {name: cls.get_registries()[name] for name in registries_names}
+            cls._registries if registries_names is None else {name: cls._registries[name] for name in registries_names}
         )
         options = {}
         for name, registry in registries.items():
@@ -119,21 +203,53 @@ class Factory:
 
     @classmethod
     def get_registry_arguments(cls, registries: List[str]) -> Dict[str, Any]:
-        """Return the arguments for the subclass."""
-        cls_registries = cls.get_registries()
-        cls_registries = {name: cls_registries[name] for name in registries}
+        """Return the most recently registered arguments of each of the registries."""
         arguments = {}
-        for name, registry in cls_registries.items():
-            options = cls.get_options([name])
-            for option in options:
-                for key in option.keys():
-                    arguments[name] = registry.get_arguments(key)
+        for name in registries:
+            mediator = cls._registries[name].mediator
+            arg_dict = mediator.hash_table.arg_dict
+            if arg_dict:
+                key, key_dict = mediator.hash_table.slots[next(reversed(arg_dict))]
+                arguments[name] = mediator.get_arguments(key, key_dict)
         return arguments
 
+    @classmethod
+    def resolve_arguments(cls, selection: Mapping[str, Union[str, Tuple[str, Dict]]]) -> Dict[str, Any]:
+        """Return the arguments selected per registry, as {registry_name: key or (key, kwargs)}."""
+        return cls.resolve_arguments_many([selection])[0]
+
+    @classmethod
+    def resolve_arguments_many(
+        cls, selections: Iterable[Mapping[str, Union[str, Tuple[str, Dict]]]]
+    ) -> List[Dict[str, Any]]:
+        """Return the arguments of a batch of selections, raising all failed lookups at once.
+
+        Each distinct (registry, key, kwargs) is looked up once for the whole batch.
+        """
+        resolved: Dict[Hashable, Any] = {}
+        results = []
+        errors = []
+        for selection in selections:
+            arguments = {}
+            for name, choice in selection.items():
+                key, kwargs = (choice, {}) if isinstance(choice, str) else choice
+                selected = (name, key, freeze(kwargs) if kwargs else None)
+                if selected not in resolved:
+                    try:
+                        mediator = cls._registries[name].mediator
+                        resolved[selected] = mediator.get_arguments(key, mediator.generate_key_dict(key=key, **kwargs))
+                    except Exception as e:
+                        resolved[selected] = RegistrationError(f"{name}: no arguments for {key}, {kwargs} ({e!r})")
+                        errors.append(resolved[selected].message)
+                arguments[name] = resolved[selected]
+            results.append(arguments)
+        if errors:
+            raise RegistrationError("\n".join(errors))
+        return results
+
     @classmethod
     def get_arguments(cls, registry: str, key: str, key_dict: Optional[Dict] = None, **kwargs) -> Any:
-        cls_registries = cls.get_registries()
-        return cls_registries[registry].get_arguments(key, key_dict, **kwargs)
+        return cls._registries[registry].get_arguments(key, key_dict, **kwargs)
 
         # dataclasses = {}
 
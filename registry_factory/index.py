@@ -1,9 +1,15 @@
+import bisect
+import difflib
 import random
+import threading
 import warnings
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
 from registry_factory.patterns.metacoding import UniqueDict
+from registry_factory.patterns.observer import PendingResult
+from registry_factory.tools import freeze
 from registry_factory.typescripts import Dataclass
+from registry_factory.utils import AmbiguousKeyError
 
 
 class IndexDict(UniqueDict):
@@ -56,6 +62,300 @@ class AbstractHash:
         return iter(self.slots.values())
 
 
+class VersionIndex:
+    """Per-key sorted index over a version field of the key dicts."""
+
+    OPERATORS = (">=", "<=", "==", "!=", ">", "<")
+
+    entries: Dict[str, Tuple[List[Any], List[Tuple[str, int]]]]
+
+    def __init__(self, field: str, version_key: Callable[[str], Any]) -> None:
+        self.field = field
+        self.version_key = version_key
+        self.entries = {}
+
+    def add(self, key: str, key_dict: Dict, hash_value: int) -> None:
+        if self.field not in key_dict:
+            return
+        version = key_dict[self.field]
+        sort_keys, items = self.entries.setdefault(key, ([], []))
+        sort_key = self.version_key(version)
+        position = bisect.bisect_right(sort_keys, sort_key)
+        sort_keys.insert(position, sort_key)
+        items.insert(position, (version, hash_value))
+
+    def remove(self, key: str, key_dict: Dict, hash_value: int) -> None:
+        if self.field not in key_dict or key not in self.entries:
+            return
+        sort_keys, items = self.entries[key]
+        position = items.index((key_dict[self.field], hash_value))
+        del sort_keys[position]
+        del items[position]
+        if not items:
+            del self.entries[key]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def versions(self, key: str) -> List[str]:
+        """Return the distinct versions of a key, in ascending order."""
+        _, items = self.entries.get(key, ([], []))
+        return list(dict.fromkeys(version for version, _ in items))
+
+    @classmethod
+    def is_specifier(cls, version: Any) -> bool:
+        return isinstance(version, str) and (version == "latest" or version.startswith(cls.OPERATORS))
+
+    def _bounds(self, sort_keys: List[Any], specifier: str) -> Tuple[int, int, List[Any], bool]:
+        """Return the range of positions matching the specifier, the excluded versions and whether the
+        specifier asks for pre-releases by naming one (PEP 440)."""
+        low, high, excluded, prereleases = 0, len(sort_keys), [], False
+        if specifier == "latest":
+            return low, high, excluded, prereleases
+        for clause in specifier.split(","):
+            clause = clause.strip()
+            operator = next((op for op in self.OPERATORS if clause.startswith(op)), None)
+            if operator is None:
+                raise KeyError(f"{clause} is not a valid version specifier.")
+            bound = self.version_key(clause[len(operator) :].strip())
+            is_prerelease = getattr(bound, "is_prerelease", False)
+            prereleases = prereleases or is_prerelease
+            if operator == ">=":
+                low = max(low, bisect.bisect_left(sort_keys, bound))
+            elif operator == ">":
+                # >V excludes the post-releases of V unless V is one.
+                if hasattr(bound, "ceiling") and not bound.is_postrelease:
+                    bound = bound.ceiling()
+                low = max(low, bisect.bisect_right(sort_keys, bound))
+            elif operator == "<=":
+                high = min(high, bisect.bisect_right(sort_keys, bound))
+            elif operator == "<":
+                # <V excludes the pre-releases of V unless V is one.
+                if hasattr(bound, "floor") and not is_prerelease:
+                    bound = bound.floor()
+                high = min(high, bisect.bisect_left(sort_keys, bound))
+            elif operator == "==":
+                low = max(low, bisect.bisect_left(sort_keys, bound))
+                high = min(high, bisect.bisect_right(sort_keys, bound))
+            else:
+                excluded.append(bound)
+        return low, high, excluded, prereleases
+
+    def resolve(
+        self, key: str, specifier: str, slots: Dict[int, Tuple[str, Dict]], key_dict: Dict, partial: bool = False
+    ) -> Optional[int]:
+        """Return the hash of the highest version matching the specifier and the other key values.
+
+        Pre-releases only match when the specifier names one, or when no final release matches. Entries must have
+        the same key parameters as the key dict, unless partial, where entries containing the other key values
+        match and several of them at the highest version raise an AmbiguousKeyError.
+        """
+        if key not in self.entries:
+            return None
+        sort_keys, items = self.entries[key]
+        low, high, excluded, prereleases = self._bounds(sort_keys, specifier)
+        others = [(k, v) for k, v in key_dict.items() if k != self.field]
+        missing = object()
+
+        def matches(position: int) -> bool:
+            slot_key_dict = slots[items[position][1]][1]
+            if not partial and len(slot_key_dict) != len(key_dict):
+                return False
+            return all(slot_key_dict.get(k, missing) == v for k, v in others)
+
+        found = None
+        fallback = None
+        for position in range(high - 1, low - 1, -1):
+            sort_key = sort_keys[position]
+            if sort_key in excluded or not matches(position):
+                continue
+            if prereleases or not getattr(sort_key, "is_prerelease", False):
+                found = position
+                break
+            if fallback is None:
+                fallback = position
+        found = fallback if found is None else found
+        if found is None:
+            return None
+        if partial:
+            same_version = [
+                position
+                for position in range(bisect.bisect_left(sort_keys, sort_keys[found]), high)
+                if sort_keys[position] == sort_keys[found] and matches(position)
+            ]
+            if len(same_version) > 1:
+                candidates = ", ".join(str(slots[items[position][1]][1]) for position in same_version)
+                raise AmbiguousKeyError(f"{key}, {key_dict} matches several entries: {candidates}.")
+        return items[found][1]
+
+
+class KeyColumnIndex:
+    """Multi-column index over (key, key parameter value) pairs for partial key dict matches.
+
+    The distinct keys are also kept sorted, forwards for prefix completion and reversed so that suggestions
+    can look at keys sharing a suffix as well as a prefix. New keys are sorted in on the first read after them,
+    so registering n keys costs one sort instead of n list insertions.
+    """
+
+    SUGGESTION_WINDOW = 16
+
+    keys: Dict[str, Set[int]]
+    columns: Dict[Tuple[str, str, Hashable], Set[int]]
+
+    def __init__(self) -> None:
+        self.keys = {}
+        self.columns = {}
+        self._sorted_keys: List[str] = []
+        self._reversed_keys: List[str] = []
+        self._added: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def sorted_keys(self) -> List[str]:
+        if self._added:
+            self._merge_added()
+        return self._sorted_keys
+
+    @property
+    def reversed_keys(self) -> List[str]:
+        if self._added:
+            self._merge_added()
+        return self._reversed_keys
+
+    def _merge_added(self) -> None:
+        with self._lock:
+            self._merge_locked()
+
+    def _merge_locked(self) -> None:
+        if not self._added:
+            return
+        self._sorted_keys.extend(self._added)
+        self._sorted_keys.sort()
+        self._reversed_keys.extend(key[::-1] for key in self._added)
+        self._reversed_keys.sort()
+        self._added.clear()
+
+    def add(self, key: str, key_dict: Dict, hash_value: int) -> None:
+        if key not in self.keys:
+            # Shares the lock with the merge, so a key added while merging is not cleared unsorted.
+            with self._lock:
+                if key not in self.keys:
+                    self.keys[key] = set()
+                    self._added.append(key)
+        self.keys[key].add(hash_value)
+        for parameter, value in key_dict.items():
+            self.columns.setdefault((key, parameter, freeze(value)), set()).add(hash_value)
+
+    def remove(self, key: str, key_dict: Dict, hash_value: int) -> None:
+        with self._lock:
+            self._discard(self.keys, key, hash_value)
+            if key not in self.keys:
+                self._merge_locked()
+                del self._sorted_keys[bisect.bisect_left(self._sorted_keys, key)]
+                del self._reversed_keys[bisect.bisect_left(self._reversed_keys, key[::-1])]
+        for parameter, value in key_dict.items():
+            self._discard(self.columns, (key, parameter, freeze(value)), hash_value)
+
+    @staticmethod
+    def _discard(index: Dict, column: Hashable, hash_value: int) -> None:
+        index[column].discard(hash_value)
+        if not index[column]:
+            del index[column]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.keys.clear()
+            self.columns.clear()
+            self._sorted_keys.clear()
+            self._reversed_keys.clear()
+            self._added.clear()
+
+    def match(self, key: str, partial_key_dict: Dict) -> Set[int]:
+        """Return the hashes of the key's entries containing all given key parameter values."""
+        postings = [self.keys.get(key, set())]
+        postings += [
+            self.columns.get((key, parameter, freeze(value)), set()) for parameter, value in partial_key_dict.items()
+        ]
+        postings.sort(key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Return the keys starting with the prefix, in sorted order."""
+        completions = []
+        position = bisect.bisect_left(self.sorted_keys, prefix)
+        while position < len(self.sorted_keys) and self.sorted_keys[position].startswith(prefix):
+            if limit is not None and len(completions) >= limit:
+                break
+            completions.append(self.sorted_keys[position])
+            position += 1
+        return completions
+
+    def children(self, prefix: str = "", separator: str = ".") -> List[str]:
+        """Return the distinct next segments of the keys under a hierarchical prefix."""
+        children = set()
+        position = bisect.bisect_left(self.sorted_keys, prefix)
+        while position < len(self.sorted_keys) and self.sorted_keys[position].startswith(prefix):
+            child, nested, _ = self.sorted_keys[position][len(prefix) :].partition(separator)
+            children.add(child)
+            if nested:  # skip every key below this child in one jump
+                subtree_end = f"{prefix}{child}{separator}\U0010ffff"
+                position = bisect.bisect_left(self.sorted_keys, subtree_end, position + 1)
+            else:
+                position += 1
+        return sorted(children)
+
+    def suggest(self, key: str, limit: int = 3) -> List[str]:
+        """Return registered keys close to the key, looking only at a bounded neighbourhood."""
+        window = self.SUGGESTION_WINDOW
+        position = bisect.bisect_left(self.sorted_keys, key)
+        candidates = set(self.sorted_keys[max(position - window, 0) : position + window])
+        position = bisect.bisect_left(self.reversed_keys, key[::-1])
+        reversed_window = self.reversed_keys[max(position - window, 0) : position + window]
+        candidates.update(reverse[::-1] for reverse in reversed_window)
+        for length in range(len(key) - 1, 0, -1):
+            if len(candidates) >= 6 * window:
+                break
+            candidates.update(self.complete(key[:length], limit=window))
+        return difflib.get_close_matches(key, sorted(candidates), n=limit)
+
+
+class MetaIndex:
+    """Inverted indexes from meta information (and key dict) values to slot hashes."""
+
+    fields: Dict[str, Dict[Hashable, Set[int]]]
+
+    def __init__(self) -> None:
+        self.fields = {}
+
+    def add_field(self, field: str, values: Dict[int, Dict]) -> None:
+        if field in self.fields:
+            return
+        self.fields[field] = {}
+        for hash_value, entry in values.items():
+            if field in entry:
+                self.fields[field].setdefault(freeze(entry[field]), set()).add(hash_value)
+
+    def add(self, hash_value: int, entry: Dict) -> None:
+        for field, index in self.fields.items():
+            if field in entry:
+                index.setdefault(freeze(entry[field]), set()).add(hash_value)
+
+    def remove(self, hash_value: int, entry: Dict) -> None:
+        for field, index in self.fields.items():
+            if field in entry:
+                value = freeze(entry[field])
+                index[value].discard(hash_value)
+                if not index[value]:
+                    del index[value]
+
+    def clear(self) -> None:
+        for index in self.fields.values():
+            index.clear()
+
+    def lookup(self, field: str, value: Any) -> Set[int]:
+        return self.fields[field].get(freeze(value), set())
+
+
 class HashTable(AbstractHash):
     """Hash table."""
 
@@ -63,41 +363,170 @@ class HashTable(AbstractHash):
     data: Dict[int, Any]
     arg_dict: Dict[int, Dataclass]
     meta_dict: Dict[int, Dict]
+    index: Dict[Hashable, int]
+    generation: int
+    version_index: Optional[VersionIndex]
+    meta_index: MetaIndex
+    key_columns: KeyColumnIndex
+    pending: Set[int]
 
     def __init__(self, bitsize: int = 256, max_generation: int = 1000):
         super().__init__(bitsize, max_generation)
         self.arg_dict = {}
         self.meta_dict = {}
+        self.index = {}
+        self.generation = 0
+        self.version_index = None
+        self.meta_index = MetaIndex()
+        self.key_columns = KeyColumnIndex()
+        self.pending = set()
+
+    @staticmethod
+    def index_key(key: str, key_dict: Dict) -> Hashable:
+        """Return the canonical hashable form of a (key, key_dict) pair."""
+        return (key, freeze(key_dict))
+
+    def _get_or_create_hash(self, key: str, key_dict: Dict) -> Tuple[int, bool]:
+        index_key = self.index_key(key, key_dict)
+        hash_value = self.index.get(index_key)
+        if hash_value is not None:
+            return hash_value, False
+        hash_value = self.generate_hash()
+        self._add_slot(hash_value, index_key, key, key_dict)
+        return hash_value, True
+
+    def _add_slot(self, hash_value: int, index_key: Hashable, key: str, key_dict: Dict) -> None:
+        self.slots[hash_value] = (key, key_dict)
+        self.index[index_key] = hash_value
+        self.key_columns.add(key, key_dict, hash_value)
+        if self.version_index is not None:
+            self.version_index.add(key, key_dict, hash_value)
+
+    def enable_version_index(self, field: str, version_key: Callable[[str], Any]) -> None:
+        """Maintain a sorted index over the version field of the key dicts."""
+        if self.version_index is not None:
+            if (self.version_index.field, self.version_index.version_key) != (field, version_key):
+                warnings.warn(f"A version index over {self.version_index.field} already exists, keeping it.")
+            return
+        self.version_index = VersionIndex(field, version_key)
+        for hash_value, (key, key_dict) in self.slots.items():
+            self.version_index.add(key, key_dict, hash_value)
 
     def set(self, key: str, key_dict: Dict, obj: Any, meta: Optional[Dict] = None) -> None:
-        full_key: Tuple[str, Dict] = (key, key_dict)
-        if full_key in self.slots.values():
-            hash_value = self.get_hash(key, key_dict)
-            if hash_value in self.data.keys():
-                raise KeyError(f"{key}, {key_dict} already exist in the registry.")
-        else:
-            hash_value = self.generate_hash()
-            self.slots[hash_value] = full_key
+        hash_value, created = self._get_or_create_hash(key, key_dict)
+        if not created and hash_value in self.data:
+            raise KeyError(f"{key}, {key_dict} already exist in the registry.")
         self.data[hash_value] = obj
         if meta is not None:
             self.meta_dict[hash_value] = meta
+            self._track_pending(hash_value)
+        self.meta_index.add(hash_value, self.entry_values(hash_value))
+        self.generation += 1
+
+    def set_many(self, entries: List[Tuple[str, Dict, Any, Optional[Dict]]]) -> None:
+        """Set a batch of (key, key_dict, obj, meta) entries, raising on any duplicate before writing."""
+        index_keys = [self.index_key(key, key_dict) for key, key_dict, _, _ in entries]
+        duplicates = []
+        staged = set()
+        for index_key, (key, key_dict, _, _) in zip(index_keys, entries):
+            if index_key in staged or self.index.get(index_key) in self.data:
+                duplicates.append(f"{key}, {key_dict} already exist in the registry.")
+            staged.add(index_key)
+        if duplicates:
+            raise KeyError("\n".join(duplicates))
+
+        for index_key, (key, key_dict, obj, meta) in zip(index_keys, entries):
+            hash_value = self.index.get(index_key)
+            if hash_value is None:
+                hash_value = self.generate_hash()
+                self._add_slot(hash_value, index_key, key, key_dict)
+            self.data[hash_value] = obj
+            if meta is not None:
+                self.meta_dict[hash_value] = meta
+                self._track_pending(hash_value)
+            self.meta_index.add(hash_value, self.entry_values(hash_value))
+        self.generation += 1
+
+    def update(self, hash_value: int, obj: Any, meta: Optional[Dict] = None) -> None:
+        """Replace the object of an existing slot in place, e.g. once a lazy entry is imported."""
+        self.data[hash_value] = obj
+        if meta:
+            self.meta_index.remove(hash_value, self.entry_values(hash_value))
+            self.meta_dict[hash_value] = {**self.meta_dict.get(hash_value, {}), **meta}
+            self.meta_index.add(hash_value, self.entry_values(hash_value))
+            self._track_pending(hash_value)
+
+    def _track_pending(self, hash_value: int) -> None:
+        if any(isinstance(value, PendingResult) for value in self.meta_dict[hash_value].values()):
+            self.pending.add(hash_value)
+        else:
+            self.pending.discard(hash_value)
+
+    def entry_values(self, hash_value: int) -> Dict:
+        """Return the key dict and meta information of a slot as one dict."""
+        return {**self.slots[hash_value][1], **self.meta_dict.get(hash_value, {})}
+
+    def add_meta_index(self, field: str) -> None:
+        """Maintain an inverted index over a meta information or key dict field."""
+        self.meta_index.add_field(field, {hash_value: self.entry_values(hash_value) for hash_value in self.data})
+
+    def query(self, conditions: Dict[str, Any]) -> List[int]:
+        """Return the hashes of the entries whose fields match all conditions.
+
+        Conditions on indexed fields are intersected from the smallest posting set, other conditions filter
+        the remaining candidates. A condition is either a value or a predicate called with the field value.
+        """
+        indexed = [
+            self.meta_index.lookup(field, value)
+            for field, value in conditions.items()
+            if field in self.meta_index.fields and not callable(value)
+        ]
+        others = {
+            field: value
+            for field, value in conditions.items()
+            if field not in self.meta_index.fields or callable(value)
+        }
+        if indexed:
+            indexed.sort(key=len)
+            candidates = set(indexed[0]).intersection(*indexed[1:])
+        else:
+            candidates = set(self.data)
+
+        if not others:
+            return list(candidates)
+        results = []
+        for hash_value in candidates:
+            values = self.entry_values(hash_value)
+            if all(self._matches(values, field, condition) for field, condition in others.items()):
+                results.append(hash_value)
+        return results
+
+    @staticmethod
+    def _matches(values: Dict, field: str, condition: Any) -> bool:
+        if field not in values:
+            return False
+        return condition(values[field]) if callable(condition) else values[field] == condition
 
     def set_arguments(self, key: str, key_dict: Dict, arguments: Dataclass) -> None:
-        full_key: Tuple[str, Dict] = (key, key_dict)
-        if full_key in self.slots.values():
-            hash_value = self.get_hash(key, key_dict)
-            if hash_value in self.arg_dict.keys():
-                raise KeyError(f"{key}, {key_dict} arguments already exist in the registry.")
-        else:
-            hash_value = self.generate_hash()
-            self.slots[hash_value] = full_key
+        hash_value, created = self._get_or_create_hash(key, key_dict)
+        if not created and hash_value in self.arg_dict:
+            raise KeyError(f"{key}, {key_dict} arguments already exist in the registry.")
         self.arg_dict[hash_value] = arguments
+        self.generation += 1
 
     def get_hash(self, key: str, key_dict: Dict) -> int:
-        for k, v in self.slots.items():
-            if v == (key, key_dict):
-                return k
-        raise KeyError(f"{key}, {key_dict} not found in the registry.")
+        try:
+            return self.index[self.index_key(key, key_dict)]
+        except KeyError:
+            raise KeyError(f"{key}, {key_dict} not found in the registry.") from None
+
+    def keys(self) -> List[str]:
+        """Return the distinct registered keys in sorted order."""
+        return list(self.key_columns.sorted_keys)
+
+    def match(self, key: str, partial_key_dict: Dict) -> List[int]:
+        """Return the hashes of the entries of a key whose key dict contains the partial key dict."""
+        return [hash_value for hash_value in self.key_columns.match(key, partial_key_dict) if hash_value in self.data]
 
     def get(self, key: str, key_dict: Dict) -> Any:
         hash_value = self.get_hash(key, key_dict)
@@ -113,17 +542,37 @@ class HashTable(AbstractHash):
 
     def delete(self, key: str, key_dict: Dict) -> None:
         hash_value = self.get_hash(key, key_dict)
-        del self.slots[hash_value]
-        del self.data[hash_value]
-        del self.meta_dict[hash_value]
+        if hash_value in self.data:
+            self.meta_index.remove(hash_value, self.entry_values(hash_value))
+        key, key_dict = self.slots.pop(hash_value)
+        del self.index[self.index_key(key, key_dict)]
+        self.key_columns.remove(key, key_dict, hash_value)
+        if self.version_index is not None:
+            self.version_index.remove(key, key_dict, hash_value)
+        self.data.pop(hash_value, None)
+        self.meta_dict.pop(hash_value, None)
+        self.arg_dict.pop(hash_value, None)
+        self.pending.discard(hash_value)
+        self.generation += 1
 
     def clear(self) -> None:
         self.slots.clear()
         self.data.clear()
         self.meta_dict.clear()
+        self.arg_dict.clear()
+        self.index.clear()
+        if self.version_index is not None:
+            self.version_index.clear()
+        self.meta_index.clear()
+        self.key_columns.clear()
+        self.pending.clear()
+        self.generation += 1
+
+    def contains(self, key: str, key_dict: Dict) -> bool:
+        return self.index_key(key, key_dict) in self.index
 
     def __contains__(self, key: str, key_dict: Dict) -> bool:
-        return (key, key_dict) in self.slots.values()
+        return self.contains(key, key_dict)
 
 
 class RegistryTable(AbstractHash):
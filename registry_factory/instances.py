@@ -0,0 +1,210 @@
+"""Cache of objects constructed from registry entries and their arguments."""
+import dataclasses
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+__all__ = ["InstanceCache", "estimate_size", "freeze_arguments"]
+
+_MISSING = object()
+
+
+class _Entry(NamedTuple):
+    instance: Any
+    size: int
+    expires: Optional[float]
+    version: Tuple
+
+
+class _Identity:
+    """Hashable stand-in for an unhashable value, comparing by identity and keeping the value alive."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def freeze_arguments(arguments: Any) -> Hashable:
+    """Convert arguments into a hashable form, comparing dataclass instances by their fields.
+
+    Containers are compared by their items, other unhashable values (e.g. arrays) by identity.
+    """
+    if dataclasses.is_dataclass(arguments) and not isinstance(arguments, type):
+        values = ((field.name, getattr(arguments, field.name)) for field in dataclasses.fields(arguments))
+        return (type(arguments), frozenset((name, freeze_arguments(value)) for name, value in values))
+    if isinstance(arguments, dict):
+        return frozenset((k, freeze_arguments(v)) for k, v in arguments.items())
+    if isinstance(arguments, (list, tuple)):
+        return (type(arguments), tuple(freeze_arguments(v) for v in arguments))
+    if isinstance(arguments, (set, frozenset)):
+        return (type(arguments), frozenset(arguments))
+    try:
+        hash(arguments)
+    except TypeError:
+        return _Identity(arguments)
+    return arguments
+
+
+def estimate_size(obj: Any) -> int:
+    """Return an estimate of the memory held by an object in bytes.
+
+    Follows containers and instance attributes, and uses the nbytes of arrays and tensors when available.
+    """
+    seen: Set[int] = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        nbytes = getattr(current, "nbytes", None)
+        if isinstance(nbytes, int):
+            size += nbytes
+            continue
+        size += sys.getsizeof(current, 0)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+    return size
+
+
+class InstanceCache:
+    """Constructed instances per (key, key_dict, arguments).
+
+    Each instance is stored with the version of its entry, the registered object and argument class, and is
+    reconstructed once that version changes, so registering other entries keeps it. Entries are evicted least
+    recently used first when there are more than max_entries of them or when their estimated sizes add up to more
+    than max_bytes, and expire ttl seconds after they were constructed. Concurrent requests for the same instance
+    construct it once.
+    """
+
+    entries: "OrderedDict[Hashable, _Entry]"
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 128,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = estimate_size if sizeof is None else sizeof
+        self.entries = OrderedDict()
+        self.excluded: Set[Hashable] = set()
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.building: Dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_create(self, cache_key: Hashable, version: Tuple, create: Callable[[], Any]) -> Any:
+        """Return the cached instance of the key, constructing it with create on a miss or a new entry version."""
+        with self.lock:
+            instance = self._get(cache_key, version)
+            if instance is not _MISSING:
+                self.hits += 1
+                return instance
+            build_lock = self.building.setdefault(cache_key, threading.Lock())
+        with build_lock:
+            with self.lock:
+                instance = self._get(cache_key, version)  # Constructed by another thread while waiting
+                if instance is not _MISSING:
+                    self.hits += 1
+                    return instance
+            try:
+                instance = create()
+                size = self.sizeof(instance) if self.max_bytes is not None else 0
+            except BaseException:
+                with self.lock:
+                    self.building.pop(cache_key, None)
+                raise
+            with self.lock:
+                # Stored before the build lock is released, so later callers find it instead of building again.
+                self.misses += 1
+                self._store(cache_key, instance, size, version)
+                self.building.pop(cache_key, None)
+        return instance
+
+    def _get(self, cache_key: Hashable, version: Tuple) -> Any:
+        entry = self.entries.get(cache_key)
+        if entry is None:
+            return _MISSING
+        if len(entry.version) != len(version) or any(old is not new for old, new in zip(entry.version, version)):
+            self._remove(cache_key)
+            return _MISSING
+        if entry.expires is not None and time.monotonic() >= entry.expires:
+            self._remove(cache_key)
+            self.expirations += 1
+            return _MISSING
+        self.entries.move_to_end(cache_key)
+        return entry.instance
+
+    def _store(self, cache_key: Hashable, instance: Any, size: int, version: Tuple) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if cache_key in self.entries:
+            self._remove(cache_key)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        self.entries[cache_key] = _Entry(instance, size, expires, version)
+        self.bytes += size
+        while (self.max_entries is not None and len(self.entries) > self.max_entries) or (
+            self.max_bytes is not None and self.bytes > self.max_bytes
+        ):
+            _, entry = self.entries.popitem(last=False)
+            self.bytes -= entry.size
+            self.evictions += 1
+
+    def _remove(self, cache_key: Hashable) -> None:
+        self.bytes -= self.entries.pop(cache_key).size
+
+    def _drop(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+
+    def exclude(self, entry_key: Hashable) -> None:
+        """Never cache the instances of a registry entry."""
+        with self.lock:
+            self.excluded.add(entry_key)
+            for cache_key in [cache_key for cache_key in self.entries if cache_key[:2] == entry_key]:
+                self._remove(cache_key)
+
+    def include(self, entry_key: Hashable) -> None:
+        with self.lock:
+            self.excluded.discard(entry_key)
+
+    def clear(self) -> None:
+        """Drop the cached instances and reset the counters, keeping the excluded entries."""
+        with self.lock:
+            self._drop()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self.entries),
+            "bytes": self.bytes,
+        }
@@ -0,0 +1,57 @@
+"""Lazy import-string entries for registries."""
+import importlib
+import threading
+from typing import Any, Dict, Optional
+
+__all__ = ["LazyObject", "import_from_path", "import_path_of"]
+
+
+def import_from_path(path: str) -> Any:
+    """Import an object from a "package.module:Attribute" or "package.module.Attribute" path."""
+    if ":" in path:
+        module_name, attributes = path.split(":", 1)
+    else:
+        module_name, _, attributes = path.rpartition(".")
+    if not module_name or not attributes:
+        raise ImportError(f"{path} is not a valid import path.")
+    obj = importlib.import_module(module_name)
+    for attribute in attributes.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def import_path_of(obj: Any) -> str:
+    """Return the "package.module:Attribute" path under which an object can be imported."""
+    if isinstance(obj, LazyObject):
+        return obj.path
+    module_name = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if module_name is None or qualname is None or "<locals>" in qualname or module_name == "__main__":
+        raise ImportError(f"{obj!r} cannot be imported by path.")
+    return f"{module_name}:{qualname}"
+
+
+class LazyObject:
+    """Placeholder for a registered object that is imported on first use."""
+
+    __slots__ = ("path", "kwargs", "deferred", "lock", "_obj", "_loaded")
+
+    def __init__(self, path: str, kwargs: Optional[Dict] = None, deferred: bool = True) -> None:
+        self.path = path
+        self.kwargs = {} if kwargs is None else kwargs
+        self.deferred = deferred  # whether checks needing the object still have to run
+        self.lock = threading.RLock()
+        self._obj: Any = None
+        self._loaded = False
+
+    def load(self) -> Any:
+        """Import the object once, even when called from several threads."""
+        if not self._loaded:
+            with self.lock:
+                if not self._loaded:
+                    self._obj = import_from_path(self.path)
+                    self._loaded = True
+        return self._obj
+
+    def __repr__(self) -> str:
+        return f"LazyObject({self.path!r})"
@@ -0,0 +1,128 @@
+"""Read-only memory-mapped registry index shared between processes.
+
+File layout (little endian)::
+
+    magic (8 bytes) | entry count (uint64)
+    count x [key hash (uint64) | record offset (uint64) | record length (uint32)], sorted by key hash
+    records, each a JSON encoded snapshot entry
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from registry_factory.index import HashTable
+from registry_factory.snapshot import decode_hook, encode, snapshot_entries
+from registry_factory.utils import RegistrationError
+
+__all__ = ["MappedIndex", "export_index"]
+
+MAGIC = b"RFIDX001"
+HEADER = struct.Struct("<8sQ")
+SLOT = struct.Struct("<QQI")
+
+
+def canonical_key(key: str, key_dict: Dict) -> bytes:
+    return json.dumps([key, encode(key_dict)], sort_keys=True, separators=(",", ":")).encode()
+
+
+def key_hash(key: str, key_dict: Dict) -> int:
+    return int.from_bytes(hashlib.blake2b(canonical_key(key, key_dict), digest_size=8).digest(), "little")
+
+
+def export_index(table: HashTable, path: str) -> None:
+    """Write the index of a hash table to a binary file that MappedIndex can attach to."""
+    try:
+        records = [
+            (key_hash(entry["key"], entry["key_dict"]), json.dumps(encode(entry), separators=(",", ":")).encode())
+            for entry in snapshot_entries(table)
+        ]
+    except TypeError as e:
+        raise RegistrationError(f"The registry index is not serializable: {e}") from e
+    records.sort(key=lambda record: record[0])
+
+    offset = HEADER.size + SLOT.size * len(records)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(records)))
+        for hash_value, record in records:
+            f.write(SLOT.pack(hash_value, offset, len(record)))
+            offset += len(record)
+        for _, record in records:
+            f.write(record)
+    os.replace(tmp_path, path)
+
+
+class MappedIndex:
+    """Zero-copy reader of an exported index; lookups binary search the mapped file.
+
+    An empty file is read as an empty index.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.buffer: Optional[mmap.mmap] = None
+        self.count = 0
+        self._keys: Optional[List[Tuple[str, Dict]]] = None
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            if size < HEADER.size:
+                raise RegistrationError(f"{path} is not a registry index.")
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            self.buffer.close()
+            raise RegistrationError(f"{path} is not a registry index.")
+
+    def _slot(self, position: int) -> Tuple[int, int, int]:
+        return SLOT.unpack_from(self.buffer, HEADER.size + SLOT.size * position)
+
+    def _record(self, offset: int, length: int) -> Dict:
+        return json.loads(self.buffer[offset : offset + length], object_hook=decode_hook)  # type: ignore[index]
+
+    def find(self, key: str, key_dict: Dict) -> Optional[Dict]:
+        """Return the entry of (key, key_dict), or None."""
+        target = key_hash(key, key_dict)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._slot(middle)[0] < target:
+                low = middle + 1
+            else:
+                high = middle
+        canonical = canonical_key(key, key_dict)
+        position = low
+        while position < self.count:
+            hash_value, offset, length = self._slot(position)
+            if hash_value != target:
+                break
+            entry = self._record(offset, length)
+            if canonical_key(entry["key"], entry["key_dict"]) == canonical:
+                return entry
+            position += 1
+        return None
+
+    def __contains__(self, full_key: Tuple[str, Dict]) -> bool:
+        return self.find(*full_key) is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Dict]:
+        for position in range(self.count):
+            _, offset, length = self._slot(position)
+            yield self._record(offset, length)
+
+    def keys(self) -> List[Tuple[str, Dict]]:
+        """Return the (key, key_dict) pairs of the index, decoded once as the file is read-only."""
+        if self._keys is None:
+            self._keys = [(entry["key"], entry["key_dict"]) for entry in self]
+        return list(self._keys)
+
+    def close(self) -> None:
+        if self.buffer is not None:
+            self.buffer.close()
@@ -0,0 +1,128 @@
+"""Runtime metrics of registries: lookup counts, call latency and observer time."""
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+__all__ = ["LatencyHistogram", "MetricsSink", "RegistryMetrics"]
+
+# Upper bounds in seconds, from 1 microsecond to 10 seconds in 1-2-5 steps.
+DEFAULT_BUCKETS = tuple(base * 10.0**exponent for exponent in range(-6, 1) for base in (1, 2, 5)) + (10.0,)
+
+
+class MetricsSink(ABC):
+    """Receiver of the individual measurements of a registry, e.g. to forward them to a monitoring system."""
+
+    @abstractmethod
+    def record(self, registry: str, metric: str, value: float, **tags: Any) -> None:
+        raise NotImplementedError
+
+
+class LatencyHistogram:
+    """Histogram of durations over fixed bucket bounds, with the count, total and maximum."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the q-quantile, or the maximum for the overflow bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": {f"le_{bound:g}": count for bound, count in zip(self.buckets, self.counts)},
+            "overflow": self.counts[-1],
+        }
+
+
+class RegistryMetrics:
+    """Metrics of one registry.
+
+    Records get counts per key, the hit, miss and default-returned outcomes of get, a latency histogram of
+    call events and the time spent in each observer during register and call events. Measurements are also
+    passed on to the attached sinks.
+    """
+
+    OUTCOMES = ("hit", "miss", "default")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.sinks: List[MetricsSink] = []
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.gets: Counter = Counter()
+            self.outcomes: Counter = Counter({outcome: 0 for outcome in self.OUTCOMES})
+            self.call_latency = LatencyHistogram()
+            self.observer_time: Dict[Tuple[str, str], List[float]] = {}
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        self.sinks.append(sink)
+
+    def record_get(self, key: str, outcome: str) -> None:
+        with self.lock:
+            self.gets[key] += 1
+            self.outcomes[outcome] += 1
+        for sink in self.sinks:
+            sink.record(self.name, "get", 1, key=key, outcome=outcome)
+
+    def record_call(self, key: str, seconds: float) -> None:
+        with self.lock:
+            self.call_latency.add(seconds)
+        for sink in self.sinks:
+            sink.record(self.name, "call_event", seconds, key=key)
+
+    def record_observer(self, event: str, observer: Any, seconds: float) -> None:
+        name = type(observer).__name__
+        with self.lock:
+            totals = self.observer_time.setdefault((event, name), [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+        for sink in self.sinks:
+            sink.record(self.name, "observer", seconds, event=event, observer=name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the metrics as a dict of plain values."""
+        with self.lock:
+            return {
+                "registry": self.name,
+                "gets": dict(self.gets),
+                "outcomes": dict(self.outcomes),
+                "call_latency": self.call_latency.snapshot(),
+                "observers": {
+                    event: {
+                        name: {"count": int(count), "total": total}
+                        for (observed_event, name), (count, total) in self.observer_time.items()
+                        if observed_event == event
+                    }
+                    for event in sorted({event for event, _ in self.observer_time})
+                },
+            }
@@ -0,0 +1,45 @@
+"""Process pools that pre-warm registries in their workers."""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from registry_factory.registry import AbstractRegistry
+
+__all__ = ["RegistryProcessPoolExecutor"]
+
+Requests = List[Union[str, Tuple[str, Dict]]]
+
+
+def _initialize_worker(
+    warm: Dict[Type[AbstractRegistry], Requests],
+    initializer: Optional[Callable],
+    initargs: Tuple,
+) -> None:
+    # Unpickling the registries imports their factories, resolving the requests imports the objects.
+    for registry, requests in warm.items():
+        registry.get_many(requests)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class RegistryProcessPoolExecutor(ProcessPoolExecutor):
+    """ProcessPoolExecutor whose workers import the given registries and resolve their keys on start-up.
+
+    Registries are sent to the workers by reference (factory and attribute name), so they must be assigned
+    to an importable Factory subclass.
+    """
+
+    def __init__(
+        self,
+        registries: Union[Sequence[Type[AbstractRegistry]], Dict[Type[AbstractRegistry], Requests]],
+        max_workers: Optional[int] = None,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+        **kwargs: Any,
+    ) -> None:
+        warm = dict(registries) if isinstance(registries, dict) else {registry: [] for registry in registries}
+        super().__init__(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(warm, initializer, initargs),
+            **kwargs,
+        )
@@ -1,13 +1,19 @@
 """Facade dealing with calling and registering postchecks for a registry."""
 
-from typing import Any, Dict, List, Optional, Tuple
-from registry_factory.patterns.observer import RegistryObserver
+from time import perf_counter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from registry_factory.metrics import RegistryMetrics
+from registry_factory.patterns.observer import MetaInformationObserver, RegistryObserver
 
 __all__ = ["ObserverFacade"]
 
 
 class ObserverFacade:
     observers: Optional[List[RegistryObserver]]
+    key_parameters: Optional[FrozenSet[str]]
+    call_observers: Optional[List[RegistryObserver]]
+    versioning: Optional[Tuple[str, Callable[[str], Any]]]
+    metrics: Optional[RegistryMetrics]
 
     def __init__(self, skip_val: bool = False, observers: Optional[List[RegistryObserver]] = None) -> None:
         self.skip_val = skip_val
@@ -17,46 +23,120 @@ class ObserverFacade:
         else:
             self.observers = observers
 
+        self.compiled = False
+        self.key_parameters = None
+        self.call_observers = None
+        self.versioning = None
+        self.metrics = None
+
+    def compile(self) -> None:
+        """Precompute the key extraction and the observers that act on call events."""
+        observers = self.observers or []
+        key_generators = [
+            observer
+            for observer in observers
+            if type(observer).generate_key_dict is not RegistryObserver.generate_key_dict
+        ]
+        if all(
+            type(observer).generate_key_dict is MetaInformationObserver.generate_key_dict
+            for observer in key_generators
+        ):
+            self.key_parameters = frozenset(
+                parameter
+                for observer in key_generators
+                for parameter in observer.key_parameters  # type: ignore[attr-defined]
+            )
+        else:
+            self.key_parameters = None
+        self.call_observers = [observer for observer in observers if not observer.passive_call]
+        self.versioning = next(
+            (
+                (observer.version_field, observer.version_key)  # type: ignore[attr-defined]
+                for observer in observers
+                if getattr(observer, "version_field", None) is not None
+            ),
+            None,
+        )
+        self.compiled = True
+
+    @property
+    def passive(self) -> bool:
+        """Whether call events can skip the facade entirely."""
+        return self.compiled and not self.call_observers
+
     def generate_key_dict(self, key: str, **kwargs) -> Dict:
+        if self.key_parameters is not None:
+            if not self.key_parameters:
+                return {}
+            return {k: v for k, v in kwargs.items() if k in self.key_parameters}
         if self.observers is None:
             return {}
         key_dict: Dict = {}
         for observer in self.observers:
-            obs_key_dict = observer.generate_key_dict(key=key, **kwargs)
-            key_dict = {**key_dict, **obs_key_dict}
+            key_dict.update(observer.generate_key_dict(key=key, **kwargs))
 
         return key_dict
 
     def register_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
         if self.observers is None:
             return (key, {}, obj, None)
+        return self._register_event(self.observers, key, obj, **kwargs)
+
+    def register_lazy_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        """Run the observers that do not need the object, for an entry that is not imported yet."""
+        if self.observers is None:
+            return (key, {}, obj, None)
+        observers = [observer for observer in self.observers if not observer.requires_object]
+        return self._register_event(observers, key, obj, **kwargs)
+
+    def resolve_lazy_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        """Run the observers that were deferred by register_lazy_event, once the object is imported."""
+        if self.observers is None:
+            return (key, {}, obj, None)
+        observers = [observer for observer in self.observers if observer.requires_object]
+        return self._register_event(observers, key, obj, **kwargs)
+
+    def _register_event(
+        self, observers: List[RegistryObserver], key: str, obj: Any, **kwargs
+    ) -> Tuple[str, Dict, Any, Optional[Dict]]:
         errors = []
         key_dict: Dict = {}
         meta_dict: Dict = {}
-        for observer in self.observers:
+        metrics = self.metrics
+        for observer in observers:
+            started = perf_counter() if metrics is not None else 0.0
             try:
                 _, obs_key_dict, _, obs_meta_dict = observer.register_event(key=key, obj=obj, **kwargs)
-                key_dict = {**key_dict, **obs_key_dict}
-                meta_dict = {**meta_dict, **obs_meta_dict} if obs_meta_dict is not None else meta_dict
+                key_dict.update(obs_key_dict)
+                if obs_meta_dict is not None:
+                    meta_dict.update(obs_meta_dict)
             except Exception as e:
                 errors.append(f"{e}")
+            if metrics is not None:
+                metrics.record_observer("register", observer, perf_counter() - started)
         if len(errors) > 0 and self.skip_val is False:
             raise Exception("\n".join(errors))
         return (key, key_dict, obj, meta_dict)
 
     def call_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        observers = self.call_observers if self.compiled else self.observers
         if self.observers is None:
             return (key, {}, obj, None)
         errors = []
         key_dict: Dict = {}
         meta_dict: Dict = {}
-        for observer in self.observers:
+        metrics = self.metrics
+        for observer in observers or []:
+            started = perf_counter() if metrics is not None else 0.0
             try:
                 _, obs_key_dict, _, obs_meta_dict = observer.call_event(key=key, obj=obj, **kwargs)
-                key_dict = {**key_dict, **obs_key_dict}
-                meta_dict = {**meta_dict, **obs_meta_dict} if obs_meta_dict is not None else meta_dict
+                key_dict.update(obs_key_dict)
+                if obs_meta_dict is not None:
+                    meta_dict.update(obs_meta_dict)
             except Exception as e:
                 errors.append(f"{e}")
+            if metrics is not None:
+                metrics.record_observer("call", observer, perf_counter() - started)
         if len(errors) > 0 and self.skip_val is False:
             raise Exception("\n".join(errors))
         return (key, key_dict, obj, meta_dict)
@@ -1,7 +1,17 @@
 """Mediator pattern implementation."""
-from typing import Any, Dict, Optional, Tuple
+import threading
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
 
+from registry_factory.cache import ResolutionCache
 from registry_factory.index import HashTable
+from registry_factory.instances import InstanceCache
+from registry_factory.lazy import LazyObject
+from registry_factory.mapped import MappedIndex
+from registry_factory.metrics import RegistryMetrics
+from registry_factory.snapshot import add_entry
+from registry_factory.patterns.observer import PendingResult
+from registry_factory.utils import AmbiguousKeyError, CheckFailedError, LazyImportError
 from registry_factory.patterns.facade import ObserverFacade
 
 
@@ -9,31 +19,231 @@ class HashMediator:
     connection_hash: int
     hash_table: HashTable
     observer_facade: ObserverFacade
+    cache: Optional[ResolutionCache]
+    instances: Optional[InstanceCache]
+    mapped_index: Optional[MappedIndex]
+    partial_keys: bool
+    metrics: Optional[RegistryMetrics]
+    name: Optional[str]
 
     def __init__(
-        self, connection_hash: int, observer_facade: ObserverFacade, bitsize=256, max_generation=1000
+        self,
+        connection_hash: int,
+        observer_facade: ObserverFacade,
+        bitsize=256,
+        max_generation=1000,
+        cache: Optional[ResolutionCache] = None,
+        partial_keys: bool = False,
     ) -> None:
         self.connection_hash = connection_hash
         self.observer_facade = observer_facade
         self.hash_table = HashTable(bitsize, max_generation)
+        self.cache = cache
+        self.instances = None
+        self.mapped_index = None
+        self.partial_keys = partial_keys
+        self.pending_lock = threading.Lock()
+        self.metrics = None
+        self.name = None
 
     def generate_key_dict(self, key: str, **kwargs) -> Dict:
         return self.observer_facade.generate_key_dict(key=key, **kwargs)
 
     def register_event(self, key: str, obj: Any, **kwargs) -> None:
-        key_dict = self.generate_key_dict(key=key, **kwargs)
         (key, key_dict, obj, meta_dict) = self.observer_facade.register_event(key=key, obj=obj, **kwargs)
         self.hash_table.set(key, key_dict, obj, meta_dict)
 
+    def register_lazy_event(self, key: str, path: str, **kwargs) -> None:
+        obj = LazyObject(path, kwargs)
+        (key, _, obj, meta_dict) = self.observer_facade.register_lazy_event(key=key, obj=obj, **kwargs)
+        key_dict = self.generate_key_dict(key=key, **kwargs)
+        self.hash_table.set(key, key_dict, obj, meta_dict)
+
+    def register_many(self, entries: List[Tuple[str, Any, Dict]]) -> List[str]:
+        """Register a batch of (key, obj, kwargs) entries, returning all errors instead of raising."""
+        errors = []
+        staged = []
+        for key, obj, kwargs in entries:
+            try:
+                staged.append(self.observer_facade.register_event(key=key, obj=obj, **kwargs))
+            except Exception as e:
+                errors.append(f"{key}: {e}")
+        if errors:
+            return errors
+        try:
+            self.hash_table.set_many(staged)
+        except KeyError as e:
+            return [e.args[0]]
+        return []
+
+    def call_many(self, requests: List[Tuple[str, Dict]]) -> Tuple[List[Optional[Tuple[str, Dict, Any]]], List[str]]:
+        """Resolve a batch of (key, kwargs) requests, returning the (key, key_dict, obj) or None per request and
+        all errors."""
+        generate_key_dict = self.generate_key_dict
+        index = self.hash_table.index
+        index_key = self.hash_table.index_key
+        metrics = self.metrics
+        results: List[Optional[Tuple[str, Dict, Any]]] = []
+        errors = []
+        for key, kwargs in requests:
+            started = perf_counter() if metrics is not None else 0.0
+            try:
+                key_dict = generate_key_dict(key, **kwargs)
+                hash_value = index.get(index_key(key, key_dict))
+                if hash_value is None:
+                    hash_value = self._lookup(key, key_dict)
+                resolved_key, resolved_key_dict, obj, _ = self._resolve(key, key_dict, hash_value, kwargs)
+                results.append((resolved_key, resolved_key_dict, obj))
+            except Exception as e:
+                results.append(None)
+                errors.append(f"{key}: {e}")
+            if metrics is not None:
+                metrics.record_call(key, perf_counter() - started)
+        return results, errors
+
+    def set_metrics(self, metrics: Optional[RegistryMetrics]) -> None:
+        """Record metrics of call events and observers, or stop recording with None."""
+        self.metrics = metrics
+        self.observer_facade.metrics = metrics
+
     def call_event(self, key: str, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        metrics = self.metrics
+        if metrics is None:
+            return self._cached_call_event(key, kwargs)
+        started = perf_counter()
+        try:
+            return self._cached_call_event(key, kwargs)
+        finally:
+            metrics.record_call(key, perf_counter() - started)
+
+    def _cached_call_event(self, key: str, kwargs: Dict) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        if self.cache is None:
+            return self._call_event(key, **kwargs)
+
+        generation = self.hash_table.generation
+        cache_key = self.cache.make_key(key, kwargs)
+        result = self.cache.get(cache_key, generation)
+        if result is None:
+            result = self._call_event(key, **kwargs)
+            self.cache.set(cache_key, generation, result)
+        return result
+
+    def _call_event(self, key: str, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
         key_dict = self.generate_key_dict(key=key, **kwargs)
-        obj = self.hash_table.get(key, key_dict)
-        (key, key_dict, obj, meta_dict) = self.observer_facade.call_event(key=key, obj=obj, **kwargs)
+        hash_value = self._lookup(key, key_dict)
+        return self._resolve(key, key_dict, hash_value, kwargs)
+
+    def _lookup(self, key: str, key_dict: Dict) -> int:
+        try:
+            return self.hash_table.get_hash(key, key_dict)
+        except KeyError:
+            version_index = self.hash_table.version_index
+            if version_index is not None and version_index.is_specifier(key_dict.get(version_index.field)):
+                hash_value = version_index.resolve(
+                    key, key_dict[version_index.field], self.hash_table.slots, key_dict, partial=self.partial_keys
+                )
+                if hash_value is not None:
+                    return hash_value
+            if self.partial_keys and key_dict:
+                matches = self.hash_table.match(key, key_dict)
+                if len(matches) == 1:
+                    return matches[0]
+                if len(matches) > 1:
+                    candidates = ", ".join(str(self.hash_table.slots[hash_value][1]) for hash_value in matches)
+                    raise AmbiguousKeyError(f"{key}, {key_dict} matches several entries: {candidates}.")
+            if self.mapped_index is None:
+                raise
+            return self._lookup_mapped(key, key_dict)
+
+    def _lookup_mapped(self, key: str, key_dict: Dict) -> int:
+        """Copy an entry of the mapped index into the local table as a lazy object."""
+        entry = self.mapped_index.find(key, key_dict)  # type: ignore[union-attr]
+        if entry is None:
+            raise KeyError(f"{key}, {key_dict} not found in the registry.")
+        add_entry(self.hash_table, entry)
+        return self.hash_table.get_hash(entry["key"], entry["key_dict"])
+
+    def contains(self, key: str, key_dict: Dict) -> bool:
+        if self.hash_table.contains(key, key_dict):
+            return True
+        return self.mapped_index is not None and self.mapped_index.find(key, key_dict) is not None
+
+    def _resolve(
+        self, key: str, key_dict: Dict, hash_value: int, kwargs: Dict
+    ) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        obj = self.hash_table.data[hash_value]
+        # The key dict of the resolved entry, e.g. the actual version rather than a "latest" specifier.
+        key, key_dict = self.hash_table.slots[hash_value]
+        if isinstance(obj, LazyObject):
+            obj = self._load_lazy(key, hash_value, obj)
+        if hash_value in self.hash_table.pending:
+            self.resolve_pending(hash_value)
+        if self.observer_facade.passive:
+            return (key, key_dict, obj, None)
+        (_, _, obj, meta_dict) = self.observer_facade.call_event(key=key, obj=obj, **kwargs)
         return (key, key_dict, obj, meta_dict)
 
+    def _load_lazy(self, key: str, hash_value: int, lazy: LazyObject) -> Any:
+        """Import a lazy entry and run its deferred checks, raising failures as such rather than as a missing key."""
+        with lazy.lock:
+            current = self.hash_table.data.get(hash_value)
+            if current is not lazy:
+                return current
+            key_dict = self.hash_table.slots[hash_value][1]
+            try:
+                obj, meta_dict = lazy.load(), None
+            except Exception as e:
+                raise LazyImportError(f"{key}, {key_dict} cannot import {lazy.path}: {e!r}") from e
+            if lazy.deferred:
+                try:
+                    (_, _, obj, meta_dict) = self.observer_facade.resolve_lazy_event(key=key, obj=obj, **lazy.kwargs)
+                except Exception as e:
+                    raise CheckFailedError(f"{key}, {key_dict} failed a check: {e}") from e
+            self.hash_table.update(hash_value, obj, meta_dict)
+        return obj
+
+    def resolve_pending(self, hash_value: int) -> None:
+        """Block on the background checks of an entry and store their results as meta information.
+
+        The lock only guards reading and writing the meta information, so waiting on one entry's checks does
+        not hold up lookups of other entries.
+        """
+        with self.pending_lock:
+            if hash_value not in self.hash_table.pending:
+                return
+            key, key_dict = self.hash_table.slots[hash_value]
+            meta = self.hash_table.meta_dict[hash_value]
+        pending = {field: value for field, value in meta.items() if isinstance(value, PendingResult)}
+        try:
+            resolved = {field: value.resolve() for field, value in pending.items()}
+        except Exception as e:
+            raise CheckFailedError(f"{key}, {key_dict} failed a check: {e}") from e
+        with self.pending_lock:
+            # Another thread may have stored the results, or the entry changed, while waiting.
+            if hash_value in self.hash_table.pending and self.hash_table.meta_dict.get(hash_value) is meta:
+                self.hash_table.update(hash_value, self.hash_table.data[hash_value], resolved)
+
+    def wait_pending(self) -> List[str]:
+        """Resolve the background checks of all entries, returning the errors of the failed ones."""
+        errors = []
+        for hash_value in list(self.hash_table.pending):
+            try:
+                self.resolve_pending(hash_value)
+            except CheckFailedError as e:
+                errors.append(e.message)
+        return errors
+
+    def get_arguments(self, key: str, key_dict: Dict) -> Any:
+        hash_value = self._lookup(key, key_dict)
+        arguments = self.hash_table.arg_dict[hash_value]
+        if isinstance(arguments, LazyObject):
+            arguments = arguments.load()
+            self.hash_table.arg_dict[hash_value] = arguments
+        return arguments
+
     def get_meta(self, key: str, **kwargs) -> Dict:
         key_dict = self.generate_key_dict(key=key, **kwargs)
-        return self.hash_table.get_meta(key, key_dict)
+        return self.hash_table.meta_dict[self._lookup(key, key_dict)]
 
 
 class HashConnection:
@@ -1,11 +1,43 @@
 from abc import ABC, abstractmethod
 import inspect
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 import warnings
 from dataclasses import is_dataclass
 
+from registry_factory.tools import freeze
+
+
+class PendingResult:
+    """Meta information value that is still being computed in the background.
+
+    resolve blocks on the future and passes its result through on_result, which may raise.
+    """
+
+    def __init__(self, future: Future, on_result: Callable[[Any], Any]) -> None:
+        self.future = future
+        self.on_result = on_result
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def resolve(self) -> Any:
+        return self.on_result(self.future.result())
+
+    def __repr__(self) -> str:
+        return "PendingResult(done)" if self.done() else "PendingResult(pending)"
+
 
 class RegistryObserver(ABC):
+    passive_call: bool = False  # True when call_event never changes the outcome of a call
+    requires_object: bool = True  # False when register_event only inspects the key and kwargs
+    check_version: int = 1  # Bump when a change to the check invalidates its cached results
+
+    @property
+    def check_id(self) -> str:
+        """Identity of the check in persistent caches."""
+        return f"{type(self).__module__}.{type(self).__qualname__}:{self.check_version}"
+
     def generate_key_dict(self, key: str, **kwargs) -> Dict:
         return {}
 
@@ -19,28 +51,50 @@ class RegistryObserver(ABC):
 
 
 class MetaInformationObserver(RegistryObserver):
-    def __init__(self, meta_fields: Any, key_parameters: List[str], forced: bool = False):
+    """Observer storing meta information fields, optionally validating them when the registry is called.
+
+    call_validation sets how call events validate the fields:
+        "always": check every call, raising when forced and warning otherwise (default).
+        "once": check the first call of each (key, key_dict) only.
+        "register": only check on registration, calls skip the observer.
+        "strict": check every call and always raise.
+    """
+
+    CALL_VALIDATIONS = ("always", "once", "register", "strict")
+
+    requires_object = False
+
+    def __init__(
+        self, meta_fields: Any, key_parameters: List[str], forced: bool = False, call_validation: str = "always"
+    ):
         self.forced = forced
         if not is_dataclass(meta_fields):
             raise TypeError("Fields must be a dataclass.")
+        if call_validation not in self.CALL_VALIDATIONS:
+            raise ValueError(f"call_validation must be one of {', '.join(self.CALL_VALIDATIONS)}.")
         self.key_parameters = key_parameters
         self.meta_fields = meta_fields
         self.parameters = [p for p in inspect.signature(self.meta_fields).parameters]
+        self.required_fields = frozenset(self.parameters)
+        self.call_validation = call_validation
+        self._validated: Set[Hashable] = set()
+
+    @property
+    def passive_call(self) -> bool:  # type: ignore[override]
+        return self.call_validation == "register"
 
     def generate_key_dict(self, key: str, **kwargs) -> Dict:
         return {k: v for k, v in kwargs.items() if k in self.key_parameters}
 
-    def register_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
-        register_dict = {}
-        missing_fields = []
-        for p in self.parameters:
-            if p not in kwargs.keys():
-                missing_fields.append(p)
-            else:
-                register_dict[p] = kwargs[p]
+    def _missing_fields(self, kwargs: Dict) -> List[str]:
+        if self.required_fields <= kwargs.keys():
+            return []
+        return [p for p in self.parameters if p not in kwargs]
 
+    def register_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        missing_fields = self._missing_fields(kwargs)
         key_dict = self.generate_key_dict(key=key, **kwargs)
-        meta_dict = {k: v for k, v in register_dict.items() if k not in key_dict}
+        meta_dict = {p: kwargs[p] for p in self.parameters if p in kwargs and p not in key_dict}
 
         if missing_fields != [] and self.forced:
             raise ValueError(f"Information must have a {', '.join(missing_fields)} field.")
@@ -49,19 +103,21 @@ class MetaInformationObserver(RegistryObserver):
         return (key, key_dict, obj, meta_dict)
 
     def call_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
-        call_dict = {}
-        missing_fields = []
-        for p in self.parameters:
-            if p not in kwargs.keys():
-                missing_fields.append(p)
-            else:
-                call_dict[p] = kwargs[p]
-
         key_dict = self.generate_key_dict(key=key, **kwargs)
-        meta_dict = {k: v for k, v in call_dict.items() if k not in key_dict}
+        if self.call_validation == "register":
+            return (key, key_dict, obj, None)
+        if self.call_validation == "once":
+            validated_key = (key, freeze(key_dict))
+            if validated_key in self._validated:
+                return (key, key_dict, obj, None)
 
-        if missing_fields != [] and self.forced:
+        missing_fields = self._missing_fields(kwargs)
+        meta_dict = {p: kwargs[p] for p in self.parameters if p in kwargs and p not in key_dict}
+
+        if missing_fields != [] and (self.forced or self.call_validation == "strict"):
             raise ValueError(f"Information must have a {', '.join(missing_fields)} field.")
-        elif missing_fields != [] and not self.forced:
+        elif missing_fields != []:
             warnings.warn(f"Information should have a {', '.join(missing_fields)} field.")
+        if self.call_validation == "once":
+            self._validated.add(validated_key)
         return (key, key_dict, obj, meta_dict)
@@ -0,0 +1,173 @@
+"""Registration-time profiler that attributes startup cost to registries and plugin modules."""
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from registry_factory.patterns.mediator import HashMediator
+
+__all__ = ["RegistrationProfiler", "RegistrationRecord"]
+
+
+@dataclass
+class RegistrationRecord:
+    """One profiled registration.
+
+    gap is the wall time since the previous registration ended, which is mostly spent importing the module
+    that defines this object.
+    """
+
+    registry: str
+    key: str
+    module: str
+    total: float
+    gap: float
+    observers: Dict[str, float] = field(default_factory=dict)
+
+
+class _ObserverTimer:
+    """Stand-in for the facade metrics that collects the observer times of one registration."""
+
+    def __init__(self, metrics: Any) -> None:
+        self.metrics = metrics
+        self.times: Dict[str, float] = {}
+
+    def record_observer(self, event: str, observer: Any, seconds: float) -> None:
+        name = type(observer).__name__
+        self.times[name] = self.times.get(name, 0.0) + seconds
+        if self.metrics is not None:
+            self.metrics.record_observer(event, observer, seconds)
+
+
+def _module_of(obj: Any) -> str:
+    module = getattr(obj, "__module__", None)
+    if not isinstance(module, str):
+        module = type(obj).__module__
+    return module
+
+
+def _module_of_path(path: str) -> str:
+    return path.split(":", 1)[0] if ":" in path else path.rpartition(".")[0]
+
+
+class RegistrationProfiler:
+    """Opt-in profiler of HashMediator registrations.
+
+    While active, every register_event and register_lazy_event records the registry, the module defining the
+    object, the time spent in each observer and the wall time since the previous registration. Use it around
+    the imports that register plugins:
+
+        with RegistrationProfiler() as profiler:
+            import my_package.plugins
+        print(profiler.format_report())
+    """
+
+    _active: Optional["RegistrationProfiler"] = None
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.records: List[RegistrationRecord] = []
+        self._last: Optional[float] = None
+        self._originals: Dict[str, Any] = {}
+
+    def start(self) -> None:
+        with RegistrationProfiler._lock:
+            if RegistrationProfiler._active is not None:
+                raise RuntimeError("Another RegistrationProfiler is already active.")
+            RegistrationProfiler._active = self
+            self._originals = {
+                "register_event": HashMediator.register_event,
+                "register_lazy_event": HashMediator.register_lazy_event,
+            }
+            HashMediator.register_event = self._wrap(HashMediator.register_event, lazy=False)  # type: ignore
+            HashMediator.register_lazy_event = self._wrap(  # type: ignore
+                HashMediator.register_lazy_event, lazy=True
+            )
+        self._last = perf_counter()
+
+    def stop(self) -> None:
+        with RegistrationProfiler._lock:
+            if RegistrationProfiler._active is not self:
+                return
+            for name, original in self._originals.items():
+                setattr(HashMediator, name, original)
+            RegistrationProfiler._active = None
+
+    def __enter__(self) -> "RegistrationProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _wrap(self, original: Any, lazy: bool) -> Any:
+        profiler = self
+
+        def register_event(mediator: HashMediator, key: str, *args: Any, **kwargs: Any) -> None:
+            target = args[0] if args else kwargs.get("path" if lazy else "obj")
+            started = perf_counter()
+            facade = mediator.observer_facade
+            metrics = facade.metrics
+            timer = _ObserverTimer(metrics)
+            facade.metrics = timer  # type: ignore[assignment]
+            try:
+                original(mediator, key, *args, **kwargs)
+            finally:
+                facade.metrics = metrics
+                ended = perf_counter()
+                profiler.records.append(
+                    RegistrationRecord(
+                        registry=mediator.name or f"registry-{mediator.connection_hash}",
+                        key=key,
+                        module=_module_of_path(target) if lazy else _module_of(target),
+                        total=ended - started,
+                        gap=started - profiler._last if profiler._last is not None else 0.0,
+                        observers=timer.times,
+                    )
+                )
+                profiler._last = ended
+
+        return register_event
+
+    def report(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the registrations aggregated per registry and per module, most expensive first.
+
+        Registries are ranked by the time spent registering, modules by that time plus the time between
+        registrations spent importing them.
+        """
+        registries: Dict[str, Dict[str, Any]] = {}
+        modules: Dict[str, Dict[str, Any]] = {}
+        for record in self.records:
+            registry = registries.setdefault(
+                record.registry, {"registry": record.registry, "count": 0, "total": 0.0, "observers": {}}
+            )
+            registry["count"] += 1
+            registry["total"] += record.total
+            for observer, seconds in record.observers.items():
+                registry["observers"][observer] = registry["observers"].get(observer, 0.0) + seconds
+            module = modules.setdefault(
+                record.module, {"module": record.module, "count": 0, "register": 0.0, "import": 0.0, "total": 0.0}
+            )
+            module["count"] += 1
+            module["register"] += record.total
+            module["import"] += record.gap
+            module["total"] += record.total + record.gap
+        return {
+            "registries": sorted(registries.values(), key=lambda row: -row["total"]),
+            "modules": sorted(modules.values(), key=lambda row: -row["total"]),
+        }
+
+    def format_report(self, top: int = 20) -> str:
+        report = self.report()
+        lines = [f"{'registry':<32} {'count':>6} {'register ms':>12}  slowest observers"]
+        for row in report["registries"][:top]:
+            observers = sorted(row["observers"].items(), key=lambda item: -item[1])[:3]
+            slowest = ", ".join(f"{name} {seconds * 1e3:.2f}ms" for name, seconds in observers)
+            lines.append(f"{row['registry']:<32} {row['count']:>6} {row['total'] * 1e3:>12.2f}  {slowest}")
+        lines.append("")
+        lines.append(f"{'module':<48} {'count':>6} {'import ms':>10} {'register ms':>12}")
+        for row in report["modules"][:top]:
+            lines.append(
+                f"{row['module']:<48} {row['count']:>6} {row['import'] * 1e3:>10.2f} {row['register'] * 1e3:>12.2f}"
+            )
+        return "\n".join(lines)
@@ -1,18 +1,70 @@
 """Registry module for a codebase."""
+import copyreg
+import importlib
+import pickle
 import warnings
-from abc import ABC
-from dataclasses import dataclass, is_dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from abc import ABCMeta
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
-# from registry_factory.tracker import Tracker
+from registry_factory import mapped, snapshot
+from registry_factory.arguments import compile_arguments
+from registry_factory.instances import InstanceCache, freeze_arguments
+from registry_factory.metrics import MetricsSink, RegistryMetrics
 from registry_factory.patterns.mediator import HashMediator
+from registry_factory.tools import freeze
+from registry_factory.tracker import Tracker
 from registry_factory.typescripts import Dataclass
-from registry_factory.utils import RegistrationError, RegistrationWarning
+from registry_factory.utils import (
+    AmbiguousKeyError,
+    CheckFailedError,
+    LazyImportError,
+    RegistrationError,
+    RegistrationWarning,
+)
 
 __all__ = ["AbstractRegistry"]
 
+_tracker = Tracker()
 
-class AbstractRegistry(ABC):
+
+class RegistryMeta(ABCMeta):
+    """Metaclass that records the factory attribute a registry is assigned to, so it pickles by reference."""
+
+    _factory_ref: Optional[Tuple[str, str, str]] = None
+
+    def __set_name__(cls, owner: type, name: str) -> None:
+        if cls._factory_ref is None:
+            cls._factory_ref = (owner.__module__, owner.__qualname__, name)
+            mediator = getattr(cls, "mediator", None)
+            if mediator is not None:
+                mediator.name = name
+                if mediator.metrics is not None:
+                    mediator.metrics.name = name
+
+
+def _load_registry(module_name: str, qualname: str, name: str) -> "RegistryMeta":
+    """Resolve a pickled registry reference against the factory of the receiving process."""
+    owner = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        owner = getattr(owner, attribute)
+    return getattr(owner, name)
+
+
+def _reduce_registry(cls: "RegistryMeta") -> Any:
+    if cls._factory_ref is None:
+        if "<locals>" in cls.__qualname__:
+            raise pickle.PicklingError(f"{cls!r} is not assigned to a factory attribute and cannot be pickled.")
+        return cls.__qualname__
+    if "<locals>" in cls._factory_ref[1]:
+        raise pickle.PicklingError(f"The factory {cls._factory_ref[1]} is not importable, {cls!r} cannot be pickled.")
+    return (_load_registry, cls._factory_ref)
+
+
+copyreg.pickle(RegistryMeta, _reduce_registry)
+
+
+class AbstractRegistry(metaclass=RegistryMeta):
     """Abstract class to generate a registry."""
 
     _registry_hash: int
@@ -36,7 +88,7 @@ class AbstractRegistry(ABC):
     def __contains__(cls, key: str, **kwargs) -> bool:
         """Return True if the key is registered."""
         key_dict = cls.mediator.generate_key_dict(key=key, **kwargs)
-        return (key, key_dict) in cls.mediator.hash_table.slots.values()
+        return cls.mediator.contains(key, key_dict)
 
     @classmethod
     def __len__(cls) -> int:
@@ -67,7 +119,11 @@ class AbstractRegistry(ABC):
     @classmethod
     def keys(cls) -> List[Tuple[str, Dict]]:
         """Return a list of registered keys."""
-        return [(key, key_dict) for key, key_dict in cls.mediator.hash_table.slots.values()]
+        keys = [(key, key_dict) for key, key_dict in cls.mediator.hash_table.slots.values()]
+        if cls.mediator.mapped_index is not None:
+            table = cls.mediator.hash_table
+            keys += [full_key for full_key in cls.mediator.mapped_index.keys() if not table.contains(*full_key)]
+        return keys
 
     @classmethod
     def values(cls) -> List[Any]:
@@ -90,25 +146,117 @@ class AbstractRegistry(ABC):
         """Register the object to the key."""
         cls.register(key, **kwargs)(obj)
 
+    @classmethod
+    def register_lazy(cls, key: str, path: str, **kwargs) -> None:
+        """Register an import path to the key, importing the object on first use."""
+        cls.mediator.register_lazy_event(key=key, path=path, **kwargs)
+
     @classmethod
     def get(cls, key: str, default: Optional[Any] = None, **kwargs) -> Any:
         """Return the object registered to the key."""
+        metrics = cls.mediator.metrics
         try:
             key, key_dict, obj, _ = cls.mediator.call_event(key=key, **kwargs)
-            # Tracker().add(cls._registry_hash, key, key_dict)
+            if _tracker.enabled:
+                _tracker.add(cls, key, key_dict)
+        except (CheckFailedError, LazyImportError):
+            if metrics is not None:
+                metrics.record_get(key, "miss")
+            raise
         except Exception as e:
             if default is None:
-                raise RegistrationError(f"{key} is not registered.") from e
-            else:
-                warnings.warn(f"{key} is not registered. Returning default.", RegistrationWarning)
-                return default
+                if metrics is not None:
+                    metrics.record_get(key, "miss")
+                if isinstance(e, AmbiguousKeyError):
+                    raise
+                raise RegistrationError(f"{key} is not registered.{cls._suggestions(key)}") from e
+            if metrics is not None:
+                metrics.record_get(key, "default")
+            reason = e if isinstance(e, AmbiguousKeyError) else f"{key} is not registered."
+            warnings.warn(f"{reason} Returning default.", RegistrationWarning)
+            return default
+        if metrics is not None:
+            metrics.record_get(key, "hit")
         return obj
 
+    @classmethod
+    def register_many(cls, entries: Iterable[Union[Tuple[str, Any], Tuple[str, Any, Dict]]]) -> None:
+        """Register a batch of (key, obj) or (key, obj, kwargs) entries, all or nothing."""
+        batch = [(entry[0], entry[1], entry[2] if len(entry) > 2 else {}) for entry in entries]
+        errors = cls.mediator.register_many(batch)
+        if errors:
+            raise RegistrationError("\n".join(errors))
+
+    @classmethod
+    def get_many(cls, requests: Iterable[Union[str, Tuple[str, Dict]]]) -> List[Any]:
+        """Return the objects registered to a batch of keys or (key, kwargs) requests."""
+        batch = [(request, {}) if isinstance(request, str) else request for request in requests]
+        results, errors = cls.mediator.call_many(batch)
+        metrics = cls.mediator.metrics
+        if metrics is not None:
+            for (key, _), result in zip(batch, results):
+                metrics.record_get(key, "miss" if result is None else "hit")
+        if _tracker.enabled:
+            for result in results:
+                if result is not None:
+                    _tracker.add(cls, result[0], result[1])
+        if errors:
+            raise RegistrationError("\n".join(errors))
+        return [result[2] for result in results]  # type: ignore[index]
+
+    @classmethod
+    def _suggestions(cls, key: str) -> str:
+        key_columns = cls.mediator.hash_table.key_columns
+        if key in key_columns.keys:
+            return ""
+        suggestions = key_columns.suggest(key)
+        return f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+
+    @classmethod
+    def complete(cls, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Return the registered keys starting with the prefix, e.g. for tab completion."""
+        return cls.mediator.hash_table.key_columns.complete(prefix, limit)
+
+    @classmethod
+    def children(cls, prefix: str = "", separator: str = ".") -> List[str]:
+        """Return the next segments of the hierarchical keys under the prefix."""
+        return cls.mediator.hash_table.key_columns.children(prefix, separator)
+
     @classmethod
     def get_info(cls, key: str, **kwargs) -> Dict:
         """Return the meta information for the key."""
         return cls.mediator.get_meta(key, **kwargs)
 
+    @classmethod
+    def add_index(cls, *fields: str) -> None:
+        """Maintain inverted indexes over meta information fields to speed up query."""
+        for field in fields:
+            cls.mediator.hash_table.add_meta_index(field)
+
+    @classmethod
+    def query(cls, **conditions: Any) -> List[Tuple[str, Dict]]:
+        """Return the keys whose meta information (or key dict) matches all conditions.
+
+        Conditions are values to compare with, or predicates called with the field value.
+        """
+        table = cls.mediator.hash_table
+        return [table.slots[hash_value] for hash_value in table.query(conditions)]
+
+    @classmethod
+    def variants(cls, key: str, **kwargs) -> List[Tuple[str, Dict]]:
+        """Return all registered key dicts of the key that contain the given key parameters."""
+        table = cls.mediator.hash_table
+        partial_key_dict = cls.mediator.generate_key_dict(key=key, **kwargs)
+        return [table.slots[hash_value] for hash_value in table.match(key, partial_key_dict)]
+
+    @classmethod
+    def versions(cls, key: str) -> List[str]:
+        """Return the registered versions of the key, in ascending order."""
+        version_index = cls.mediator.hash_table.version_index
+        if version_index is None:
+            raise RegistrationError("The registry has no versioning.")
+        return version_index.versions(key)
+
     @classmethod
     def show_choices(cls) -> List[Tuple[str, Dict]]:
         """Returns the indexes of all registered objects."""
@@ -118,7 +266,7 @@ class AbstractRegistry(ABC):
     def check_choice(cls, key: str, **kwargs) -> bool:
         """Checks if a choice is valid and returns a bool."""
         key_dict = cls.mediator.generate_key_dict(key=key, **kwargs)
-        if (key, key_dict) not in cls.mediator.hash_table.slots.values():
+        if not cls.mediator.contains(key, key_dict):
             warnings.warn(RegistrationWarning(f"{key} is not a valid choice."))
             return False
         return True
@@ -127,13 +275,182 @@ class AbstractRegistry(ABC):
     def validate_choice(cls, key: str, **kwargs) -> None:
         """Checks if a choice is valid and stops if not."""
         key_dict = cls.mediator.generate_key_dict(key=key, **kwargs)
-        if (key, key_dict) not in cls.mediator.hash_table.slots.values():
-            raise RegistrationError(f"{key} is not a valid choice.")
+        if not cls.mediator.contains(key, key_dict):
+            raise RegistrationError(f"{key} is not a valid choice.{cls._suggestions(key)}")
 
     @classmethod
     def reset(cls):
         """Reset the registry."""
         cls.mediator.hash_table.clear()
+        if cls.mediator.instances is not None:
+            cls.mediator.instances.clear()
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, int]:
+        """Return the hit, miss and size counters of the resolution cache."""
+        if cls.mediator.cache is None:
+            raise RegistrationError("The resolution cache is not enabled for this registry.")
+        return cls.mediator.cache.info()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the resolution cache and its counters."""
+        if cls.mediator.cache is not None:
+            cls.mediator.cache.clear()
+
+    @classmethod
+    def get_instance(cls, key: str, args: Optional[Any] = None, cache_instance: bool = True, **kwargs) -> Any:
+        """Return an instance of the object registered to the key, constructed once per distinct arguments.
+
+        The arguments are a dataclass instance, a config dict built with build_arguments, or None for the
+        defaults of the registered argument dataclass. Their fields are passed as keyword arguments. Instances
+        are cached per (key, key_dict, arguments) unless cache_instance is False or the entry is excluded.
+        """
+        metrics = cls.mediator.metrics
+        try:
+            key, key_dict, obj, _ = cls.mediator.call_event(key=key, **kwargs)
+        except Exception as e:
+            if metrics is not None:
+                metrics.record_get(key, "miss")
+            if isinstance(e, (AmbiguousKeyError, CheckFailedError, LazyImportError)):
+                raise
+            raise RegistrationError(f"{key} is not registered.{cls._suggestions(key)}") from e
+        if metrics is not None:
+            metrics.record_get(key, "hit")
+        if _tracker.enabled:
+            _tracker.add(cls, key, key_dict)
+        try:
+            argument_class = cls.mediator.get_arguments(key, key_dict)
+        except KeyError:
+            argument_class = None
+        if argument_class is not None and not isinstance(args, argument_class):
+            if args is not None and not isinstance(args, Mapping):
+                raise TypeError(
+                    f"{key} expects arguments of type {argument_class.__name__} or a config dict, "
+                    f"got {type(args).__name__}."
+                )
+            args = compile_arguments(argument_class).build({} if args is None else args)
+
+        def create() -> Any:
+            if args is None:
+                return obj()
+            if is_dataclass(args):
+                return obj(**{field.name: getattr(args, field.name) for field in fields(args) if field.init})
+            return obj(**args)
+
+        instances = cls.mediator.instances
+        if instances is None:
+            instances = cls.configure_instances()
+        entry_key = (key, freeze(key_dict))
+        if not cache_instance or entry_key in instances.excluded:
+            return create()
+        cache_key = entry_key + (freeze_arguments(args),)
+        return instances.get_or_create(cache_key, (obj, argument_class), create)
+
+    @classmethod
+    def configure_instances(
+        cls,
+        max_entries: Optional[int] = 128,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> InstanceCache:
+        """Replace the instance cache of get_instance, dropping the cached instances.
+
+        Instances are evicted least recently used first beyond max_entries or max_bytes, as measured by sizeof,
+        and expire ttl seconds after construction.
+        """
+        instances = InstanceCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, sizeof=sizeof)
+        if cls.mediator.instances is not None:
+            instances.excluded = cls.mediator.instances.excluded
+        cls.mediator.instances = instances
+        return instances
+
+    @classmethod
+    def exclude_instances(cls, key: str, **kwargs) -> None:
+        """Construct a new instance of the entry on every get_instance instead of caching it."""
+        key, key_dict, _, _ = cls.mediator.call_event(key=key, **kwargs)
+        instances = cls.mediator.instances if cls.mediator.instances is not None else cls.configure_instances()
+        instances.exclude((key, freeze(key_dict)))
+
+    @classmethod
+    def include_instances(cls, key: str, **kwargs) -> None:
+        """Cache the instances of an entry excluded with exclude_instances again."""
+        key, key_dict, _, _ = cls.mediator.call_event(key=key, **kwargs)
+        if cls.mediator.instances is not None:
+            cls.mediator.instances.include((key, freeze(key_dict)))
+
+    @classmethod
+    def instance_cache_info(cls) -> Dict[str, int]:
+        """Return the hit, miss, eviction, expiration, size and bytes counters of the instance cache."""
+        if cls.mediator.instances is None:
+            return InstanceCache().info()
+        return cls.mediator.instances.info()
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Drop the cached instances and reset the counters of the instance cache."""
+        if cls.mediator.instances is not None:
+            cls.mediator.instances.clear()
+
+    @classmethod
+    def wait_checks(cls) -> None:
+        """Block until the background checks of all entries are done, raising on the failed forced ones."""
+        errors = cls.mediator.wait_pending()
+        if errors:
+            raise RegistrationError("\n".join(errors))
+
+    @classmethod
+    def registry_name(cls) -> str:
+        """Return the name of the factory attribute holding the registry, or its class name."""
+        return cls._factory_ref[2] if cls._factory_ref is not None else cls.__name__
+
+    @classmethod
+    def enable_metrics(cls, sink: Optional[MetricsSink] = None) -> RegistryMetrics:
+        """Start recording get counts, call latency and observer time, optionally passing them to a sink."""
+        metrics = cls.mediator.metrics
+        if metrics is None:
+            metrics = RegistryMetrics(cls.registry_name())
+            cls.mediator.set_metrics(metrics)
+        if sink is not None:
+            metrics.add_sink(sink)
+        return metrics
+
+    @classmethod
+    def disable_metrics(cls) -> None:
+        """Stop recording metrics, discarding the recorded ones."""
+        cls.mediator.set_metrics(None)
+
+    @classmethod
+    def metrics_snapshot(cls) -> Dict[str, Any]:
+        """Return the recorded metrics as a dict of plain values."""
+        if cls.mediator.metrics is None:
+            raise RegistrationError("Metrics are not enabled for this registry.")
+        return cls.mediator.metrics.snapshot()
+
+    @classmethod
+    def dump_snapshot(cls, path: str) -> None:
+        """Write the registry index to a file that load_snapshot can read without importing any module."""
+        cls.wait_checks()
+        snapshot.dump(cls.mediator.hash_table, path)
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> int:
+        """Load a registry index written by dump_snapshot, returning the number of added entries."""
+        return snapshot.load(cls.mediator.hash_table, path)
+
+    @classmethod
+    def export_index(cls, path: str) -> None:
+        """Write the registry index to a binary file that worker processes can attach to with attach_index."""
+        cls.wait_checks()
+        mapped.export_index(cls.mediator.hash_table, path)
+
+    @classmethod
+    def attach_index(cls, path: str) -> None:
+        """Serve lookups from a memory-mapped index, importing objects lazily on first use."""
+        if cls.mediator.mapped_index is not None:
+            cls.mediator.mapped_index.close()
+        cls.mediator.mapped_index = mapped.MappedIndex(path)
 
     @classmethod
     def register_arguments(cls, key: str, **kwargs) -> Callable:
@@ -147,6 +464,7 @@ class AbstractRegistry(ABC):
                     raise RegistrationError("The argument class must be a dataclass.")
                 else:
                     warnings.warn(RegistrationWarning("The argument class has been converted to a dataclass."))
+            compile_arguments(argument_class)
             key_dict = cls.mediator.generate_key_dict(key=key, **kwargs)
             cls.mediator.hash_table.set_arguments(key, key_dict, argument_class)
             return argument_class
@@ -157,7 +475,23 @@ class AbstractRegistry(ABC):
     def get_arguments(cls, key: str, key_dict: Optional[Dict] = None, **kwargs) -> Dataclass:
         """Return the arguments registered to the key."""
         key_dict = cls.mediator.generate_key_dict(key=key, **kwargs) if key_dict is None else key_dict
-        return cls.mediator.hash_table.get_arguments(key, key_dict)
+        return cls.mediator.get_arguments(key, key_dict)
+
+    @classmethod
+    def build_arguments(cls, key: str, config: Dict[str, Any], key_dict: Optional[Dict] = None, **kwargs) -> Any:
+        """Return the arguments registered to the key, built and validated from a config dict.
+
+        Values are coerced to the annotated field types and nested dataclasses are built from nested dicts.
+        Raises an ArgumentValidationError listing every invalid field.
+        """
+        return compile_arguments(cls.get_arguments(key, key_dict, **kwargs)).build(config)
+
+    @classmethod
+    def build_arguments_many(
+        cls, key: str, configs: Iterable[Dict[str, Any]], key_dict: Optional[Dict] = None, **kwargs
+    ) -> List[Any]:
+        """Return the arguments registered to the key built from each config, raising the errors of all at once."""
+        return compile_arguments(cls.get_arguments(key, key_dict, **kwargs)).build_many(configs)
 
     # Legacy methods
     @classmethod
@@ -0,0 +1,95 @@
+"""Persistent snapshots of a registry index for warm starts."""
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from registry_factory.index import HashTable
+from registry_factory.lazy import LazyObject, import_path_of
+from registry_factory.utils import RegistrationError
+
+__all__ = ["add_entry", "decode_hook", "dump", "encode", "load", "snapshot_entries"]
+
+SNAPSHOT_VERSION = 1
+TUPLE_TAG = "__tuple__"
+
+
+def encode(value: Any) -> Any:
+    """Return a JSON-compatible copy of a value in which tuples are tagged, so they are not loaded as lists."""
+    if isinstance(value, tuple):
+        return {TUPLE_TAG: [encode(item) for item in value]}
+    if isinstance(value, list):
+        return [encode(item) for item in value]
+    if isinstance(value, dict):
+        return {k: encode(v) for k, v in value.items()}
+    return value
+
+
+def decode_hook(obj: Dict) -> Any:
+    """JSON object hook restoring the tuples tagged by encode."""
+    if len(obj) == 1 and TUPLE_TAG in obj:
+        return tuple(obj[TUPLE_TAG])
+    return obj
+
+
+def _path_or_none(obj: Any, key: str, key_dict: Dict, kind: str) -> Optional[str]:
+    if obj is None:
+        return None
+    try:
+        return import_path_of(obj)
+    except ImportError as e:
+        raise RegistrationError(f"The {kind} of {key}, {key_dict} cannot be snapshotted: {e}") from e
+
+
+def snapshot_entries(table: HashTable) -> List[Dict]:
+    """Return the JSON-compatible entries of a hash table, one per slot."""
+    entries = []
+    for hash_value, (key, key_dict) in table.slots.items():
+        obj = table.data.get(hash_value)
+        entry = {
+            "key": key,
+            "key_dict": key_dict,
+            "meta": table.meta_dict.get(hash_value),
+            "object": _path_or_none(obj, key, key_dict, "object"),
+            "arguments": _path_or_none(table.arg_dict.get(hash_value), key, key_dict, "arguments"),
+        }
+        if isinstance(obj, LazyObject) and obj.deferred:
+            entry["kwargs"] = obj.kwargs
+        entries.append(entry)
+    return entries
+
+
+def dump(table: HashTable, path: str) -> None:
+    """Write the index of a hash table to a compact JSON file."""
+    snapshot = {"version": SNAPSHOT_VERSION, "entries": encode(snapshot_entries(table))}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+    except TypeError as e:
+        os.remove(tmp_path)
+        raise RegistrationError(f"The registry index is not serializable: {e}") from e
+    os.replace(tmp_path, path)
+
+
+def load(table: HashTable, path: str) -> int:
+    """Add the entries of a snapshot to a hash table as lazy objects, skipping existing entries."""
+    with open(path) as f:
+        snapshot = json.load(f, object_hook=decode_hook)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise RegistrationError(f"Unsupported snapshot version {snapshot.get('version')} in {path}.")
+
+    return sum(add_entry(table, entry) for entry in snapshot["entries"])
+
+
+def add_entry(table: HashTable, entry: Dict) -> bool:
+    """Add a snapshot entry to a hash table as a lazy object, returning whether an object was added."""
+    key, key_dict = entry["key"], entry["key_dict"]
+    index_key = table.index_key(key, key_dict)
+    added = False
+    if entry["object"] is not None and table.index.get(index_key) not in table.data:
+        obj = LazyObject(entry["object"], entry.get("kwargs"), deferred="kwargs" in entry)
+        table.set(key, key_dict, obj, entry["meta"])
+        added = True
+    if entry["arguments"] is not None and table.index.get(index_key) not in table.arg_dict:
+        table.set_arguments(key, key_dict, LazyObject(entry["arguments"]))  # type: ignore[arg-type]
+    return added
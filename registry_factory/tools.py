@@ -1,8 +1,8 @@
 """Generic helper tools."""
 import functools
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Hashable, List
 
-__all__ = ["omit_from_dict", "compose", "convert_dict_names_to_lower", "convert_dict_names_to_upper"]
+__all__ = ["omit_from_dict", "compose", "convert_dict_names_to_lower", "convert_dict_names_to_upper", "freeze"]
 
 
 def omit_from_dict(dict: Dict, omit_keys: List[str]) -> Dict:
@@ -20,3 +20,20 @@ def convert_dict_names_to_lower(dict: Dict[str, Any]) -> Dict[str, Any]:
 
 def convert_dict_names_to_upper(dict: Dict[str, Any]) -> Dict[str, Any]:
     return {k.upper(): v for k, v in dict.items()}
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert a (nested) value into a hashable form that compares like the original."""
+    if isinstance(value, dict):
+        return frozenset((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return (list, tuple(freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    return value
@@ -1,21 +1,158 @@
 """Call tracker."""
-
-from typing import Dict, Optional, Set
+import csv
+import itertools
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple
 
 from registry_factory.patterns.metacoding import Singleton
+from registry_factory.tools import freeze
 
 __all__ = ["Tracker"]
 
+CallRecord = Tuple[float, Any, str, Dict]
+
+
+def _registry_name(registry: Any) -> str:
+    factory_ref = getattr(registry, "_factory_ref", None)
+    if factory_ref is None:
+        return getattr(registry, "__qualname__", str(registry))
+    return f"{factory_ref[1]}.{factory_ref[2]}"
+
 
 class Tracker(Singleton):
-    called: Set[Dict] = set()
+    """Usage log of registry calls.
+
+    Keeps the most recent calls in a fixed-size ring buffer and a count per (registry, key, key_dict). Calls
+    are appended without locking and aggregated into the counts once per capacity calls or when read. With
+    sample_every=n only every n-th call is recorded, counting for n calls. Tracking is off until enabled, and
+    registries are held by weak reference so tracking them does not keep them alive.
+    Arguments given to later constructions are applied to the existing tracker.
+    """
+
+    def __init__(
+        self, capacity: Optional[int] = None, sample_every: Optional[int] = None, enabled: Optional[bool] = None
+    ) -> None:
+        if not getattr(self, "_initialized", False):
+            self._initialized = True
+            self.enabled = False
+            self.lock = threading.Lock()
+            self.configure(capacity=4096, sample_every=1)
+        self.configure(capacity=capacity, sample_every=sample_every, enabled=enabled)
+
+    def configure(
+        self, capacity: Optional[int] = None, sample_every: Optional[int] = None, enabled: Optional[bool] = None
+    ) -> None:
+        """Change the ring buffer capacity, the sampling interval or whether calls are tracked at all."""
+        with self.lock:
+            if capacity is not None:
+                self.recent: Deque[CallRecord] = deque(getattr(self, "recent", ()), maxlen=capacity)
+            if sample_every is not None:
+                if sample_every < 1:
+                    raise ValueError("sample_every must be at least 1.")
+                if hasattr(self, "counts"):
+                    self._aggregate()
+                self.sample_every = sample_every
+                self._ticks = itertools.count()
+            if enabled is not None:
+                self.enabled = enabled
+            if not hasattr(self, "counts"):
+                self.pending: Deque[Tuple[weakref.ref, str, Dict]] = deque()
+                self.counts: Dict[Tuple[weakref.ref, str, Hashable], int] = {}
+                self.key_dicts: Dict[Tuple[weakref.ref, str, Hashable], Dict] = {}
+
+    def add(self, registry: Any, key: str, key_dict: Optional[Dict]) -> None:
+        if self.sample_every > 1 and next(self._ticks) % self.sample_every:
+            return
+        key_dict = key_dict or {}
+        registry_ref = weakref.ref(registry)
+        self.recent.append((time.time(), registry_ref, key, key_dict))
+        # Appending to a deque is atomic, counts are aggregated in batches by whoever gets the lock.
+        self.pending.append((registry_ref, key, key_dict))
+        if len(self.pending) >= self.recent.maxlen and self.lock.acquire(blocking=False):  # type: ignore[operator]
+            try:
+                self._aggregate()
+            finally:
+                self.lock.release()
+
+    def _aggregate(self) -> None:
+        counts, key_dicts, pending = self.counts, self.key_dicts, self.pending
+        for _ in range(len(pending)):
+            registry_ref, key, key_dict = pending.popleft()
+            try:
+                frozen = frozenset(key_dict.items())
+            except TypeError:
+                frozen = freeze(key_dict)
+            full_key = (registry_ref, key, frozen)
+            count = counts.get(full_key)
+            if count is None:
+                key_dicts[full_key] = key_dict
+                count = 0
+            counts[full_key] = count + self.sample_every
 
-    def add(self, registry: int, key: str, key_dict: Optional[Dict]) -> None:
-        self.called.add({registry: (key, key_dict)})
+    def get(self) -> List[Tuple[Any, str, Dict, int]]:
+        """Return the (registry, key, key_dict, count) records of all tracked calls, most called first."""
+        with self.lock:
+            self._aggregate()
+            records = []
+            for full_key, count in list(self.counts.items()):
+                registry = full_key[0]()
+                if registry is None:  # The registry was garbage collected.
+                    del self.counts[full_key]
+                    del self.key_dicts[full_key]
+                    continue
+                records.append((registry, full_key[1], self.key_dicts[full_key], count))
+        return sorted(records, key=lambda record: -record[3])
 
-    def get(self) -> Set:
-        return self.called
+    def get_recent(self) -> List[CallRecord]:
+        """Return the (time, registry, key, key_dict) records in the ring buffer of live registries, oldest first."""
+        records = []
+        for called, registry_ref, key, key_dict in list(self.recent):
+            registry = registry_ref()
+            if registry is not None:
+                records.append((called, registry, key, key_dict))
+        return records
+
+    def clear(self) -> None:
+        with self.lock:
+            self.recent.clear()
+            self.pending.clear()
+            self.counts.clear()
+            self.key_dicts.clear()
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Return the tracked calls as rows of plain values."""
+        return [
+            {"registry": _registry_name(registry), "key": key, "key_dict": key_dict, "count": count}
+            for registry, key, key_dict, count in self.get()
+        ]
+
+    def export_json(self, path: str) -> None:
+        """Write the tracked calls to a JSON file. "{pid}" in the path is replaced by the process id."""
+        _atomic_write(path.format(pid=os.getpid()), lambda f: json.dump(self.rows(), f, default=str, indent=1))
+
+    def export_csv(self, path: str) -> None:
+        """Write the tracked calls to a CSV file. "{pid}" in the path is replaced by the process id."""
+
+        def write(f: Any) -> None:
+            writer = csv.DictWriter(f, fieldnames=["registry", "key", "key_dict", "count"])
+            writer.writeheader()
+            for row in self.rows():
+                writer.writerow({**row, "key_dict": json.dumps(row["key_dict"], default=str, sort_keys=True)})
+
+        _atomic_write(path.format(pid=os.getpid()), write)
 
     def show(self) -> None:
-        for registry, full_key in self.called:
-            print(f"{registry}: {full_key}")
+        for row in self.rows():
+            print(f"{row['registry']}: {row['key']} {row['key_dict']} ({row['count']} calls)")
+
+
+def _atomic_write(path: str, write: Any) -> None:
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", newline="") as f:
+        write(f)
+    os.replace(tmp_path, path)
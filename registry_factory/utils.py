@@ -1,4 +1,5 @@
 """Utilities for the registry_factory package."""
+from typing import List
 
 
 class RegistrationError(Exception):
@@ -14,6 +15,27 @@ class RegistrationError(Exception):
         return f"RegistrationError: {self.message}"
 
 
+class AmbiguousKeyError(RegistrationError):
+    """Raised when a partial key dict matches more than one registered entry."""
+
+
+class CheckFailedError(RegistrationError):
+    """Raised when a check that ran in the background fails for a forced observer."""
+
+
+class LazyImportError(RegistrationError):
+    """Raised when the import path of a lazily registered entry cannot be imported."""
+
+
+class ArgumentValidationError(RegistrationError):
+    """Raised when config dicts do not match an argument dataclass, listing every error found."""
+
+    def __init__(self, errors: List[str]):
+        """Initialize the ArgumentValidationError."""
+        super().__init__(f"{len(errors)} invalid argument(s):\n  " + "\n  ".join(errors))
+        self.errors = errors
+
+
 class RegistrationWarning(Warning):
     """Registration warning."""
 
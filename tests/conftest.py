@@ -0,0 +1,19 @@
+"""Shared fixtures of the test cases.
+Author: PeterHartog
+"""
+from typing import Any, Callable
+
+import pytest
+
+from registry_factory.factory import Factory
+
+
+@pytest.fixture
+def make_registry() -> Callable[..., Any]:
+    """Return a function creating an unshared registry, with the given checks, on a new factory."""
+
+    def make(*checks: Any, name: str = "TestRegistry", **kwargs: Any) -> Any:
+        factory = type("_TestFactory", (Factory,), {name: Factory.create_registry(checks=list(checks), **kwargs)})
+        return getattr(factory, name)
+
+    return make
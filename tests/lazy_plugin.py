@@ -0,0 +1,19 @@
+"""Plugin module imported lazily by the lazy registration tests."""
+
+
+class Plugin:
+    """Plugin following the test pattern."""
+
+    def hello_world(self):
+        """Hello world."""
+        print("Hello world")
+
+
+class WrongPlugin:
+    """Plugin not following the test pattern."""
+
+
+class PluginArguments:
+    """Arguments of the plugin."""
+
+    size: int = 1
@@ -0,0 +1,25 @@
+"""Plugin module with postponed evaluation of annotations, used by the factory pattern tests."""
+from __future__ import annotations
+
+
+def add(x: int, y: int = 0) -> int:
+    """Add two numbers."""
+    return x + y
+
+
+def wrong(x: str, y: int = 0) -> int:
+    """Function with a different parameter annotation."""
+    return 0
+
+
+def unresolvable(x: Undefined, y: int = 0) -> int:  # noqa: F821
+    """Function with an annotation that cannot be resolved."""
+    return 0
+
+
+class Plugin:
+    """Plugin with an annotated method."""
+
+    def add(self, x: int, y: int = 0) -> int:
+        """Add two numbers."""
+        return x + y
@@ -0,0 +1,119 @@
+"""Test cases for Registry background checks.
+Author: PeterHartog
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from registry_factory.checks.testing import Testing as _Testing
+from registry_factory.patterns.observer import PendingResult
+from registry_factory.utils import CheckFailedError, RegistrationError
+from tests import lazy_plugin
+
+release = threading.Event()
+
+
+def blocking_test_module(key: str, obj: Any, **kwargs):
+    release.wait(timeout=5)
+    assert obj == "test", "Name is not test"
+
+
+def slow_test_module(key: str, obj: Any, **kwargs):
+    if obj == "slow":
+        release.wait(timeout=5)
+
+
+class TestAsyncChecks:
+    """Test cases for asynchronous Testing."""
+
+    def setup_method(self):
+        release.clear()
+
+    @pytest.fixture
+    def async_registry(self, make_registry):
+        """Return a function creating a registry with an asynchronous Testing check."""
+
+        def make(forced: bool) -> Any:
+            return make_registry(_Testing(test_module=blocking_test_module, forced=forced, asynchronous=True))
+
+        return make
+
+    def test_register_does_not_block(self, async_registry):
+        """Registration returns while the check is still running."""
+        registry = async_registry(forced=True)
+        registry.register_prebuilt(key="name", obj="test")
+        assert isinstance(registry.get_info("name")["passed_test"], PendingResult)
+        release.set()
+        assert registry.get("name") == "test"
+        assert registry.get_info("name")["passed_test"] is True
+
+    def test_forced_failure_raises_at_resolution(self, async_registry):
+        """A failed forced check raises when the entry is resolved."""
+        registry = async_registry(forced=True)
+        registry.register_prebuilt(key="name", obj="test")
+        registry.register_prebuilt(key="wrong", obj="not_test")
+        release.set()
+        assert registry.get("name") == "test"
+        with pytest.raises(CheckFailedError):
+            registry.get("wrong")
+        with pytest.raises(CheckFailedError):
+            registry.get("wrong", default="fallback")
+
+    def test_unforced_failure_warns(self, async_registry):
+        """A failed unforced check warns and records the failure."""
+        registry = async_registry(forced=False)
+        registry.register_prebuilt(key="wrong", obj="not_test")
+        release.set()
+        with pytest.warns(UserWarning):
+            assert registry.get("wrong") == "not_test"
+        assert registry.get_info("wrong")["passed_test"] is False
+
+    def test_wait_checks(self, async_registry):
+        """wait_checks resolves all entries and aggregates the failures."""
+        registry = async_registry(forced=True)
+        registry.register_prebuilt(key="name", obj="test")
+        registry.register_prebuilt(key="wrong", obj="not_test")
+        release.set()
+        with pytest.raises(RegistrationError, match="wrong"):
+            registry.wait_checks()
+        assert registry.get_info("name")["passed_test"] is True
+        assert registry.mediator.hash_table.pending == {registry.mediator.hash_table.get_hash("wrong", {})}
+
+    def test_custom_executor(self, make_registry):
+        """A given executor runs the checks."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        registry = make_registry(_Testing(test_module=blocking_test_module, asynchronous=True, executor=executor))
+
+        release.set()
+        registry.register_prebuilt(key="name", obj="test")
+        registry.wait_checks()
+        assert registry.get_info("name")["passed_test"] is True
+        executor.shutdown()
+
+    def test_resolution_is_per_entry(self, make_registry):
+        """Resolving an entry does not wait for the checks of another entry."""
+        executor = ThreadPoolExecutor(max_workers=2)
+        registry = make_registry(_Testing(test_module=slow_test_module, asynchronous=True, executor=executor))
+        registry.register_prebuilt(key="slow", obj="slow")
+        registry.register_prebuilt(key="fast", obj="fast")
+        registry.mediator.hash_table.meta_dict[registry.mediator.hash_table.get_hash("fast", {})][
+            "passed_test"
+        ].future.result(timeout=5)
+        waiting = threading.Thread(target=registry.get, args=("slow",))
+        waiting.start()
+
+        assert registry.get("fast") == "fast"
+        assert waiting.is_alive()
+        release.set()
+        waiting.join()
+        assert registry.get_info("slow")["passed_test"] is True
+        executor.shutdown()
+
+    def test_export_index_waits(self, make_registry, tmp_path):
+        """Exporting the index waits for the checks instead of failing on pending results."""
+        registry = make_registry(_Testing(test_module=slow_test_module, asynchronous=True))
+        registry.register_prebuilt(key="plugin", obj=lazy_plugin.Plugin)
+        registry.export_index(str(tmp_path / "index.bin"))
+        assert registry.get_info("plugin")["passed_test"] is True
@@ -0,0 +1,57 @@
+"""Test cases for the batch Registry methods.
+Author: PeterHartog
+"""
+import pytest
+
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+from registry_factory.utils import RegistrationError
+
+
+class TestBatchRegistry:
+    """Test cases for register_many and get_many."""
+
+    class _TestFactory(Factory):
+        TestRegistry = Factory.create_registry(shared=False)
+        VersionedRegistry = Factory.create_registry(shared=False, checks=[Versioning(forced=True)])
+
+    def test_register_many(self):
+        """Test registering and getting a batch."""
+        self._TestFactory.TestRegistry.register_many([("batch_1", 1), ("batch_2", 2)])
+
+        assert self._TestFactory.TestRegistry.get_many(["batch_1", ("batch_2", {})]) == [1, 2]
+
+    def test_register_many_kwargs(self):
+        """Test registering and getting a batch with key parameters."""
+        self._TestFactory.VersionedRegistry.register_many(
+            [("batch", 1, {"version": "1", "date": "-"}), ("batch", 2, {"version": "2", "date": "-"})]
+        )
+
+        assert self._TestFactory.VersionedRegistry.get_many(
+            [("batch", {"version": "2", "date": "-"}), ("batch", {"version": "1", "date": "-"})]
+        ) == [2, 1]
+
+    def test_register_many_is_atomic(self):
+        """Test that a batch with a duplicate registers nothing."""
+        with pytest.raises(RegistrationError):
+            self._TestFactory.TestRegistry.register_many([("atomic_1", 1), ("atomic_1", 2)])
+
+        with pytest.raises(RegistrationError):
+            self._TestFactory.TestRegistry.get("atomic_1")
+
+    def test_register_many_errors(self):
+        """Test that all observer errors are reported together."""
+        with pytest.raises(RegistrationError) as e:
+            self._TestFactory.VersionedRegistry.register_many([("error_1", 1), ("error_2", 2)])
+
+        assert "error_1" in str(e.value) and "error_2" in str(e.value)
+
+    def test_get_many_errors(self):
+        """Test that all missing keys are reported together."""
+        self._TestFactory.TestRegistry.register_many([("present", 1)])
+
+        with pytest.raises(RegistrationError) as e:
+            self._TestFactory.TestRegistry.get_many(["missing_1", "present", "missing_2"])
+
+        assert "missing_1" in str(e.value) and "missing_2" in str(e.value)
+        assert "present" not in str(e.value)
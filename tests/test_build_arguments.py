@@ -0,0 +1,157 @@
+"""Test cases for building registered arguments from config dicts.
+Author: PeterHartog
+"""
+import enum
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+import pytest
+
+from registry_factory.arguments import compile_arguments
+from registry_factory.factory import Factory
+from registry_factory.utils import ArgumentValidationError, RegistrationWarning
+
+
+class Activation(enum.Enum):
+    RELU = "relu"
+    GELU = "gelu"
+
+
+@dataclass
+class OptimizerArguments:
+    lr: float = 1e-3
+    betas: Tuple[float, float] = (0.9, 0.999)
+
+
+@dataclass
+class ModelArguments:
+    hidden_size: int
+    dropout: Optional[float] = None
+    bias: bool = True
+    activation: Activation = Activation.RELU
+    norm: Literal["layer", "batch"] = "layer"
+    layers: List[int] = field(default_factory=list)
+    names: Dict[str, int] = field(default_factory=dict)
+    optimizer: OptimizerArguments = field(default_factory=OptimizerArguments)
+    step: int = field(default=0, init=False)
+
+
+@dataclass
+class Tree:
+    value: int
+    children: List["Tree"] = field(default_factory=list)
+
+
+@dataclass
+class UnionArguments:
+    code: Union[int, str] = 0
+    scale: Union[float, int] = 1.0
+
+
+class BuildFactory(Factory):
+    BuildRegistry = Factory.create_registry(shared=False)
+
+
+BuildFactory.BuildRegistry.register_arguments(key="model")(ModelArguments)
+BuildFactory.BuildRegistry.register_arguments(key="tree")(Tree)
+
+
+class TestBuildArguments:
+    """Test cases for Registry.build_arguments and build_arguments_many."""
+
+    def test_build(self):
+        """Test building a dataclass with coerced, nested and enum values from a config dict."""
+        arguments = BuildFactory.BuildRegistry.build_arguments(
+            "model",
+            {
+                "hidden_size": "64",
+                "dropout": 0.1,
+                "bias": "false",
+                "activation": "gelu",
+                "layers": ["1", 2],
+                "names": {"a": "1"},
+                "optimizer": {"lr": "0.01", "betas": [0.8, 0.9]},
+            },
+        )
+        assert arguments == ModelArguments(
+            hidden_size=64,
+            dropout=0.1,
+            bias=False,
+            activation=Activation.GELU,
+            layers=[1, 2],
+            names={"a": 1},
+            optimizer=OptimizerArguments(lr=0.01, betas=(0.8, 0.9)),
+        )
+
+    def test_defaults(self):
+        """Test that missing fields take their defaults and default factories."""
+        arguments = BuildFactory.BuildRegistry.build_arguments("model", {"hidden_size": 8})
+        assert arguments == ModelArguments(hidden_size=8)
+        assert arguments.optimizer is not ModelArguments(hidden_size=8).optimizer
+
+    def test_errors_are_aggregated(self):
+        """Test that all invalid fields of a config are raised at once."""
+        with pytest.raises(ArgumentValidationError) as info:
+            BuildFactory.BuildRegistry.build_arguments(
+                "model", {"dropout": "high", "norm": "group", "optimizer": {"lr": "fast"}, "step": 1, "depth": 2}
+            )
+        errors = info.value.errors
+        assert "ModelArguments.dropout: expected float or None, got 'high'" in errors
+        assert "ModelArguments.norm: expected one of ['layer', 'batch'], got 'group'" in errors
+        assert "ModelArguments.optimizer.lr: expected float, got 'fast'" in errors
+        assert "ModelArguments.step: unknown field of ModelArguments" in errors
+        assert "ModelArguments.depth: unknown field of ModelArguments" in errors
+        assert "ModelArguments.hidden_size: missing required field of ModelArguments" in errors
+        assert len(errors) == 6
+
+    def test_build_many(self):
+        """Test building a batch of configs, raising the errors of all of them at once."""
+        arguments = BuildFactory.BuildRegistry.build_arguments_many("model", [{"hidden_size": i} for i in range(3)])
+        assert [argument.hidden_size for argument in arguments] == [0, 1, 2]
+
+        with pytest.raises(ArgumentValidationError) as info:
+            BuildFactory.BuildRegistry.build_arguments_many(
+                "model", [{"hidden_size": 1}, {"hidden_size": "x"}, {"bias": 2}]
+            )
+        assert info.value.errors == [
+            "[1].hidden_size: expected int, got 'x'",
+            "[2].bias: expected bool, got 2",
+            "[2].hidden_size: missing required field of ModelArguments",
+        ]
+
+    def test_recursive_dataclass(self):
+        """Test building a dataclass that refers to itself."""
+        tree = BuildFactory.BuildRegistry.build_arguments("tree", {"value": 1, "children": [{"value": "2"}]})
+        assert tree == Tree(value=1, children=[Tree(value=2)])
+
+    def test_compiled_once(self):
+        """Test that a dataclass is compiled once, without its non-init fields."""
+        assert compile_arguments(ModelArguments) is compile_arguments(ModelArguments)
+        assert compile_arguments(ModelArguments).required == ("hidden_size",)
+        assert "step" not in compile_arguments(ModelArguments).fields
+
+    def test_union_prefers_exact_types(self):
+        """Test that union values already of one of the types are kept, and others are coerced in order."""
+        builder = compile_arguments(UnionArguments)
+        arguments = builder.build({"code": "007", "scale": 3})
+        assert arguments.code == "007"
+        assert arguments.scale == 3 and isinstance(arguments.scale, int)
+        assert builder.build({"code": 7.0, "scale": "0.5"}) == UnionArguments(code=7, scale=0.5)
+
+    def test_unresolved_annotations(self):
+        """Test that an unresolvable annotation warns and does not stop the other fields from validating."""
+
+        @dataclass
+        class Inner:
+            n: int
+
+        @dataclass
+        class Outer:
+            inner: "Inner"
+            lr: "float" = 0.1
+
+        with pytest.warns(RegistrationWarning, match="Outer.inner"):
+            builder = compile_arguments(Outer)
+        with pytest.raises(ArgumentValidationError) as info:
+            builder.build({"inner": {"n": "5"}, "lr": "abc"})
+        assert info.value.errors == ["Outer.lr: expected float, got 'abc'"]
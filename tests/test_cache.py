@@ -0,0 +1,83 @@
+"""Test cases for the Registry resolution cache.
+Author: PeterHartog
+"""
+import pytest
+
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+from registry_factory.utils import RegistrationError
+
+
+class TestResolutionCache:
+    """Test cases for the opt-in resolution cache."""
+
+    def test_hits_and_misses(self):
+        """Test that repeated lookups are served from the cache."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, cache=True)
+
+        @_TestFactory.TestRegistry.register("cached")
+        def test():
+            pass
+
+        assert _TestFactory.TestRegistry.get("cached") == test
+        assert _TestFactory.TestRegistry.get("cached") == test
+        assert _TestFactory.TestRegistry.cache_info() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_kwargs_are_part_of_the_key(self):
+        """Test that different key parameters are cached separately."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[Versioning(forced=False)], cache=True)
+
+        @_TestFactory.TestRegistry.register("cached", version="1", date="2020-01-01")
+        def test1():
+            pass
+
+        @_TestFactory.TestRegistry.register("cached", version="2", date="2020-01-01")
+        def test2():
+            pass
+
+        assert _TestFactory.TestRegistry.get("cached", version="1", date="2020-01-01") == test1
+        assert _TestFactory.TestRegistry.get("cached", version="2", date="2020-01-01") == test2
+
+    def test_invalidation(self):
+        """Test that a reset invalidates the cache."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, cache=True)
+
+        @_TestFactory.TestRegistry.register("cached")
+        def test():
+            pass
+
+        _TestFactory.TestRegistry.get("cached")
+        _TestFactory.TestRegistry.reset()
+        with pytest.raises(RegistrationError):
+            _TestFactory.TestRegistry.get("cached")
+
+    def test_shared_invalidation(self):
+        """Test that a registration through a shared registry invalidates the cache."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=True, cache=True)
+            TestSharedRegistry = Factory.create_registry(shared=True)
+
+        @_TestFactory.TestRegistry.register("shared_cached")
+        def test():
+            pass
+
+        _TestFactory.TestRegistry.get("shared_cached")
+        _TestFactory.TestSharedRegistry.mediator.hash_table.delete("shared_cached", {})
+        with pytest.raises(RegistrationError):
+            _TestFactory.TestRegistry.get("shared_cached")
+
+    def test_not_enabled(self):
+        """Test the cache info without a cache."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        with pytest.raises(RegistrationError):
+            _TestFactory.TestRegistry.cache_info()
@@ -0,0 +1,73 @@
+"""Test cases for call-time validation of meta information.
+Author: PeterHartog
+"""
+import warnings
+
+import pytest
+
+from registry_factory.checks.accreditation import Accreditation
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+
+
+def count_warnings(function, *args, **kwargs) -> int:
+    """Return the number of warnings raised by the call."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        function(*args, **kwargs)
+    return len(caught)
+
+
+class TestCallValidation:
+    """Test cases for the call_validation modes."""
+
+    def test_always(self):
+        """Test that the default validates every call."""
+        Registry = Factory.create_registry(shared=False, checks=[Accreditation()])
+        Registry.register_prebuilt("obj", "key", author="x", credit_type="reference")
+
+        assert count_warnings(Registry.get, "key") == 1
+        assert count_warnings(Registry.get, "key") == 1
+
+    def test_once(self):
+        """Test validating the first call of a key only."""
+        Registry = Factory.create_registry(shared=False, checks=[Versioning(call_validation="once")])
+        Registry.register_prebuilt("obj", "key", version="1", date="-")
+        Registry.register_prebuilt("obj", "key", version="2", date="-")
+
+        assert count_warnings(Registry.get, "key", version="1") == 1
+        assert count_warnings(Registry.get, "key", version="1") == 0
+        assert count_warnings(Registry.get, "key", version="2") == 1
+
+    def test_register(self):
+        """Test skipping call validation."""
+        Registry = Factory.create_registry(shared=False, checks=[Accreditation(call_validation="register")])
+        Registry.register_prebuilt("obj", "key", author="x", credit_type="reference")
+
+        assert Registry.mediator.observer_facade.passive
+        assert count_warnings(Registry.get, "key") == 0
+
+    def test_register_forced(self):
+        """Test that forced registration still validates."""
+        Registry = Factory.create_registry(
+            shared=False, checks=[Versioning(forced=True, call_validation="register")]
+        )
+
+        with pytest.raises(Exception):
+            Registry.register_prebuilt("obj", "key", version="1")
+        Registry.register_prebuilt("obj", "key", version="1", date="-")
+        assert Registry.get("key", version="1") == "obj"
+
+    def test_strict(self):
+        """Test raising on every call with missing fields."""
+        Registry = Factory.create_registry(shared=False, checks=[Versioning(call_validation="strict")])
+        Registry.register_prebuilt("obj", "key", version="1", date="-")
+
+        with pytest.raises(Exception):
+            Registry.get("key", version="1")
+        assert Registry.get("key", version="1", date="-") == "obj"
+
+    def test_invalid_mode(self):
+        """Test an unknown mode."""
+        with pytest.raises(ValueError):
+            Versioning(call_validation="sometimes")
@@ -0,0 +1,197 @@
+"""Test cases for the on-disk check result cache.
+Author: PeterHartog
+"""
+from typing import Any
+
+import pytest
+
+from registry_factory.check_cache import CheckResultCache, fingerprint
+from registry_factory.checks import testing
+from registry_factory.checks.factory_pattern import FactoryPattern
+from registry_factory.checks.testing import Testing as _Testing
+
+
+def counting_test_module(key: str, obj: Any, **kwargs):
+    assert obj.name == "test", "Name is not test"
+
+
+def helper(obj: Any) -> bool:
+    return obj.name == "test"
+
+
+def helper_test_module(key: str, obj: Any, **kwargs):
+    assert helper(obj)
+
+
+def make_closure(value: int):
+    def closure_test_module(key: str, obj: Any, **kwargs):
+        assert obj.value == value
+
+    return closure_test_module
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record the keys the test modules run on."""
+    keys = []
+    run_test = testing._run_test
+
+    def counting_run_test(test_module, key, obj, kwargs):
+        keys.append(key)
+        return run_test(test_module, key, obj, kwargs)
+
+    monkeypatch.setattr(testing, "_run_test", counting_run_test)
+    return keys
+
+
+class Pattern:
+    """Test pattern."""
+
+    def hello_world(self):
+        print("Hello world")
+
+
+def make_class(body: str) -> type:
+    namespace: dict = {}
+    exec(f"class Model:\n    name = 'test'\n    def hello_world(self):\n        {body}\n", namespace)
+    return namespace["Model"]
+
+
+class TestFingerprint:
+    """Test cases for fingerprint."""
+
+    def test_stable(self):
+        """Test that equal code gives equal fingerprints."""
+        assert fingerprint(make_class("return 1")) == fingerprint(make_class("return 1"))
+        assert fingerprint(counting_test_module) == fingerprint(counting_test_module)
+
+    def test_changes_with_code(self):
+        """Test that changing a method changes the fingerprint."""
+        assert fingerprint(make_class("return 1")) != fingerprint(make_class("return 2"))
+
+    def test_changes_with_base(self):
+        """Test that changing a base class changes the fingerprint."""
+        base_a, base_b = make_class("return 1"), make_class("return 2")
+        assert fingerprint(type("Child", (base_a,), {})) != fingerprint(type("Child", (base_b,), {}))
+
+    def test_changes_with_closure(self):
+        """Test that the values captured by a closure are part of the fingerprint."""
+        assert fingerprint(make_closure(1)) == fingerprint(make_closure(1))
+        assert fingerprint(make_closure(1)) != fingerprint(make_closure(100))
+
+    def test_changes_with_helper(self, monkeypatch):
+        """Test that changing a global helper changes the fingerprint of its callers."""
+        before = fingerprint(helper_test_module)
+        monkeypatch.setitem(globals(), "helper", lambda obj: True)
+        assert fingerprint(helper_test_module) != before
+
+    def test_changes_with_class_constants(self):
+        """Test that editing a container class attribute changes the fingerprint."""
+        limits_a, limits_b = type("Model", (), {"LIMITS": [1, 2]}), type("Model", (), {"LIMITS": [1, 3]})
+        assert fingerprint(limits_a) != fingerprint(limits_b)
+        options_a = type("Model", (), {"OPTIONS": {"size": 1, "tags": {"a", "b"}}})
+        options_b = type("Model", (), {"OPTIONS": {"tags": {"b", "a"}, "size": 1}})
+        assert fingerprint(options_a) == fingerprint(options_b)
+        assert fingerprint(options_a) != fingerprint(type("Model", (), {"OPTIONS": {"size": 2, "tags": {"a", "b"}}}))
+
+    def test_unsupported(self):
+        """Test that objects without a code fingerprint are not cached."""
+        assert fingerprint(object()) is None
+        assert fingerprint(make_closure(object())) is None
+        assert fingerprint(type("Model", (), {"DEFAULT": object()})) is None
+        assert fingerprint("test") is not None
+
+
+class TestCheckResultCache:
+    """Test cases for caching Testing and FactoryPattern results."""
+
+    def test_testing_reuses_results(self, make_registry, tmp_path, calls):
+        """Test that a cached Testing result skips the test module."""
+        model = make_class("return 1")
+        for _ in range(2):
+            cache = CheckResultCache(str(tmp_path))
+            registry = make_registry(_Testing(test_module=counting_test_module, result_cache=cache))
+            registry.register_prebuilt(key="model", obj=model)
+            assert registry.get_info("model")["passed_test"] is True
+        assert calls == ["model"]
+
+    def test_testing_invalidates_on_change(self, make_registry, tmp_path, calls):
+        """Test that changing the object runs the test module again."""
+        cache = CheckResultCache(str(tmp_path))
+        make_registry(_Testing(test_module=counting_test_module, result_cache=cache)).register_prebuilt(
+            key="model", obj=make_class("return 1")
+        )
+        make_registry(_Testing(test_module=counting_test_module, result_cache=cache)).register_prebuilt(
+            key="model", obj=make_class("return 2")
+        )
+        assert calls == ["model", "model"]
+
+    def test_cached_failure_still_raises(self, make_registry, tmp_path, calls):
+        """Test that a cached failure of a forced check still raises."""
+        model = make_class("return 1")
+        model.name = "not_test"
+        for _ in range(2):
+            registry = make_registry(
+                _Testing(test_module=counting_test_module, forced=True, result_cache=CheckResultCache(str(tmp_path)))
+            )
+            with pytest.raises(Exception):
+                registry.register_prebuilt(key="model", obj=model)
+        assert calls == ["model"]
+
+    def test_asynchronous_testing(self, make_registry, tmp_path, calls):
+        """Test that asynchronous Testing stores and reuses results."""
+        model = make_class("return 1")
+        for _ in range(2):
+            cache = CheckResultCache(str(tmp_path))
+            registry = make_registry(
+                _Testing(test_module=counting_test_module, asynchronous=True, result_cache=cache)
+            )
+            registry.register_prebuilt(key="model", obj=model)
+            registry.wait_checks()
+        assert calls == ["model"]
+
+    def test_factory_pattern(self, make_registry, tmp_path, monkeypatch):
+        """Test that a cached FactoryPattern result skips matching the pattern."""
+        checked = []
+        match_pattern = FactoryPattern._match_pattern
+        monkeypatch.setattr(
+            FactoryPattern, "_match_pattern", lambda self, obj: checked.append(obj) or match_pattern(self, obj)
+        )
+        model = make_class("return 1")
+        for _ in range(2):
+            cache = CheckResultCache(str(tmp_path))
+            check = FactoryPattern(factory_pattern=Pattern, result_cache=cache)
+            check.compiled.verdicts.clear()
+            registry = make_registry(check)
+            registry.register_prebuilt(key="model", obj=model)
+            assert registry.get_info("model")["correct_pattern"] is True
+        assert checked == [model]
+
+    def test_clear(self, make_registry, tmp_path):
+        """Test clearing the cache."""
+        cache = CheckResultCache(str(tmp_path))
+        cache.set("key", True)
+        assert CheckResultCache(str(tmp_path)).get("key") is True
+        cache.clear()
+        assert CheckResultCache(str(tmp_path)).get("key") is None
+
+    def test_appends(self, make_registry, tmp_path):
+        """Test that results are appended to the log, later lines taking precedence."""
+        cache = CheckResultCache(str(tmp_path))
+        cache.set("key", True)
+        cache.set("key", False)
+        cache.set("other", True)
+        with open(cache.path) as f:
+            assert len(f.readlines()) == 3
+        assert CheckResultCache(str(tmp_path)).get("key") is False
+
+    def test_compacts(self, make_registry, tmp_path):
+        """Test that a log of mostly stale lines is compacted on load."""
+        cache = CheckResultCache(str(tmp_path))
+        for i in range(100):
+            cache.set("key", i)
+        with open(cache.path, "a") as f:
+            f.write('["cut short"')
+        assert CheckResultCache(str(tmp_path)).get("key") == 99
+        with open(cache.path) as f:
+            assert f.readlines() == ['["key", 99]\n']
@@ -0,0 +1,67 @@
+"""Test cases for Registry key completion and suggestions.
+Author: PeterHartog
+"""
+import pytest
+
+from registry_factory.factory import Factory
+from registry_factory.index import HashTable
+from registry_factory.utils import RegistrationError
+
+
+class TestCompletion:
+    """Test cases for the sorted key index."""
+
+    class _TestFactory(Factory):
+        TestRegistry = Factory.create_registry(shared=False)
+
+    @pytest.fixture(autouse=True)
+    def registered(self):
+        """Register hierarchical keys."""
+        self._TestFactory.TestRegistry.reset()
+        for key in ["models.encoder", "models.encoder.large", "models.enc-x", "models.decoder", "optim.adam"]:
+            self._TestFactory.TestRegistry.register_prebuilt(key, key)
+
+    def test_complete(self):
+        """Test prefix completion."""
+        assert self._TestFactory.TestRegistry.complete("models.enc") == [
+            "models.enc-x",
+            "models.encoder",
+            "models.encoder.large",
+        ]
+        assert self._TestFactory.TestRegistry.complete("models.", limit=1) == ["models.decoder"]
+        assert self._TestFactory.TestRegistry.complete("loss") == []
+
+    def test_children(self):
+        """Test hierarchical iteration."""
+        assert self._TestFactory.TestRegistry.children() == ["models", "optim"]
+        assert self._TestFactory.TestRegistry.children("models.") == ["decoder", "enc-x", "encoder"]
+        assert self._TestFactory.TestRegistry.children("models.encoder.") == ["large"]
+
+    def test_suggestions(self):
+        """Test suggestions in lookup errors."""
+        with pytest.raises(RegistrationError) as e:
+            self._TestFactory.TestRegistry.get("models.encodr")
+        assert "Did you mean: models.encoder" in str(e.value)
+
+        with pytest.raises(RegistrationError) as e:
+            self._TestFactory.TestRegistry.validate_choice("optim.adan")
+        assert "optim.adam" in str(e.value)
+
+    def test_index_maintenance(self):
+        """Test that deleting the last variant of a key removes it."""
+        table = HashTable()
+        table.set("key", {"version": "1"}, 1)
+        table.set("key", {"version": "2"}, 2)
+        table.delete("key", {"version": "1"})
+        assert table.keys() == ["key"]
+        table.delete("key", {"version": "2"})
+        assert table.keys() == []
+
+    def test_bounded_suggestions(self):
+        """Test suggestions in a large table."""
+        table = HashTable()
+        for i in range(20000):
+            table.set(f"component_{i:05d}", {}, i)
+
+        assert table.key_columns.suggest("compnent_12345")[0] == "component_12345"
+        assert table.key_columns.suggest("component_1234x")[0].startswith("component_123")
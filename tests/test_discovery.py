@@ -0,0 +1,98 @@
+"""Test cases for entry-point plugin discovery.
+Author: PeterHartog
+"""
+import sys
+
+import pytest
+
+from registry_factory import discovery
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+from registry_factory.utils import RegistrationError, RegistrationWarning
+
+GROUP = "registry_factory_tests.plugins"
+
+
+@pytest.fixture
+def plugin_distribution(tmp_path, monkeypatch):
+    """Install a fake distribution advertising entry points."""
+    dist_info = tmp_path / "site" / "fake_plugin-0.1.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: fake-plugin\nVersion: 0.1\n")
+    (dist_info / "entry_points.txt").write_text(
+        f"[{GROUP}]\n"
+        "TestRegistry.plugin = tests.lazy_plugin:Plugin\n"
+        "TestRegistry.models.dotted = tests.lazy_plugin:WrongPlugin\n"
+        "UnknownRegistry.plugin = tests.lazy_plugin:Plugin\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+    return tmp_path
+
+
+class TestDiscovery:
+    """Test cases for Factory.discover_plugins."""
+
+    def test_discover(self, plugin_distribution, monkeypatch):
+        """Test registering entry points lazily."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        monkeypatch.delitem(sys.modules, "tests.lazy_plugin", raising=False)
+        with pytest.warns(RegistrationWarning):
+            registered = _TestFactory.discover_plugins(GROUP, cache_dir=str(plugin_distribution / "cache"))
+
+        assert sorted(registered) == [("TestRegistry", "models.dotted"), ("TestRegistry", "plugin")]
+        assert "tests.lazy_plugin" not in sys.modules
+        assert _TestFactory.TestRegistry.get("plugin").__name__ == "Plugin"
+
+    def test_rediscover(self, plugin_distribution):
+        """Test that discovering twice does not register twice."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        with pytest.warns(RegistrationWarning):
+            _TestFactory.discover_plugins(GROUP, use_cache=False)
+            assert _TestFactory.discover_plugins(GROUP, use_cache=False) == []
+
+    def test_warm_start(self, plugin_distribution, monkeypatch):
+        """Test that a warm start does not scan the entry points."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        class _WarmFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        cache_dir = str(plugin_distribution / "cache")
+        with pytest.warns(RegistrationWarning):
+            _TestFactory.discover_plugins(GROUP, cache_dir=cache_dir)
+
+        def fail_scan(group):
+            raise AssertionError("Entry points were scanned.")
+
+        monkeypatch.setattr(discovery, "scan_entry_points", fail_scan)
+        with pytest.warns(RegistrationWarning):
+            assert len(_WarmFactory.discover_plugins(GROUP, cache_dir=cache_dir)) == 2
+
+    def test_failed_entry_points(self, plugin_distribution):
+        """Test that entry points failing to register do not stop the others."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[Versioning(forced=True)])
+            UnknownRegistry = Factory.create_registry(shared=False)
+
+        with pytest.warns(RegistrationWarning, match="2 entry point"):
+            assert _TestFactory.discover_plugins(GROUP, use_cache=False) == [("UnknownRegistry", "plugin")]
+
+        with pytest.raises(RegistrationError, match="TestRegistry.plugin"):
+            _TestFactory.discover_plugins(GROUP, use_cache=False, strict=True)
+
+    def test_fingerprint_invalidation(self, plugin_distribution):
+        """Test that installing a distribution changes the fingerprint."""
+        site = plugin_distribution / "site"
+        fingerprint = discovery.installed_fingerprint([str(site)])
+        (site / "other_plugin-0.1.dist-info").mkdir()
+
+        assert discovery.installed_fingerprint([str(site)]) != fingerprint
@@ -0,0 +1,63 @@
+"""Test cases for the compiled observer pipeline.
+Author: PeterHartog
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from registry_factory.checks.accreditation import Accreditation
+from registry_factory.checks.factory_pattern import FactoryPattern
+from registry_factory.checks.testing import Testing
+from registry_factory.checks.versioning import Versioning
+from registry_factory.patterns.facade import ObserverFacade
+from registry_factory.patterns.observer import RegistryObserver
+
+
+class KeyObserver(RegistryObserver):
+    """Observer with a custom key extraction."""
+
+    def generate_key_dict(self, key: str, **kwargs) -> Dict:
+        return {"custom": kwargs.get("custom", "default")}
+
+    def register_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        return (key, self.generate_key_dict(key, **kwargs), obj, None)
+
+    def call_event(self, key: str, obj: Any, **kwargs) -> Tuple[str, Dict, Any, Optional[Dict]]:
+        return (key, self.generate_key_dict(key, **kwargs), obj, None)
+
+
+class TestObserverFacade:
+    """Test cases for the compiled observer facade."""
+
+    def test_union_key_parameters(self):
+        """Test that key parameters of meta observers are merged."""
+        facade = ObserverFacade(observers=[Versioning(), Accreditation(key_list=["environment"])])
+        facade.compile()
+
+        assert facade.key_parameters == frozenset({"version", "environment"})
+        assert facade.generate_key_dict("key", version="1", environment="prod", date="x") == {
+            "version": "1",
+            "environment": "prod",
+        }
+
+    def test_passive_observers(self):
+        """Test that observers without call-time work are skipped."""
+        facade = ObserverFacade(observers=[FactoryPattern(object), Testing(lambda key, obj: None)])
+        facade.compile()
+
+        assert facade.passive
+        assert facade.key_parameters == frozenset()
+
+    def test_custom_key_observer(self):
+        """Test that custom key extraction falls back to the observers."""
+        facade = ObserverFacade(observers=[Versioning(), KeyObserver()])
+        facade.compile()
+
+        assert facade.key_parameters is None
+        assert not facade.passive
+        assert facade.generate_key_dict("key", version="1") == {"version": "1", "custom": "default"}
+
+    def test_uncompiled(self):
+        """Test that an uncompiled facade keeps the generic behaviour."""
+        facade = ObserverFacade(observers=[Versioning()])
+
+        assert not facade.passive
+        assert facade.generate_key_dict("key", version="1") == {"version": "1"}
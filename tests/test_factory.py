@@ -1,9 +1,13 @@
 """Test cases for Registry sharing.
 Author: PeterHartog
 """
+from dataclasses import dataclass
+
 import pytest
 
+from registry_factory.checks.versioning import Versioning
 from registry_factory.factory import Factory
+from registry_factory.utils import RegistrationError
 
 
 class TestFactory:
@@ -53,6 +57,62 @@ class TestFactory:
 
         assert "TestRegistry" in _TestFactory.get_registries().keys()
 
+    def test_registry_catalog(self):
+        """Test the registry catalog of factory subclasses."""
+
+        class _BaseFactory(Factory):
+            BaseRegistry = Factory.create_registry()
+            not_a_registry = 1
+
+        class _TestFactory(_BaseFactory):
+            TestRegistry = Factory.create_registry()
+
+        assert list(_BaseFactory.get_registries()) == ["BaseRegistry"]
+        assert _TestFactory.keys() == ["BaseRegistry", "TestRegistry"]
+        assert _TestFactory.values() == [_BaseFactory.BaseRegistry, _TestFactory.TestRegistry]
+        with pytest.raises(TypeError):
+            _TestFactory.get_registries()["OtherRegistry"] = _TestFactory.TestRegistry  # type: ignore[index]
+
+        _TestFactory.add_registry("LateRegistry", Factory.create_registry())
+        assert _TestFactory.get_registries()["LateRegistry"] is _TestFactory.LateRegistry
+        assert _TestFactory.LateRegistry.registry_name() == "LateRegistry"
+        assert "LateRegistry" not in _BaseFactory.get_registries()
+
+    def test_registry_catalog_assignment(self):
+        """Test that the catalog follows registries assigned and deleted after class creation."""
+
+        class _BaseFactory(Factory):
+            pass
+
+        class _TestFactory(_BaseFactory):
+            pass
+
+        _TestFactory.TestRegistry = Factory.create_registry()
+        _BaseFactory.BaseRegistry = Factory.create_registry()
+        assert _TestFactory.keys() == ["BaseRegistry", "TestRegistry"]
+        assert _TestFactory.TestRegistry.registry_name() == "TestRegistry"
+
+        del _BaseFactory.BaseRegistry
+        _TestFactory.TestRegistry = None
+        assert _TestFactory.keys() == []
+
+    def test_registry_catalog_is_not_shared(self):
+        """Test that registries cannot be added to the root factory and do not leak into other factories."""
+
+        with pytest.raises(TypeError):
+            Factory.add_registry("RootRegistry", Factory.create_registry())
+
+        class _TestFactory(Factory):
+            pass
+
+        _TestFactory.add_registry("TestRegistry", Factory.create_registry())
+
+        class _OtherFactory(Factory):
+            pass
+
+        assert _OtherFactory.keys() == []
+        assert Factory.keys() == []
+
     def test_get_subclass_choices(self):
         """Test getting the subclass choices."""
 
@@ -71,15 +131,52 @@ class TestFactory:
 
         assert ("test", {}) in _TestFactory.items()
 
-    # def test_get_subclass_arguments(self):
-    #     """Test getting the subclass choices."""
+    def test_get_subclass_arguments(self):
+        """Test getting the subclass choices."""
 
-    #     class _TestFactory(Factory):
-    #         TestRegistry = Factory.create_registry()
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry()
 
-    #     @_TestFactory.TestRegistry.register_arguments("test_arg")
-    #     @dataclass
-    #     class TestArguments:
-    #         test_arg: str
+        @_TestFactory.TestRegistry.register_arguments("test_arg")
+        @dataclass
+        class TestArguments:
+            test_arg: str
 
-    #     assert TestArguments in _TestFactory.get_registry_arguments(["TestRegistry"]).values()
+        assert TestArguments in _TestFactory.get_registry_arguments(["TestRegistry"]).values()
+
+    def test_resolve_arguments(self):
+        """Test resolving the arguments of many selections at once."""
+
+        class _TestFactory(Factory):
+            ModelRegistry = Factory.create_registry(checks=[Versioning(forced=False)])
+            DataRegistry = Factory.create_registry()
+
+        @_TestFactory.ModelRegistry.register_arguments("model", version="1.0.0")
+        @dataclass
+        class ModelArguments:
+            hidden_size: int = 8
+
+        @_TestFactory.ModelRegistry.register_arguments("model", version="2.0.0")
+        @dataclass
+        class NewModelArguments:
+            hidden_size: int = 16
+
+        @_TestFactory.DataRegistry.register_arguments("data")
+        @dataclass
+        class DataArguments:
+            path: str = "data.csv"
+
+        selection = {"ModelRegistry": ("model", {"version": "2.0.0"}), "DataRegistry": "data"}
+        assert _TestFactory.resolve_arguments(selection) == {
+            "ModelRegistry": NewModelArguments,
+            "DataRegistry": DataArguments,
+        }
+        selections = [{"ModelRegistry": ("model", {"version": f"{i % 2 + 1}.0.0"})} for i in range(4)]
+        assert [arguments["ModelRegistry"] for arguments in _TestFactory.resolve_arguments_many(selections)] == [
+            ModelArguments,
+            NewModelArguments,
+        ] * 2
+
+        with pytest.raises(RegistrationError) as error:
+            _TestFactory.resolve_arguments_many([{"DataRegistry": "missing"}, {"MissingRegistry": "data"}])
+        assert "DataRegistry" in str(error.value) and "MissingRegistry" in str(error.value)
@@ -1,10 +1,13 @@
 """Test cases for Registry factory pattern ensurance.
 Author: PeterHartog
 """
+import inspect
+
 import pytest
 
-from registry_factory.checks.factory_pattern import FactoryPattern
+from registry_factory.checks.factory_pattern import CompiledPattern, FactoryPattern, compatible, compile_pattern
 from registry_factory.factory import Factory
+from tests import postponed_plugin
 
 
 class Pattern:
@@ -102,3 +105,98 @@ class TestFactoryPattern:
 
         with pytest.raises(Exception):
             self._TestFactory.ForcedRegistry.register_prebuilt(key="wrong_common_pattern_test", obj=WrongPattern)
+
+
+def pattern_function(x: int, y: int = 0) -> int:
+    return x + y
+
+
+class TestStructuralConformance:
+    """Test cases for compiled patterns and signature compatibility."""
+
+    class _SignatureFactory(Factory):
+        ClassRegistry = Factory.create_registry(shared=False, checks=[FactoryPattern(Pattern, forced=True)])
+        FunctionRegistry = Factory.create_registry(
+            shared=False, checks=[FactoryPattern(pattern_function, forced=True)]
+        )
+
+    def test_compiled_members(self):
+        """Test that a pattern is compiled once into its members and signatures."""
+        compiled = compile_pattern(Pattern)
+        assert compiled is FactoryPattern(Pattern).compiled
+        assert [(member.name, member.kind) for member in compiled.members] == [("hello_world", "method")]
+        assert list(compiled.members[0].signature.parameters) == []
+
+    def test_compatible_signatures(self):
+        """Test which signatures can stand in for the signature of a pattern member."""
+        expected = inspect.signature(pattern_function)
+        assert compatible(expected, inspect.signature(lambda x, y=1, *args, z=None: None))
+        assert compatible(expected, inspect.signature(lambda *args, **kwargs: None))
+        assert not compatible(expected, inspect.signature(lambda x, y: None))  # y lost its default
+        assert not compatible(expected, inspect.signature(lambda a, y=0: None))  # x renamed
+        assert not compatible(expected, inspect.signature(lambda x, y=0, z=None, *, w: None))  # w never given
+
+        def annotated(x: str, y: int = 0) -> int:
+            return 0
+
+        assert not compatible(expected, inspect.signature(annotated))
+
+    def test_incompatible_method(self):
+        """Test that a method with an incompatible signature does not match the pattern."""
+        class Incompatible:
+            def hello_world(self, greeting):
+                print(greeting)
+
+        class Compatible:
+            @staticmethod
+            def hello_world(greeting="hello"):
+                print(greeting)
+
+        with pytest.raises(Exception, match="factory pattern"):
+            self._SignatureFactory.ClassRegistry.register_prebuilt(key="incompatible", obj=Incompatible)
+        self._SignatureFactory.ClassRegistry.register_prebuilt(key="compatible", obj=Compatible)
+
+    def test_function_pattern(self):
+        """Test matching functions against a function pattern."""
+        def add(x, y=1):
+            return x + y
+
+        def wrong(x: str, y: int = 0) -> int:
+            return 0
+
+        self._SignatureFactory.FunctionRegistry.register_prebuilt(key="add", obj=add)
+        with pytest.raises(Exception, match="factory pattern"):
+            self._SignatureFactory.FunctionRegistry.register_prebuilt(key="wrong", obj=wrong)
+        with pytest.raises(Exception, match="factory pattern"):
+            self._SignatureFactory.FunctionRegistry.register_prebuilt(key="class", obj=Pattern)
+
+    def test_verdict_cache(self, monkeypatch):
+        """Test that the verdict of an object is cached per compiled pattern."""
+        class Common:
+            def hello_world(self):
+                pass
+
+        compiled = compile_pattern(Pattern)
+        match_members = CompiledPattern.match_members
+        checked = []
+        monkeypatch.setattr(
+            CompiledPattern, "match_members", lambda self, obj: checked.append(obj) or match_members(self, obj)
+        )
+        FactoryPattern(Pattern).register_event("common", Common)
+        FactoryPattern(Pattern).register_event("common", Common)
+        assert checked == [Common]
+        assert compiled.verdicts[Common] is True
+
+    def test_postponed_annotations(self, make_registry):
+        """Test that string annotations from postponed evaluation are compared by the types they name."""
+        class AnnotatedPattern:
+            def add(self, x: int, y: int = 0) -> int:
+                return x + y
+
+        FunctionRegistry = make_registry(FactoryPattern(pattern_function, forced=True))
+        FunctionRegistry.register_prebuilt(key="add", obj=postponed_plugin.add)
+        FunctionRegistry.register_prebuilt(key="unresolvable", obj=postponed_plugin.unresolvable)
+        with pytest.raises(Exception, match="factory pattern"):
+            FunctionRegistry.register_prebuilt(key="wrong", obj=postponed_plugin.wrong)
+        ClassRegistry = make_registry(FactoryPattern(AnnotatedPattern, forced=True))
+        ClassRegistry.register_prebuilt(key="plugin", obj=postponed_plugin.Plugin)
@@ -0,0 +1,110 @@
+"""Test cases for the HashTable index.
+Author: PeterHartog
+"""
+import threading
+
+import pytest
+
+from registry_factory.index import HashTable, KeyColumnIndex
+
+
+class TestHashTableIndex:
+    """Test cases for the composite-key index of the HashTable."""
+
+    def test_set_get(self):
+        """Test setting and getting through the index."""
+        table = HashTable()
+        table.set("key", {"version": "1.0"}, "obj")
+
+        assert table.get("key", {"version": "1.0"}) == "obj"
+        assert table.contains("key", {"version": "1.0"})
+        assert not table.contains("key", {"version": "2.0"})
+
+    def test_key_dict_order(self):
+        """Test that the key dict order does not matter."""
+        table = HashTable()
+        table.set("key", {"a": 1, "b": 2}, "obj")
+
+        assert table.get("key", {"b": 2, "a": 1}) == "obj"
+
+    def test_unhashable_values(self):
+        """Test key dicts with unhashable values."""
+        table = HashTable()
+        table.set("key", {"layers": [1, 2], "opts": {"x": {1, 2}}}, "obj")
+
+        assert table.get("key", {"layers": [1, 2], "opts": {"x": {2, 1}}}) == "obj"
+        assert not table.contains("key", {"layers": (1, 2), "opts": {"x": {1, 2}}})
+
+    def test_duplicate(self):
+        """Test that duplicates are detected."""
+        table = HashTable()
+        table.set("key", {}, "obj")
+
+        with pytest.raises(KeyError):
+            table.set("key", {}, "obj2")
+
+    def test_arguments_share_slot(self):
+        """Test that arguments and objects share a slot."""
+        table = HashTable()
+        table.set_arguments("key", {}, "arguments")
+        table.set("key", {}, "obj")
+
+        assert len(table) == 1
+        assert table.get_arguments("key", {}) == "arguments"
+
+    def test_delete(self):
+        """Test that deleting keeps the index in sync."""
+        table = HashTable()
+        table.set("key", {}, "obj", {"meta": True})
+        table.delete("key", {})
+
+        assert not table.contains("key", {})
+        with pytest.raises(KeyError):
+            table.get("key", {})
+        table.set("key", {}, "obj2")
+        assert table.get("key", {}) == "obj2"
+
+    def test_clear(self):
+        """Test that clearing keeps the index in sync."""
+        table = HashTable()
+        table.set("key", {}, "obj")
+        table.clear()
+
+        assert len(table.index) == 0
+        assert not table.contains("key", {})
+
+
+class TestKeyColumnIndex:
+    """Test cases for the sorted keys of the KeyColumnIndex."""
+
+    def test_sorted_keys(self):
+        """Test that new keys are sorted in on read and removed keys leave the sorted lists."""
+        index = KeyColumnIndex()
+        for key in ["b", "c", "a"]:
+            index.add(key, {}, hash(key))
+        index.remove("c", {}, hash("c"))
+
+        assert index.sorted_keys == ["a", "b"]
+        assert index.reversed_keys == ["a", "b"]
+
+    def test_add_during_merge(self):
+        """Test that a key added by another thread while the new keys are merged is not lost."""
+        index = KeyColumnIndex()
+        index.add("b", {}, 1)
+        adder = threading.Thread(target=index.add, args=("a", {}, 2))
+
+        class SortedKeys(list):
+            """Sorted keys that add a key from another thread in the middle of a merge."""
+
+            def sort(self, *args, **kwargs):
+                if adder.ident is None:
+                    adder.start()
+                    adder.join(timeout=0.1)
+                super().sort(*args, **kwargs)
+
+        index._sorted_keys = SortedKeys()
+        index.sorted_keys
+        adder.join()
+
+        assert index.sorted_keys == ["a", "b"]
+        assert index.reversed_keys == ["a", "b"]
@@ -0,0 +1,205 @@
+"""Test cases for the instance cache of get_instance.
+Author: PeterHartog
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from registry_factory.factory import Factory
+from registry_factory.instances import InstanceCache, estimate_size
+from registry_factory.utils import ArgumentValidationError, RegistrationError
+
+
+class Encoder:
+    constructed = 0
+
+    def __init__(self, hidden_size: int = 8, dropout: float = 0.0):
+        Encoder.constructed += 1
+        self.hidden_size = hidden_size
+        self.dropout = dropout
+
+
+@dataclass
+class EncoderArguments:
+    hidden_size: int = 8
+    dropout: float = 0.0
+
+
+class InstanceFactory(Factory):
+    InstanceRegistry = Factory.create_registry(shared=False)
+
+
+class TestGetInstance:
+    """Test cases for Registry.get_instance."""
+
+    def setup_method(self):
+        registry = InstanceFactory.InstanceRegistry
+        registry.reset()
+        registry.configure_instances()
+        registry.register_prebuilt(key="encoder", obj=Encoder)
+        registry.register_arguments(key="encoder")(EncoderArguments)
+        registry.include_instances("encoder")
+        Encoder.constructed = 0
+
+    def test_cached_per_arguments(self):
+        """Test that instances are cached per distinct arguments."""
+        registry = InstanceFactory.InstanceRegistry
+        default = registry.get_instance("encoder")
+        assert default.hidden_size == 8
+        assert registry.get_instance("encoder") is default
+        assert registry.get_instance("encoder", args=EncoderArguments()) is default
+
+        large = registry.get_instance("encoder", args={"hidden_size": "64"})
+        assert large.hidden_size == 64
+        assert registry.get_instance("encoder", args=EncoderArguments(hidden_size=64)) is large
+        assert Encoder.constructed == 2
+        assert registry.instance_cache_info()["hits"] == 3
+        assert registry.instance_cache_info()["misses"] == 2
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments and unknown keys raise."""
+        with pytest.raises(ArgumentValidationError):
+            InstanceFactory.InstanceRegistry.get_instance("encoder", args={"hidden_size": "large"})
+        with pytest.raises(RegistrationError):
+            InstanceFactory.InstanceRegistry.get_instance("decoder")
+
+    def test_arguments_of_other_class(self):
+        """Test that arguments of another dataclass raise an error naming the expected argument class."""
+
+        @dataclass
+        class DecoderArguments:
+            hidden_size: int = 8
+
+        with pytest.raises(TypeError, match="EncoderArguments"):
+            InstanceFactory.InstanceRegistry.get_instance("encoder", args=DecoderArguments())
+
+    def test_opt_out(self):
+        """Test not caching single calls or excluded entries."""
+        registry = InstanceFactory.InstanceRegistry
+        assert registry.get_instance("encoder", cache_instance=False) is not registry.get_instance("encoder")
+        registry.exclude_instances("encoder")
+        assert registry.get_instance("encoder") is not registry.get_instance("encoder")
+        assert registry.instance_cache_info()["size"] == 0
+
+    def test_invalidated_on_registration(self):
+        """Test that only changes to the entry itself reconstruct its instances."""
+        registry = InstanceFactory.InstanceRegistry
+        instance = registry.get_instance("encoder")
+        registry.register_prebuilt(key="other", obj=Encoder)
+        registry.register_arguments(key="other")(EncoderArguments)
+        assert registry.get_instance("encoder") is instance
+
+        class OtherEncoder(Encoder):
+            pass
+
+        registry.mediator.hash_table.delete("encoder", {})
+        registry.register_prebuilt(key="encoder", obj=OtherEncoder)
+        registry.register_arguments(key="encoder")(EncoderArguments)
+        assert type(registry.get_instance("encoder")) is OtherEncoder
+
+    def test_unhashable_arguments(self):
+        """Test that unhashable argument values are compared by identity, not by their repr."""
+
+        class Weights:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __repr__(self) -> str:
+                return "Weights()"
+
+        class Model:
+            def __init__(self, weights: Weights):
+                self.weights = weights
+
+        registry = InstanceFactory.InstanceRegistry
+        registry.register_prebuilt(key="model", obj=Model)
+        weights = Weights()
+        instance = registry.get_instance("model", args={"weights": weights})
+        assert registry.get_instance("model", args={"weights": weights}) is instance
+        assert registry.get_instance("model", args={"weights": Weights()}) is not instance
+
+    def test_excluded_survives_reset(self):
+        """Test that resetting the registry drops the instances but keeps the excluded entries."""
+        registry = InstanceFactory.InstanceRegistry
+        registry.get_instance("encoder")
+        registry.exclude_instances("encoder")
+        registry.reset()
+        registry.register_prebuilt(key="encoder", obj=Encoder)
+        assert registry.instance_cache_info()["size"] == 0
+        assert registry.get_instance("encoder") is not registry.get_instance("encoder")
+
+    def test_lru_eviction(self):
+        """Test evicting the least recently used instance beyond max_entries."""
+        registry = InstanceFactory.InstanceRegistry
+        registry.configure_instances(max_entries=2)
+        first = registry.get_instance("encoder", args={"hidden_size": 1})
+        registry.get_instance("encoder", args={"hidden_size": 2})
+        assert registry.get_instance("encoder", args={"hidden_size": 1}) is first
+        registry.get_instance("encoder", args={"hidden_size": 3})
+        assert registry.get_instance("encoder", args={"hidden_size": 1}) is first
+        assert registry.instance_cache_info()["evictions"] == 1
+        assert Encoder.constructed == 3
+
+    def test_memory_budget(self):
+        """Test evicting instances beyond max_bytes."""
+        registry = InstanceFactory.InstanceRegistry
+        registry.configure_instances(max_entries=None, max_bytes=250, sizeof=lambda instance: 100)
+        for size in range(4):
+            registry.get_instance("encoder", args={"hidden_size": size})
+        info = registry.instance_cache_info()
+        assert info["size"] == 2
+        assert info["bytes"] == 200
+        assert info["evictions"] == 2
+
+    def test_ttl(self):
+        """Test that instances expire after the ttl."""
+        registry = InstanceFactory.InstanceRegistry
+        registry.configure_instances(ttl=0.01)
+        instance = registry.get_instance("encoder")
+        time.sleep(0.02)
+        assert registry.get_instance("encoder") is not instance
+        assert registry.instance_cache_info()["expirations"] == 1
+
+    def test_constructed_once_under_concurrency(self):
+        """Test that concurrent requests construct an instance once."""
+        cache = InstanceCache()
+        constructed = []
+
+        def create():
+            time.sleep(0.01)
+            constructed.append(1)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_create("key", (), create))) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(constructed) == 1
+        assert len({id(result) for result in results}) == 1
+
+    def test_stored_before_release(self):
+        """Test that a caller arriving after the construction finds the instance instead of building again."""
+        cache = InstanceCache()
+        constructed = []
+
+        def create():
+            constructed.append(1)
+            return object()
+
+        def late_caller(instance):
+            assert cache.building == {} and "key" in cache.entries
+            return instance
+
+        instance = late_caller(cache.get_or_create("key", (), create))
+        assert cache.get_or_create("key", (), create) is instance
+        assert len(constructed) == 1
+
+
+def test_estimate_size():
+    """Test that the estimated size follows the contents of containers."""
+    assert estimate_size({"values": list(range(100))}) > estimate_size({})
@@ -0,0 +1,97 @@
+"""Test cases for lazy Registry registration.
+Author: PeterHartog
+"""
+import sys
+import threading
+
+import pytest
+
+from registry_factory import lazy
+from registry_factory.checks.factory_pattern import FactoryPattern
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+from registry_factory.utils import CheckFailedError, LazyImportError
+
+
+class Pattern:
+    """Test pattern."""
+
+    def hello_world(self):
+        """Hello world."""
+
+
+class TestLazyRegistry:
+    """Test cases for register_lazy."""
+
+    class _TestFactory(Factory):
+        TestRegistry = Factory.create_registry(shared=False)
+        ForcedRegistry = Factory.create_registry(
+            shared=False, checks=[Versioning(forced=True), FactoryPattern(factory_pattern=Pattern, forced=True)]
+        )
+
+    def test_import_on_first_use(self, monkeypatch):
+        """Test that the module is only imported by get."""
+        monkeypatch.delitem(sys.modules, "tests.lazy_plugin", raising=False)
+        self._TestFactory.TestRegistry.register_lazy("lazy", "tests.lazy_plugin:Plugin")
+
+        assert "tests.lazy_plugin" not in sys.modules
+        assert self._TestFactory.TestRegistry.check_choice("lazy")
+        plugin = self._TestFactory.TestRegistry.get("lazy")
+        assert plugin is sys.modules["tests.lazy_plugin"].Plugin
+
+    def test_dotted_path(self):
+        """Test an import path without a colon."""
+        self._TestFactory.TestRegistry.register_lazy("lazy_dotted", "collections.OrderedDict")
+
+        assert self._TestFactory.TestRegistry.get("lazy_dotted").__name__ == "OrderedDict"
+
+    def test_missing_module(self):
+        """Test that an unimportable path fails on get."""
+        self._TestFactory.TestRegistry.register_lazy("lazy_missing", "tests.does_not_exist:Plugin")
+
+        with pytest.raises(LazyImportError, match="tests.does_not_exist:Plugin"):
+            self._TestFactory.TestRegistry.get("lazy_missing")
+        with pytest.raises(LazyImportError):
+            self._TestFactory.TestRegistry.get("lazy_missing", default="fallback")
+        assert self._TestFactory.TestRegistry.check_choice("lazy_missing")
+
+    def test_deferred_checks(self):
+        """Test that checks needing the object run on resolution."""
+        self._TestFactory.ForcedRegistry.register_lazy(
+            "lazy_checked", "tests.lazy_plugin:Plugin", version="1", date="-"
+        )
+        self._TestFactory.ForcedRegistry.register_lazy(
+            "lazy_wrong", "tests.lazy_plugin:WrongPlugin", version="1", date="-"
+        )
+
+        assert "correct_pattern" not in self._TestFactory.ForcedRegistry.get_info("lazy_checked", version="1")
+        self._TestFactory.ForcedRegistry.get("lazy_checked", version="1", date="-")
+        assert self._TestFactory.ForcedRegistry.get_info("lazy_checked", version="1")["correct_pattern"]
+        with pytest.raises(CheckFailedError, match="lazy_wrong"):
+            self._TestFactory.ForcedRegistry.get("lazy_wrong", version="1", date="-")
+
+    def test_meta_checks_at_registration(self):
+        """Test that checks not needing the object run on registration."""
+        with pytest.raises(Exception):
+            self._TestFactory.ForcedRegistry.register_lazy("lazy_unversioned", "tests.lazy_plugin:Plugin")
+
+    def test_single_flight(self, monkeypatch):
+        """Test that concurrent gets import the object once."""
+        calls = []
+        import_from_path = lazy.import_from_path
+
+        def counting_import(path):
+            calls.append(path)
+            return import_from_path(path)
+
+        monkeypatch.setattr(lazy, "import_from_path", counting_import)
+        self._TestFactory.TestRegistry.register_lazy("lazy_threaded", "tests.lazy_plugin:Plugin")
+
+        get = self._TestFactory.TestRegistry.get
+        threads = [threading.Thread(target=get, args=("lazy_threaded",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["tests.lazy_plugin:Plugin"]
@@ -0,0 +1,93 @@
+"""Test cases for the memory-mapped Registry index.
+Author: PeterHartog
+"""
+import pytest
+
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+from registry_factory.mapped import MappedIndex
+from registry_factory.utils import RegistrationError
+from tests import lazy_plugin
+
+
+class TestMappedIndex:
+    """Test cases for export_index and attach_index."""
+
+    @pytest.fixture
+    def index_path(self, tmp_path):
+        """Export a versioned registry."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[Versioning()])
+
+        for i in range(50):
+            _TestFactory.TestRegistry.register_lazy(
+                f"plugin_{i}", "tests.lazy_plugin:Plugin", version=str(i % 3), date="-"
+            )
+        _TestFactory.TestRegistry.register_prebuilt(lazy_plugin.WrongPlugin, "wrong", version="1", date="-")
+        path = str(tmp_path / "index.bin")
+        _TestFactory.TestRegistry.export_index(path)
+        return path
+
+    def test_find(self, index_path):
+        """Test lookups against the mapped file."""
+        index = MappedIndex(index_path)
+
+        assert len(index) == 51
+        assert index.find("plugin_4", {"version": "1"})["object"] == "tests.lazy_plugin:Plugin"
+        assert index.find("plugin_4", {"version": "2"}) is None
+        assert ("wrong", {"version": "1"}) in index
+        index.close()
+
+    def test_attach(self, index_path):
+        """Test a registry serving lookups from an attached index."""
+
+        class _WorkerFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[Versioning()])
+
+        _WorkerFactory.TestRegistry.attach_index(index_path)
+
+        assert len(_WorkerFactory.TestRegistry.mediator.hash_table) == 0
+        assert _WorkerFactory.TestRegistry.check_choice("plugin_7", version="1")
+        assert len(_WorkerFactory.TestRegistry.keys()) == 51
+        assert _WorkerFactory.TestRegistry.get_info("wrong", version="1") == {"date": "-"}
+        assert _WorkerFactory.TestRegistry.get("plugin_7", version="1", date="-") is lazy_plugin.Plugin
+        assert len(_WorkerFactory.TestRegistry.mediator.hash_table) == 2
+        with pytest.raises(RegistrationError):
+            _WorkerFactory.TestRegistry.get("plugin_7", version="2", date="-")
+
+    def test_not_an_index(self, tmp_path):
+        """Test attaching to a file that is not an index."""
+        path = tmp_path / "index.bin"
+        path.write_bytes(b"not an index, just some bytes")
+
+        with pytest.raises(RegistrationError):
+            MappedIndex(str(path))
+
+    def test_empty_file(self, tmp_path):
+        """Test attaching to an empty file."""
+        path = tmp_path / "index.bin"
+        path.write_bytes(b"")
+
+        index = MappedIndex(str(path))
+        assert len(index) == 0
+        assert index.find("plugin", {}) is None
+        assert index.keys() == []
+        index.close()
+
+    def test_tuple_key_values(self, tmp_path):
+        """Test that entries with tuple key values are found."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[Versioning()])
+
+        _TestFactory.TestRegistry.register_lazy("plugin", "tests.lazy_plugin:Plugin", version=(1, 2), date="-")
+        path = str(tmp_path / "index.bin")
+        _TestFactory.TestRegistry.export_index(path)
+
+        index = MappedIndex(path)
+        assert index.find("plugin", {"version": (1, 2)})["key_dict"] == {"version": (1, 2)}
+        assert index.find("plugin", {"version": [1, 2]}) is None
+        assert index.keys() == [("plugin", {"version": (1, 2)})]
+        assert index.keys() is not index.keys()
+        index.close()
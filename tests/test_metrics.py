@@ -0,0 +1,109 @@
+"""Test cases for Registry runtime metrics.
+Author: PeterHartog
+"""
+from typing import Any, List, Tuple
+
+import pytest
+
+from registry_factory.checks.factory_pattern import FactoryPattern
+from registry_factory.checks.versioning import Versioning
+from registry_factory.metrics import LatencyHistogram, MetricsSink
+from registry_factory.patterns import facade, mediator
+from registry_factory.utils import RegistrationError
+
+
+class Pattern:
+    """Test pattern."""
+
+    def hello_world(self):
+        print("Hello world")
+
+
+class ListSink(MetricsSink):
+    def __init__(self) -> None:
+        self.records: List[Tuple[str, str, float, dict]] = []
+
+    def record(self, registry: str, metric: str, value: float, **tags: Any) -> None:
+        self.records.append((registry, metric, value, tags))
+
+
+class TestMetrics:
+    """Test cases for metrics."""
+
+    @pytest.fixture
+    def registry(self, make_registry):
+        """Return a registry recording metrics, with versioning and pattern checks."""
+        return make_registry(Versioning(forced=False), FactoryPattern(Pattern), name="MetricsRegistry", metrics=True)
+
+    def test_get_outcomes(self, registry):
+        """Test counting gets per key and outcome, call latencies and observer timings."""
+        registry.register_prebuilt(key="model", obj=Pattern, version="1.0.0", date="2026-01-01")
+        registry.get("model", version="1.0.0", date="2026-01-01")
+        registry.get("model", version="1.0.0", date="2026-01-01")
+        with pytest.raises(RegistrationError):
+            registry.get("missing")
+        with pytest.warns():
+            registry.get("missing", default=Pattern)
+
+        snapshot = registry.metrics_snapshot()
+        assert snapshot["registry"] == "MetricsRegistry"
+        assert snapshot["gets"] == {"model": 2, "missing": 2}
+        assert snapshot["outcomes"] == {"hit": 2, "miss": 1, "default": 1}
+        assert snapshot["call_latency"]["count"] == 4
+        assert set(snapshot["observers"]["register"]) == {"Versioning", "FactoryPattern"}
+        assert set(snapshot["observers"]["call"]) == {"Versioning"}
+        assert snapshot["observers"]["call"]["Versioning"]["count"] == 2
+
+    def test_get_many_and_instance(self, make_registry):
+        """Test that get_many and get_instance record their gets like get."""
+        registry = make_registry()
+        registry.enable_metrics()
+        registry.register_prebuilt(key="model", obj=Pattern)
+        registry.get_many(["model", ("model", {})])
+        with pytest.raises(RegistrationError):
+            registry.get_many(["model", "missing"])
+        registry.get_instance("model")
+        with pytest.raises(RegistrationError):
+            registry.get_instance("missing")
+
+        snapshot = registry.metrics_snapshot()
+        assert snapshot["gets"] == {"model": 4, "missing": 2}
+        assert snapshot["outcomes"] == {"hit": 4, "miss": 2, "default": 0}
+        assert snapshot["call_latency"]["count"] == 6
+
+    def test_sink(self, registry):
+        """Test forwarding the measurements to a sink."""
+        sink = ListSink()
+        registry.enable_metrics(sink)
+        registry.register_prebuilt(key="model", obj=Pattern, version="1.0.0", date="2026-01-01")
+        registry.get("model", version="1.0.0", date="2026-01-01")
+        metrics = [(name, metric) for name, metric, _, _ in sink.records]
+        assert ("MetricsRegistry", "call_event") in metrics
+        assert ("MetricsRegistry", "get") in metrics
+        assert ("MetricsRegistry", "observer") in metrics
+
+    def test_disabled(self, registry, make_registry, monkeypatch):
+        """Test that disabled metrics are not measured."""
+        with pytest.raises(RegistrationError):
+            make_registry().metrics_snapshot()
+
+        def fail():
+            raise AssertionError("timer called while metrics are disabled")
+
+        registry.disable_metrics()
+        monkeypatch.setattr(mediator, "perf_counter", fail)
+        monkeypatch.setattr(facade, "perf_counter", fail)
+        registry.register_prebuilt(key="model", obj=Pattern, version="1.0.0", date="2026-01-01")
+        assert registry.get("model", version="1.0.0", date="2026-01-01") is Pattern
+
+    def test_histogram(self):
+        """Test the buckets and quantiles of the latency histogram."""
+        histogram = LatencyHistogram(buckets=(0.001, 0.01, 0.1))
+        for seconds in (0.0005, 0.0005, 0.005, 0.5):
+            histogram.add(seconds)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["buckets"] == {"le_0.001": 2, "le_0.01": 1, "le_0.1": 0}
+        assert snapshot["overflow"] == 1
+        assert histogram.quantile(0.5) == 0.001
+        assert histogram.quantile(1.0) == 0.5
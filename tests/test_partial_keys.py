@@ -0,0 +1,113 @@
+"""Test cases for partial key dict lookups.
+Author: PeterHartog
+"""
+from dataclasses import dataclass
+
+import pytest
+
+from registry_factory.checks.versioning import Versioning
+from registry_factory.factory import Factory
+from registry_factory.utils import AmbiguousKeyError, RegistrationError, RegistrationWarning
+
+
+@dataclass
+class EnvironmentFields:
+    """Versioned fields with an environment."""
+
+    version: str
+    environment: str
+
+
+class TestPartialKeys:
+    """Test cases for partial matches over key parameters."""
+
+    @staticmethod
+    def create_registry(partial_keys=True):
+        """Create a registry with two key parameters."""
+        Registry = Factory.create_registry(
+            shared=False,
+            checks=[Versioning(EnvironmentFields, key_list=["version", "environment"])],
+            partial_keys=partial_keys,
+        )
+        Registry.register_prebuilt("prod-1", "encoder", version="1", environment="prod")
+        Registry.register_prebuilt("prod-2", "encoder", version="2", environment="prod")
+        Registry.register_prebuilt("test-2", "encoder", version="2", environment="test")
+        Registry.register_prebuilt("decoder", "decoder", version="1", environment="prod")
+        return Registry
+
+    def test_variants(self):
+        """Test listing the variants of a key."""
+        Registry = self.create_registry()
+
+        assert len(Registry.variants("encoder")) == 3
+        assert sorted(key_dict["version"] for _, key_dict in Registry.variants("encoder", environment="prod")) == [
+            "1",
+            "2",
+        ]
+        assert Registry.variants("encoder", environment="staging") == []
+
+    def test_partial_get(self):
+        """Test resolving a unique partial match."""
+        Registry = self.create_registry()
+
+        assert Registry.get("encoder", environment="test", version="2") == "test-2"
+        assert Registry.get("encoder", environment="test") == "test-2"
+        assert Registry.get("encoder", version="1") == "prod-1"
+
+    def test_ambiguous_get(self):
+        """Test that several partial matches raise an ambiguity error."""
+        Registry = self.create_registry()
+
+        with pytest.raises(AmbiguousKeyError) as e:
+            Registry.get("encoder", environment="prod")
+        assert "prod" in str(e.value)
+
+    def test_ambiguous_get_default(self):
+        """Test that an ambiguous partial match returns the default."""
+        Registry = self.create_registry()
+
+        with pytest.warns(RegistrationWarning, match="matches several entries"):
+            assert Registry.get("encoder", default="default", environment="prod") == "default"
+
+    def test_empty_key_dict(self):
+        """Test that a lookup without key parameters does not match partially."""
+        Registry = self.create_registry()
+
+        with pytest.raises(RegistrationError):
+            Registry.get("decoder")
+        with pytest.raises(KeyError):
+            Registry.get_info("decoder")
+
+    def test_partial_keys_opt_in(self):
+        """Test that partial matches are off unless the registry enables them."""
+        Registry = self.create_registry(partial_keys=False)
+
+        with pytest.raises(RegistrationError):
+            Registry.get("encoder", environment="test")
+        assert Registry.get("encoder", version="latest", environment="test") == "test-2"
+        assert len(Registry.variants("encoder", environment="prod")) == 2
+
+    def test_latest_requires_key_parameters(self):
+        """Test that version specifiers do not ignore the key parameters left out, unless partial."""
+        Registry = self.create_registry(partial_keys=False)
+
+        with pytest.raises(RegistrationError):
+            Registry.get("encoder", version="latest")
+
+        Registry = self.create_registry()
+        with pytest.raises(AmbiguousKeyError, match="matches several entries"):
+            Registry.get("encoder", version="latest")
+        assert Registry.get("encoder", version="<2") == "prod-1"
+
+    def test_no_match(self):
+        """Test a partial key without matches."""
+        Registry = self.create_registry()
+
+        with pytest.raises(RegistrationError):
+            Registry.get("encoder", environment="staging")
+
+    def test_latest_with_partial_key(self):
+        """Test the latest version among partial matches."""
+        Registry = self.create_registry()
+
+        assert Registry.get("encoder", version="latest", environment="prod") == "prod-2"
@@ -0,0 +1,66 @@
+"""Test cases for pickling registries by reference.
+Author: PeterHartog
+"""
+import pickle
+import sys
+
+import pytest
+
+from registry_factory.factory import Factory
+from registry_factory.lazy import LazyObject
+from registry_factory.parallel import RegistryProcessPoolExecutor
+
+
+class PicklingFactory(Factory):
+    """Importable factory."""
+
+    TestRegistry = Factory.create_registry(shared=False)
+    SharedRegistry = Factory.create_registry(shared=True)
+
+
+PicklingFactory.TestRegistry.register_lazy("plugin", "tests.lazy_plugin:Plugin")
+
+
+def resolved_in_worker(registry) -> bool:
+    """Return whether the plugin was already imported by the worker initializer."""
+    hash_value = registry.mediator.hash_table.get_hash("plugin", {})
+    return not isinstance(registry.mediator.hash_table.data[hash_value], LazyObject)
+
+
+def plugin_name(registry) -> str:
+    """Return the name of the registered plugin."""
+    return registry.get("plugin").__name__
+
+
+class TestPickling:
+    """Test cases for pickling registries."""
+
+    def test_pickle_reference(self):
+        """Test that a registry pickles as a small reference."""
+        dumped = pickle.dumps(PicklingFactory.TestRegistry)
+
+        assert pickle.loads(dumped) is PicklingFactory.TestRegistry
+        assert pickle.loads(pickle.dumps(PicklingFactory.SharedRegistry)) is PicklingFactory.SharedRegistry
+        assert len(dumped) < 200
+
+    def test_pickle_in_task(self):
+        """Test that a structure referencing a registry pickles."""
+        task = {"registry": PicklingFactory.TestRegistry, "key": "plugin"}
+
+        assert pickle.loads(pickle.dumps(task))["registry"] is PicklingFactory.TestRegistry
+
+    def test_local_factory(self):
+        """Test that registries of a local factory cannot be pickled."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(_TestFactory.TestRegistry)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Spawning workers is slow on Windows.")
+    def test_process_pool(self):
+        """Test the registry process pool pre-warming the workers."""
+        with RegistryProcessPoolExecutor({PicklingFactory.TestRegistry: ["plugin"]}, max_workers=2) as pool:
+            assert pool.submit(resolved_in_worker, PicklingFactory.TestRegistry).result()
+            assert list(pool.map(plugin_name, [PicklingFactory.TestRegistry] * 4)) == ["Plugin"] * 4
@@ -0,0 +1,68 @@
+"""Test cases for the registration profiler.
+Author: PeterHartog
+"""
+import time
+
+import pytest
+
+from registry_factory.checks.testing import Testing as _Testing
+from registry_factory.factory import Factory
+from registry_factory.patterns.mediator import HashMediator
+from registry_factory.profiler import RegistrationProfiler
+
+
+def slow_test_module(key, obj, **kwargs):
+    time.sleep(0.01)
+
+
+class Model:
+    pass
+
+
+class ProfiledFactory(Factory):
+    FastRegistry = Factory.create_registry(shared=False)
+    SlowRegistry = Factory.create_registry(shared=False, checks=[_Testing(test_module=slow_test_module)])
+
+
+class TestRegistrationProfiler:
+    """Test cases for RegistrationProfiler."""
+
+    def test_report(self):
+        """Test attributing registration time to registries, observers and modules."""
+        original = HashMediator.register_event
+        with RegistrationProfiler() as profiler:
+            ProfiledFactory.FastRegistry.register_prebuilt(key="fast", obj=Model)
+            time.sleep(0.02)  # stands in for importing the next plugin module
+            ProfiledFactory.SlowRegistry.register_prebuilt(key="slow", obj=Model)
+            ProfiledFactory.FastRegistry.register_lazy("lazy", "tests.lazy_plugin:Plugin")
+        assert HashMediator.register_event is original
+
+        assert [(record.registry, record.key) for record in profiler.records] == [
+            ("FastRegistry", "fast"),
+            ("SlowRegistry", "slow"),
+            ("FastRegistry", "lazy"),
+        ]
+        slow = profiler.records[1]
+        assert slow.module == __name__
+        assert slow.gap >= 0.02
+        assert slow.observers["Testing"] >= 0.01
+        assert profiler.records[2].module == "tests.lazy_plugin"
+
+        report = profiler.report()
+        assert report["registries"][0]["registry"] == "SlowRegistry"
+        assert report["registries"][0]["observers"]["Testing"] >= 0.01
+        assert report["modules"][0]["module"] == __name__
+        assert report["modules"][0]["count"] == 2
+        assert "SlowRegistry" in profiler.format_report()
+
+    def test_inactive(self):
+        """Test that registrations outside the profiler are not recorded."""
+        profiler = RegistrationProfiler()
+        ProfiledFactory.FastRegistry.register_prebuilt(key="unprofiled", obj=Model)
+        assert profiler.records == []
+
+    def test_single_active_profiler(self):
+        """Test that only one profiler can be active at a time."""
+        with RegistrationProfiler():
+            with pytest.raises(RuntimeError):
+                RegistrationProfiler().start()
@@ -0,0 +1,62 @@
+"""Test cases for querying Registry meta information.
+Author: PeterHartog
+"""
+import warnings
+
+from registry_factory.checks.accreditation import Accreditation
+from registry_factory.checks.testing import Testing
+from registry_factory.factory import Factory
+
+
+def name_test(key, obj, **kwargs):
+    """Test module passing objects named test."""
+    assert obj == "test"
+
+
+class TestQuery:
+    """Test cases for Registry.query."""
+
+    @staticmethod
+    def create_registry(indexes=None):
+        """Create a populated registry."""
+        Registry = Factory.create_registry(
+            shared=False, checks=[Accreditation(), Testing(name_test)], indexes=indexes
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            Registry.register_prebuilt("test", "a", author="x", credit_type="reference")
+            Registry.register_prebuilt("other", "b", author="x", credit_type="reference")
+            Registry.register_prebuilt("test", "c", author="y", credit_type="reference", github="y")
+            Registry.register_prebuilt("other", "d", author="y", credit_type="other")
+        return Registry
+
+    def test_query_scan(self):
+        """Test queries without indexes."""
+        Registry = self.create_registry()
+
+        assert Registry.query(author="x", passed_test=False) == [("b", {})]
+        assert sorted(Registry.query(author="y")) == [("c", {}), ("d", {})]
+        assert Registry.query(github="y") == [("c", {})]
+
+    def test_query_indexed(self):
+        """Test queries combining indexed and scanned fields."""
+        Registry = self.create_registry(indexes=["author", "passed_test"])
+
+        assert Registry.query(author="x", passed_test=False) == [("b", {})]
+        assert Registry.query(author="y", credit_type="other") == [("d", {})]
+        assert Registry.query(author="z") == []
+        assert sorted(Registry.query(author=lambda author: author in "xy", passed_test=True)) == [
+            ("a", {}),
+            ("c", {}),
+        ]
+
+    def test_index_maintenance(self):
+        """Test that indexes follow registrations, deletions and resets."""
+        Registry = self.create_registry()
+        Registry.add_index("author")
+        Registry.register_prebuilt("test", "e", author="x", credit_type="reference")
+        Registry.mediator.hash_table.delete("a", {})
+
+        assert sorted(Registry.query(author="x")) == [("b", {}), ("e", {})]
+        Registry.reset()
+        assert Registry.query(author="x") == []
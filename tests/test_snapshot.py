@@ -0,0 +1,118 @@
+"""Test cases for Registry snapshots.
+Author: PeterHartog
+"""
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from registry_factory.checks.accreditation import Accreditation
+from registry_factory.checks.factory_pattern import FactoryPattern
+from registry_factory.factory import Factory
+from registry_factory.utils import RegistrationError
+from tests import lazy_plugin
+
+
+class Pattern:
+    """Test pattern."""
+
+    def hello_world(self):
+        """Hello world."""
+
+
+class TestSnapshot:
+    """Test cases for dump_snapshot and load_snapshot."""
+
+    def test_round_trip(self, tmp_path, monkeypatch):
+        """Test that a loaded snapshot answers lookups before importing."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(
+                shared=False, checks=[Accreditation(key_list=["environment"]), FactoryPattern(Pattern)]
+            )
+
+        class _WarmFactory(Factory):
+            TestRegistry = Factory.create_registry(
+                shared=False, checks=[Accreditation(key_list=["environment"]), FactoryPattern(Pattern)]
+            )
+
+        _TestFactory.TestRegistry.register_prebuilt(
+            lazy_plugin.Plugin, "plugin", environment="prod", author="me", credit_type="reference"
+        )
+        _TestFactory.TestRegistry.register_arguments("plugin", environment="prod")(
+            dataclass(lazy_plugin.PluginArguments)
+        )
+        path = str(tmp_path / "snapshot.json")
+        _TestFactory.TestRegistry.dump_snapshot(path)
+
+        monkeypatch.delitem(sys.modules, "tests.lazy_plugin")
+        assert _WarmFactory.TestRegistry.load_snapshot(path) == 1
+        assert _WarmFactory.TestRegistry.keys() == [("plugin", {"environment": "prod"})]
+        assert _WarmFactory.TestRegistry.check_choice("plugin", environment="prod")
+        info = _WarmFactory.TestRegistry.get_info("plugin", environment="prod")
+        assert info["author"] == "me" and info["correct_pattern"] is True
+        assert "tests.lazy_plugin" not in sys.modules
+
+        assert _WarmFactory.TestRegistry.get("plugin", environment="prod").__name__ == "Plugin"
+        assert _WarmFactory.TestRegistry.get_arguments("plugin", environment="prod").__name__ == "PluginArguments"
+
+    def test_lazy_entries(self, tmp_path):
+        """Test that unresolved lazy entries keep their deferred checks."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[FactoryPattern(Pattern, forced=True)])
+
+        class _WarmFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[FactoryPattern(Pattern, forced=True)])
+
+        _TestFactory.TestRegistry.register_lazy("wrong", "tests.lazy_plugin:WrongPlugin")
+        path = str(tmp_path / "snapshot.json")
+        _TestFactory.TestRegistry.dump_snapshot(path)
+        _WarmFactory.TestRegistry.load_snapshot(path)
+
+        with pytest.raises(RegistrationError):
+            _WarmFactory.TestRegistry.get("wrong")
+
+    def test_skip_existing(self, tmp_path):
+        """Test that loading keeps entries that already exist."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        _TestFactory.TestRegistry.register_prebuilt(lazy_plugin.Plugin, "plugin")
+        path = str(tmp_path / "snapshot.json")
+        _TestFactory.TestRegistry.dump_snapshot(path)
+
+        assert _TestFactory.TestRegistry.load_snapshot(path) == 0
+
+    def test_local_object(self, tmp_path):
+        """Test that objects without an import path cannot be snapshotted."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False)
+
+        @_TestFactory.TestRegistry.register("local")
+        def local():
+            pass
+
+        with pytest.raises(RegistrationError):
+            _TestFactory.TestRegistry.dump_snapshot(str(tmp_path / "snapshot.json"))
+
+    def test_tuple_key_values(self, tmp_path):
+        """Test that tuple key values are still tuples after a round trip."""
+
+        class _TestFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[Accreditation(key_list=["shape"])])
+
+        class _WarmFactory(Factory):
+            TestRegistry = Factory.create_registry(shared=False, checks=[Accreditation(key_list=["shape"])])
+
+        _TestFactory.TestRegistry.register_prebuilt(
+            lazy_plugin.Plugin, "plugin", shape=(3, [1, (2,)]), author="me", credit_type="reference"
+        )
+        path = str(tmp_path / "snapshot.json")
+        _TestFactory.TestRegistry.dump_snapshot(path)
+
+        assert _WarmFactory.TestRegistry.load_snapshot(path) == 1
+        assert _WarmFactory.TestRegistry.keys() == [("plugin", {"shape": (3, [1, (2,)])})]
+        assert _WarmFactory.TestRegistry.get("plugin", shape=(3, [1, (2,)])).__name__ == "Plugin"
@@ -0,0 +1,160 @@
+"""Test cases for the call tracker.
+Author: PeterHartog
+"""
+import csv
+import gc
+import json
+import threading
+
+import pytest
+
+from registry_factory.checks.accreditation import Accreditation
+from registry_factory.factory import Factory
+from registry_factory.tracker import Tracker
+
+
+class TrackerFactory(Factory):
+    CreditRegistry = Factory.create_registry(
+        shared=False, checks=[Accreditation(key_list=["environment"], call_validation="register")]
+    )
+    PlainRegistry = Factory.create_registry(shared=False)
+
+
+CreditRegistry = TrackerFactory.CreditRegistry
+CreditRegistry.register_prebuilt(key="model", obj=1, environment="cpu", author="Jane Doe", credit_type="reference")
+CreditRegistry.register_prebuilt(key="model", obj=2, environment="gpu", author="Jane Doe", credit_type="reference")
+TrackerFactory.PlainRegistry.register_prebuilt(key="plain", obj=3)
+
+
+class TestTracker:
+    """Test cases for Tracker."""
+
+    @pytest.fixture(autouse=True)
+    def tracker(self):
+        tracker = Tracker(enabled=True)
+        tracker.clear()
+        yield tracker
+        tracker.configure(capacity=4096, sample_every=1, enabled=False)
+        tracker.clear()
+
+    def _get(self, environment: str) -> None:
+        CreditRegistry.get("model", environment=environment)
+
+    def test_counts(self, tracker):
+        """Test counting the calls per registry, key and key dict."""
+        for _ in range(3):
+            self._get("cpu")
+        self._get("gpu")
+        TrackerFactory.PlainRegistry.get("plain")
+        assert tracker.get() == [
+            (CreditRegistry, "model", {"environment": "cpu"}, 3),
+            (CreditRegistry, "model", {"environment": "gpu"}, 1),
+            (TrackerFactory.PlainRegistry, "plain", {}, 1),
+        ]
+
+    def test_ring_buffer_is_bounded(self, tracker):
+        """Test that the ring buffer keeps only the most recent calls while counting all."""
+        tracker.configure(capacity=2)
+        for environment in ("cpu", "gpu", "cpu"):
+            self._get(environment)
+        assert [record[3] for record in tracker.get_recent()] == [{"environment": "gpu"}, {"environment": "cpu"}]
+        assert sum(record[3] for record in tracker.get()) == 3
+
+    def test_sampling(self, tracker):
+        """Test that sampled calls count for the calls they stand in for."""
+        tracker.configure(sample_every=4)
+        for _ in range(8):
+            TrackerFactory.PlainRegistry.get("plain")
+        assert tracker.get() == [(TrackerFactory.PlainRegistry, "plain", {}, 8)]
+        assert len(tracker.get_recent()) == 2
+
+    def test_disabled(self, tracker):
+        """Test that calls are not tracked when disabled."""
+        tracker.configure(enabled=False)
+        TrackerFactory.PlainRegistry.get("plain")
+        assert tracker.get() == []
+
+    def test_opt_in(self):
+        """Test that a new tracker is disabled."""
+        class _FreshTracker(Tracker):
+            _instance = None
+
+        assert _FreshTracker().enabled is False
+
+    def test_constructor_arguments(self, tracker):
+        """Test that constructor arguments configure the existing tracker."""
+        assert Tracker(capacity=10, sample_every=2) is tracker
+        assert tracker.recent.maxlen == 10
+        assert tracker.sample_every == 2
+        assert tracker.enabled is True
+
+    def test_get_many(self, tracker):
+        """Test tracking the requests of get_many."""
+        TrackerFactory.PlainRegistry.get_many(["plain", ("plain", {})])
+        CreditRegistry.get_many([("model", {"environment": "gpu"})])
+        assert tracker.get() == [
+            (TrackerFactory.PlainRegistry, "plain", {}, 2),
+            (CreditRegistry, "model", {"environment": "gpu"}, 1),
+        ]
+
+    def test_registries_are_not_kept_alive(self, tracker):
+        """Test that tracking a registry does not keep it alive."""
+        class _TemporaryFactory(Factory):
+            TemporaryRegistry = Factory.create_registry(shared=False)
+
+        _TemporaryFactory.TemporaryRegistry.register_prebuilt(key="temporary", obj=4)
+        _TemporaryFactory.TemporaryRegistry.get("temporary")
+        assert len(tracker.get()) == 1
+        del _TemporaryFactory
+        gc.collect()
+        assert tracker.get() == []
+        assert tracker.get_recent() == []
+
+    def test_threads(self, tracker):
+        """Test that no calls are lost when tracking from several threads."""
+        threads = [
+            threading.Thread(target=lambda: [TrackerFactory.PlainRegistry.get("plain") for _ in range(500)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert tracker.get()[0][3] == 2000
+
+    def test_export(self, tracker, tmp_path):
+        """Test exporting the tracked calls to JSON and CSV."""
+        self._get("cpu")
+        tracker.export_json(str(tmp_path / "calls-{pid}.json"))
+        tracker.export_csv(str(tmp_path / "calls.csv"))
+        (json_path,) = tmp_path.glob("calls-*.json")
+        assert json.loads(json_path.read_text()) == [
+            {
+                "registry": "TrackerFactory.CreditRegistry",
+                "key": "model",
+                "key_dict": {"environment": "cpu"},
+                "count": 1,
+            }
+        ]
+        with open(tmp_path / "calls.csv") as f:
+            rows = list(csv.DictReader(f))
+        assert rows == [
+            {
+                "registry": "TrackerFactory.CreditRegistry",
+                "key": "model",
+                "key_dict": '{"environment": "cpu"}',
+                "count": "1",
+            }
+        ]
+
+    def test_view_called(self, capsys):
+        """Test the report of the called modules with their meta information."""
+        self._get("gpu")
+        report = TrackerFactory.called_report()
+        assert len(report) == 1
+        assert report[0]["registry"] == "CreditRegistry"
+        assert report[0]["meta"]["author"] == "Jane Doe"
+        TrackerFactory.view_called()
+        output = capsys.readouterr().out
+        assert "CreditRegistry: model {'environment': 'gpu'} (1 calls)" in output
+        assert "author: Jane Doe" in output
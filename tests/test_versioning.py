@@ -5,8 +5,9 @@ from dataclasses import dataclass
 
 import pytest
 
-from registry_factory.checks.versioning import Versioning
+from registry_factory.checks.versioning import Versioning, parse_version
 from registry_factory.factory import Factory
+from registry_factory.utils import RegistrationError
 
 
 class TestVersioning:
@@ -116,3 +117,101 @@ class TestVersioning:
             pass
 
         assert Registry.get_info("test10", version="0.0.1")["environment"] == "test"
+
+    def test_parse_version(self):
+        """Test the semantic version ordering."""
+        ordered = ["0.9", "1.0.0rc1", "1.0", "1.0.1", "1.2", "1.10", "2.0.0"]
+
+        assert sorted(reversed(ordered), key=parse_version) == ordered
+        assert parse_version("1.0") == parse_version("1.0.0")
+
+    def test_parse_version_pep440(self):
+        """Test the PEP 440 ordering of development, pre-, post- and local releases."""
+        ordered = ["1.0.dev1", "1.0a1.dev1", "1.0a1", "1.0b2", "1.0rc1", "1.0", "1.0+local", "1.0.post1.dev1"]
+
+        assert sorted(reversed(ordered), key=parse_version) == ordered
+        assert sorted(["1.0a1", "1.0", "1.0.dev1"], key=parse_version) == ["1.0.dev1", "1.0a1", "1.0"]
+        assert parse_version("1.0RC1") == parse_version("1.0rc1")
+        assert parse_version("2.0.0rc1").is_prerelease and not parse_version("2.0").is_prerelease
+
+    def test_latest_version(self):
+        """Test resolving the latest version."""
+        Registry = Factory.create_registry(shared=False, checks=[Versioning(forced=False)])
+        for version in ["1.2.0", "1.10.0", "1.9.3", "2.0.0rc1"]:
+            Registry.register_prebuilt(version, "model", version=version, date="2020-01-01")
+
+        assert Registry.versions("model") == ["1.2.0", "1.9.3", "1.10.0", "2.0.0rc1"]
+        assert Registry.get("model", version="latest", date="2020-01-01") == "1.10.0"
+        assert Registry.get_info("model", version="latest")["date"] == "2020-01-01"
+
+    def test_latest_key_dict(self):
+        """Test that a version specifier resolves to the key dict of the registered version."""
+        for call_validation in ("always", "register"):
+            Registry = Factory.create_registry(
+                shared=False, checks=[Versioning(forced=False, call_validation=call_validation)]
+            )
+            for version in ["1.0", "2.0"]:
+                Registry.register_prebuilt(version, "model", version=version, date="2020-01-01")
+
+            assert Registry.mediator.call_event("model", version="latest", date="2020-01-01")[1] == {"version": "2.0"}
+
+    def test_latest_only_prereleases(self):
+        """Test that latest falls back to pre-releases when there is no final release."""
+        Registry = Factory.create_registry(shared=False, checks=[Versioning(forced=False)])
+        for version in ["2.0.0a1", "2.0.0rc1"]:
+            Registry.register_prebuilt(version, "model", version=version, date="2020-01-01")
+
+        assert Registry.get("model", version="latest", date="2020-01-01") == "2.0.0rc1"
+
+    def test_version_range(self):
+        """Test resolving a version range."""
+        Registry = Factory.create_registry(shared=False, checks=[Versioning(forced=False)])
+        for version in ["1.1", "1.2", "1.5", "2.0", "2.1"]:
+            Registry.register_prebuilt(version, "model", version=version, date="2020-01-01")
+
+        assert Registry.get("model", version=">=1.2,<2", date="2020-01-01") == "1.5"
+        assert Registry.get("model", version="<=2.0,!=2.0", date="2020-01-01") == "1.5"
+        assert Registry.get("model", version="==1.2.0", date="2020-01-01") == "1.2"
+        with pytest.raises(RegistrationError):
+            Registry.get("model", version=">3", date="2020-01-01")
+
+    def test_version_range_prereleases(self):
+        """Test that ranges skip pre-releases unless the specifier names one."""
+        Registry = Factory.create_registry(shared=False, checks=[Versioning(forced=False)])
+        for version in ["1.2", "1.5", "2.0.0rc1", "2.0", "2.0.post1", "2.1.dev3"]:
+            Registry.register_prebuilt(version, "model", version=version, date="2020-01-01")
+
+        assert Registry.get("model", version=">=1.2,<2", date="2020-01-01") == "1.5"
+        assert Registry.get("model", version=">=1.2,<2.1", date="2020-01-01") == "2.0.post1"
+        assert Registry.get("model", version=">=1.2,<2.0.0rc2", date="2020-01-01") == "2.0.0rc1"
+        assert Registry.get("model", version=">1.5,<=2.0", date="2020-01-01") == "2.0"
+        assert Registry.get("model", version=">2.0", date="2020-01-01") == "2.1.dev3"
+        assert Registry.get("model", version=">=2.1.dev1", date="2020-01-01") == "2.1.dev3"
+
+    def test_version_other_key_parameters(self):
+        """Test that other key parameters still have to match."""
+
+        @dataclass
+        class CustomFields:
+            """Custom fields."""
+
+            version: str
+            environment: str
+
+        Registry = Factory.create_registry(
+            shared=False, checks=[Versioning(CustomFields, key_list=["version", "environment"])]
+        )
+        Registry.register_prebuilt("prod-1", "model", version="1", environment="prod")
+        Registry.register_prebuilt("test-2", "model", version="2", environment="test")
+
+        assert Registry.get("model", version="latest", environment="prod") == "prod-1"
+
+    def test_version_index_delete(self):
+        """Test that deleting keeps the version index in sync."""
+        Registry = Factory.create_registry(shared=False, checks=[Versioning(forced=False)])
+        Registry.register_prebuilt("1", "model", version="1", date="2020-01-01")
+        Registry.register_prebuilt("2", "model", version="2", date="2020-01-01")
+        Registry.mediator.hash_table.delete("model", {"version": "2"})
+
+        assert Registry.versions("model") == ["1"]
+        assert Registry.get("model", version="latest", date="2020-01-01") == "1"